@@ -0,0 +1,64 @@
+"""
+Benchmark the HTML-to-Markdown conversion engines on built documentation sites.
+
+Usage:
+    python benchmarks/html_to_md_engines.py SITE_DIR [SITE_DIR ...] [--engines html2text bs4] [--repeat 3]
+
+SITE_DIR is the output of a documentation build, e.g. a Sphinx `_build/html`
+or a Docusaurus `build` directory. Every engine converts every page in-process
+(no worker pool, no conversion cache) and the best of `--repeat` runs is reported.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docsforai.converter.html_to_md import html_to_md, SUPPORTED_ENGINES
+from docsforai.utils import walk_files
+
+def load_pages(site_dir: Path) -> List[str]:
+    """Read every HTML page of a built site."""
+    pages = []
+    for html_file in walk_files(site_dir, ['.html'], respect_gitignore=False):
+        pages.append(html_file.read_text(encoding='utf-8', errors='replace'))
+    return pages
+
+def time_engine(pages: List[str], engine: str, repeat: int) -> float:
+    """Return the best wall time, in seconds, to convert all pages with `engine`."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            html_to_md(page, engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('sites', nargs='+', type=Path, help='Directories containing built HTML')
+    parser.add_argument('--engines', nargs='+', default=SUPPORTED_ENGINES, choices=SUPPORTED_ENGINES)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for site_dir in args.sites:
+        pages = load_pages(site_dir)
+        size_mb = sum(len(page.encode('utf-8')) for page in pages) / (1024 * 1024)
+        print(f"{site_dir}: {len(pages)} pages, {size_mb:.1f} MB")
+        if not pages:
+            continue
+
+        timings: Dict[str, float] = {}
+        for engine in args.engines:
+            timings[engine] = time_engine(pages, engine, args.repeat)
+            per_page = 1000 * timings[engine] / len(pages)
+            print(f"  {engine:<10} {timings[engine]:8.2f} s  {per_page:7.2f} ms/page  {len(pages) / timings[engine]:8.1f} pages/s")
+
+        if 'bs4' in timings and 'html2text' in timings:
+            print(f"  speedup of html2text over bs4: {timings['bs4'] / timings['html2text']:.2f}x")
+
+if __name__ == '__main__':
+    main()
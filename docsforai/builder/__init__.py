@@ -5,13 +5,17 @@ This module is responsible for building documentation from source repositories.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-
-from .detector import detect_framework
-from .parser import parse_documentation
-from .consolidator import consolidate_documentation
-from ..utils import clone_repository, create_directory, cleanup_directory, run_subprocess_with_logging
+from typing import Dict, Any, Optional, List, Tuple
+
+from .detector import detect_framework, DetectionCache
+from .parser import parse_documentation, iter_documentation
+from .consolidator import consolidate_documentation, write_consolidated_documentation
+from .monorepo import find_doc_roots, resolve_doc_roots, parse_doc_roots
+from .sphinx_runner import configure_sphinx_runner
+from ..utils import clone_repository, create_directory, cleanup_directory, run_subprocess_with_logging, configure_discovery, configure_cache
+from ..utils.git_handler import get_commit_sha
 from ..utils.dependency_manager import check_dependencies, get_installation_instructions
 
 logger = logging.getLogger(__name__)
@@ -56,18 +60,55 @@ def build_documentation(config: Dict[str, Any], git_args: Optional[List[str]] =
             if not docs_dir.exists():
                 raise ValueError(f"Documentation directory not found: {docs_dir}")
 
+            configure_discovery(
+                exclude_dirs=config['docs'].get('exclude_dirs'),
+                respect_gitignore=config['docs'].get('respect_gitignore', True)
+            )
+
+            advanced = config.get('advanced', {})
+            configure_cache(advanced.get('cache_dir'), advanced.get('cache', True))
+
+            # Imported here so that importing the builder does not load BeautifulSoup/html2text
+            from ..converter.html_to_md import configure_conversion
+            conversion = config.get('conversion', {})
+            configure_conversion(
+                workers=conversion.get('workers') or advanced.get('max_workers'),
+                chunksize=conversion.get('chunksize'),
+                cache=conversion.get('cache', True),
+                cache_max_bytes=conversion.get('cache_max_mb', 512) * 1024 * 1024,
+                engine=conversion.get('engine', 'html2text'),
+                extract_main_content=conversion.get('extract_main_content', True),
+                content_selectors=conversion.get('content_selectors')
+            )
+
+            doc_roots = None
             framework = config['docs']['framework']
-            if framework == 'auto':
-                framework = detect_framework(docs_dir)
-                logger.info(f"Detected documentation framework: {framework}")
-
-            missing_deps = check_dependencies(framework)
-            if missing_deps:
-                instructions = get_installation_instructions(missing_deps)
-                raise ValueError(
-                    f"Missing dependencies for {framework}: {', '.join(missing_deps)}\n"
-                    f"Installation instructions:\n" + '\n'.join(instructions)
-                )
+            sphinx_builds = 1
+            if config['docs'].get('mode') == 'monorepo':
+                doc_roots = _resolve_monorepo_roots(config, repo_dir, docs_dir)
+                if not doc_roots:
+                    raise ValueError(f"No documentation roots found in {docs_dir}")
+                frameworks = list(dict.fromkeys(root_framework for _, root_framework in doc_roots))
+                # Roots are parsed in parallel; their Sphinx builds share the CPU budget
+                root_workers = advanced.get('max_workers') or min(len(doc_roots), os.cpu_count() or 1)
+                sphinx_roots = sum(1 for _, root_framework in doc_roots if root_framework == 'sphinx')
+                sphinx_builds = max(1, min(sphinx_roots, root_workers))
+            else:
+                if framework == 'auto':
+                    framework = _detect_framework_cached(config, repo_dir, docs_dir)
+                    logger.info(f"Detected documentation framework: {framework}")
+                frameworks = [framework]
+
+            configure_sphinx_runner(advanced.get('max_workers'), sphinx_builds)
+
+            for required_framework in frameworks:
+                missing_deps = check_dependencies(required_framework)
+                if missing_deps:
+                    instructions = get_installation_instructions(missing_deps)
+                    raise ValueError(
+                        f"Missing dependencies for {required_framework}: {', '.join(missing_deps)}\n"
+                        f"Installation instructions:\n" + '\n'.join(instructions)
+                    )
 
             # Install additional pip dependencies if specified
             pip_dependencies = config.get('build', {}).get('pip_dependencies', [])
@@ -88,17 +129,25 @@ def build_documentation(config: Dict[str, Any], git_args: Optional[List[str]] =
             else:
                 logger.debug("No build_args found in config")
 
-            parsed_docs = parse_documentation(docs_dir, framework, build_args)
+            if doc_roots is not None:
+                parsed_docs = parse_doc_roots(
+                    repo_dir,
+                    doc_roots,
+                    build_args,
+                    max_workers=advanced.get('max_workers'),
+                    ignore_errors=advanced.get('ignore_errors', False)
+                )
+            else:
+                # Stream documents from the parser straight into the output file
+                parsed_docs = iter_documentation(docs_dir, framework, build_args)
             output_file = output_dir / config['output']['filename']
-            consolidated_content = consolidate_documentation(
+            write_consolidated_documentation(
                 parsed_docs,
                 config['consolidation'],
-                config['metadata']
+                config['metadata'],
+                output_file
             )
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(consolidated_content)
-
             logger.info(f"Documentation built successfully: {output_file}")
             return str(output_file)
 
@@ -107,4 +156,85 @@ def build_documentation(config: Dict[str, Any], git_args: Optional[List[str]] =
 
     except Exception as e:
         logger.error(f"Failed to build documentation: {str(e)}")
-        raise ValueError(f"Failed to build documentation: {str(e)}") from e
\ No newline at end of file
+        raise ValueError(f"Failed to build documentation: {str(e)}") from e
+
+def _detect_framework_cached(config: Dict[str, Any], repo_dir: Path, docs_dir: Path) -> str:
+    """
+    Detect the framework of `docs_dir`, reusing a cached result when possible.
+
+    Results are cached per repository URL, commit SHA, docs path and detector
+    version, so rebuilding an unchanged commit skips detection entirely.
+
+    Args:
+        config (Dict[str, Any]): Configuration dictionary.
+        repo_dir (Path): Path to the cloned repository.
+        docs_dir (Path): Path to the documentation directory.
+
+    Returns:
+        str: The detected framework name.
+    """
+    docs_config = config['docs']
+    docs_path = docs_dir.relative_to(repo_dir).as_posix()
+    byte_budgets = docs_config.get('detection_byte_budgets')
+    max_workers = config.get('advanced', {}).get('max_workers')
+
+    commit_sha = get_commit_sha(repo_dir)
+    if commit_sha is None:
+        logger.debug("No commit SHA available, detection cache not used")
+        return detect_framework(docs_dir, byte_budgets, max_workers)
+
+    cache = DetectionCache()
+    key = cache.make_key(
+        config['source']['url'],
+        commit_sha,
+        docs_path,
+        {
+            'detection_byte_budgets': byte_budgets or {},
+            'exclude_dirs': docs_config.get('exclude_dirs') or [],
+            'respect_gitignore': docs_config.get('respect_gitignore', True)
+        }
+    )
+    framework = cache.get(key)
+    if framework is None:
+        framework = detect_framework(docs_dir, byte_budgets, max_workers)
+        cache.put(key, framework, url=config['source']['url'], commit=commit_sha, path=docs_path)
+    else:
+        logger.debug(f"Using cached detection result for commit {commit_sha}")
+    logger.info(f"Detection cache: {cache.summary()}")
+    return framework
+
+def _resolve_monorepo_roots(config: Dict[str, Any], repo_dir: Path, docs_dir: Path) -> List[Tuple[Path, str]]:
+    """
+    Determine the documentation roots of a monorepo and their frameworks.
+
+    Roots are taken from `docs.roots` when given, and discovered from marker
+    files below `docs_dir` otherwise. Each root is detected separately (using
+    the detection cache) unless `docs.framework` forces a framework.
+
+    Args:
+        config (Dict[str, Any]): Configuration dictionary.
+        repo_dir (Path): Path to the cloned repository.
+        docs_dir (Path): Directory to search for documentation roots.
+
+    Returns:
+        List[Tuple[Path, str]]: (root, framework) pairs in path order.
+
+    Raises:
+        ValueError: If a configured root does not exist.
+    """
+    docs_config = config['docs']
+    explicit_roots = docs_config.get('roots') or []
+    if explicit_roots:
+        candidates = []
+        for root in explicit_roots:
+            root_dir = docs_dir / root
+            if not root_dir.exists():
+                raise ValueError(f"Documentation root not found: {root_dir}")
+            candidates.append(root_dir)
+    else:
+        candidates = find_doc_roots(docs_dir, docs_config.get('max_root_depth', 3))
+
+    framework = docs_config['framework']
+    if framework != 'auto':
+        return [(root, framework) for root in candidates]
+    return resolve_doc_roots(candidates, lambda root: _detect_framework_cached(config, repo_dir, root))
@@ -0,0 +1,164 @@
+"""
+Cross-page boilerplate removal for DocsForAI.
+
+Generated sites repeat the same blocks on many pages: "Edit this page" links,
+version banners, cookie notices, stock admonitions. This module splits each
+document into Markdown blocks (paragraphs, lists, fenced code), hashes them,
+and counts on how many pages each block occurs. Blocks found on more than a
+configurable fraction of the pages are dropped when the consolidated output
+is written. Removal changes the output of existing configurations, so it is
+only enabled by setting `consolidation.boilerplate_threshold`.
+
+Counting is a single pass over the documents as they stream through the
+consolidator. Memory is bounded by tracking at most `max_tracked` block hashes
+with the Misra-Gries frequent-items algorithm: every block that occurs on more
+than 1/max_tracked of all counted block occurrences is guaranteed to stay
+tracked, and tracked counts never overestimate, so a block is only dropped if it really is
+that frequent.
+"""
+
+import hashlib
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_MIN_PAGES = 20
+
+# Blocks shorter than this (after whitespace normalization) are never dropped:
+# separators, single words and short list items are too generic to be boilerplate.
+MIN_BLOCK_CHARS = 20
+
+# Upper bound on the number of distinct block hashes tracked at a time.
+MAX_TRACKED_BLOCKS = 100000
+
+_BLANK_LINE_RE = re.compile(r'(\n[ \t]*\n\s*)')
+_FENCE_RE = re.compile(r'^[ \t]*(```|~~~)', re.MULTILINE)
+
+def split_blocks(content: str) -> List[Tuple[str, str]]:
+    """
+    Split Markdown into blocks separated by blank lines.
+
+    Fenced code blocks are kept whole even if they contain blank lines.
+
+    Args:
+        content (str): Markdown content.
+
+    Returns:
+        List[Tuple[str, str]]: (block, separator) pairs; joining them yields `content`.
+    """
+    parts = _BLANK_LINE_RE.split(content)
+    blocks: List[Tuple[str, str]] = []
+    pending = ''
+    for index in range(0, len(parts), 2):
+        block = pending + parts[index]
+        separator = parts[index + 1] if index + 1 < len(parts) else ''
+        if separator and ('```' in block or '~~~' in block) and len(_FENCE_RE.findall(block)) % 2:
+            # Inside an unterminated code fence: the blank line belongs to the block
+            pending = block + separator
+            continue
+        pending = ''
+        blocks.append((block, separator))
+    if pending:
+        blocks.append((pending, ''))
+    return blocks
+
+def _block_hash(block: str) -> Optional[bytes]:
+    """Return the hash of a block, or None if the block is never treated as boilerplate."""
+    stripped = block.strip()
+    if stripped.startswith('#') or stripped == '---':
+        return None
+    normalized = ' '.join(stripped.split())
+    if len(normalized) < MIN_BLOCK_CHARS:
+        return None
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+
+class BoilerplateFilter:
+    """
+    Detects blocks repeated across many pages and removes them from documents.
+
+    Call add() for every document, then filter() to strip the detected
+    boilerplate from a document.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_pages: int = DEFAULT_MIN_PAGES,
+        max_tracked: int = MAX_TRACKED_BLOCKS
+    ):
+        """
+        Args:
+            threshold (float): Fraction of pages a block must occur on to be dropped.
+            min_pages (int): Minimum number of pages before any block is dropped.
+            max_tracked (int): Maximum number of distinct block hashes kept in memory.
+        """
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.max_tracked = max_tracked
+        self.pages = 0
+        self.dropped = 0
+        self._counts: Dict[bytes, int] = {}
+        self._boilerplate: Optional[set] = None
+
+    def add(self, content: str) -> None:
+        """
+        Count the blocks of one page.
+
+        Args:
+            content (str): Markdown content of the page.
+        """
+        self.pages += 1
+        hashes = {_block_hash(block) for block, _ in split_blocks(content)}
+        hashes.discard(None)
+        counts = self._counts
+        for digest in hashes:
+            if digest in counts:
+                counts[digest] += 1
+            elif len(counts) < self.max_tracked:
+                counts[digest] = 1
+            else:
+                # Misra-Gries: decrement every counter and forget the ones reaching zero
+                for key in list(counts):
+                    counts[key] -= 1
+                    if not counts[key]:
+                        del counts[key]
+        self._boilerplate = None
+
+    @property
+    def boilerplate(self) -> set:
+        """Hashes of the blocks occurring on more than `threshold` of the pages."""
+        if self._boilerplate is None:
+            if self.pages < self.min_pages:
+                self._boilerplate = set()
+            else:
+                limit = self.threshold * self.pages
+                self._boilerplate = {digest for digest, count in self._counts.items() if count > limit}
+                logger.info(f"Found {len(self._boilerplate)} boilerplate blocks across {self.pages} pages")
+        return self._boilerplate
+
+    def filter(self, content: str) -> str:
+        """
+        Remove boilerplate blocks from a page.
+
+        Args:
+            content (str): Markdown content of the page.
+
+        Returns:
+            str: The content without boilerplate blocks.
+        """
+        boilerplate = self.boilerplate
+        if not boilerplate:
+            return content
+
+        kept: List[str] = []
+        for block, separator in split_blocks(content):
+            if _block_hash(block) in boilerplate:
+                self.dropped += 1
+                if not separator and kept:
+                    kept[-1] = ''  # keep the page from ending in a dangling blank line
+                continue
+            kept.extend((block, separator))
+        return ''.join(kept)
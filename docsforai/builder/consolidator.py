@@ -4,12 +4,22 @@ Documentation consolidator for DocsForAI.
 This module is responsible for consolidating parsed documentation into a single Markdown file.
 """
 
+import io
+import itertools
 import logging
-from typing import List, Dict, Any
+import os
+import shutil
+import tempfile
+from typing import List, Dict, Any, Callable, Iterable, Optional, TextIO, Tuple
 from pathlib import Path
 
+from .boilerplate import BoilerplateFilter, DEFAULT_MIN_PAGES
+
 logger = logging.getLogger(__name__)
 
+# Written after each document in the consolidated output
+DOC_SEPARATOR = "\n\n---\n\n"
+
 def consolidate_documentation(
     parsed_docs: List[Dict[str, Any]],
     consolidation_config: Dict[str, Any],
@@ -26,68 +36,178 @@ def consolidate_documentation(
     Returns:
         str: Consolidated documentation as a Markdown string.
     """
-    logger.info("Starting documentation consolidation")
+    output = io.StringIO()
+    _write_consolidated(parsed_docs, consolidation_config, metadata, output, lambda: io.StringIO())
+    return output.getvalue()
+
+def write_consolidated_documentation(
+    parsed_docs: Iterable[Dict[str, Any]],
+    consolidation_config: Dict[str, Any],
+    metadata: Dict[str, str],
+    output_file: Path
+) -> Path:
+    """
+    Consolidate parsed documentation and stream it straight to a file.
+
+    Documents are consumed one at a time, so `parsed_docs` can be a generator
+    and memory stays bounded by the largest single document. Because the output
+    groups documents by type, the table of contents and the body of each type
+    are spilled to temporary files and concatenated at the end. The output is
+    identical to consolidate_documentation(); it is written to a temporary file
+    next to `output_file` and moved into place once complete.
+
+    Args:
+        parsed_docs (Iterable[Dict[str, Any]]): Parsed documentation elements.
+        consolidation_config (Dict[str, Any]): Configuration for consolidation.
+        metadata (Dict[str, str]): Metadata to include in the consolidated documentation.
+        output_file (Path): Path of the consolidated Markdown file.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    output_file = Path(output_file)
+    with tempfile.TemporaryDirectory(prefix='docsforai-consolidate-') as spill_dir:
+        spill_files = itertools.count()
+
+        def open_spill() -> TextIO:
+            spill_path = Path(spill_dir) / f"{next(spill_files)}.md"
+            return spill_path.open('w+', encoding='utf-8', newline='')
+
+        partial_file = output_file.with_name(f".{output_file.name}.partial")
+        try:
+            with partial_file.open('w', encoding='utf-8') as output:
+                _write_consolidated(parsed_docs, consolidation_config, metadata, output, open_spill)
+            os.replace(partial_file, output_file)
+        finally:
+            if partial_file.exists():
+                partial_file.unlink()
+
+    return output_file
+
+def _write_consolidated(
+    parsed_docs: Iterable[Dict[str, Any]],
+    consolidation_config: Dict[str, Any],
+    metadata: Dict[str, str],
+    output: TextIO,
+    open_spill: Callable[[], TextIO]
+) -> None:
+    """
+    Write consolidated documentation to `output`.
 
-    consolidated_content = []
+    Args:
+        parsed_docs (Iterable[Dict[str, Any]]): Parsed documentation elements.
+        consolidation_config (Dict[str, Any]): Configuration for consolidation.
+        metadata (Dict[str, str]): Metadata to include in the consolidated documentation.
+        output (TextIO): Stream receiving the consolidated documentation.
+        open_spill (Callable[[], TextIO]): Factory for the readable and writable
+            buffers holding the table of contents and body of each type.
+    """
+    logger.info("Starting documentation consolidation")
 
     # Add metadata header
-    consolidated_content.extend([
+    output.write(''.join([
         f"# {metadata.get('package_name', 'Documentation')}\n",
         f"Version: {metadata.get('version', 'N/A')}\n",
         f"Author: {metadata.get('author', 'N/A')}\n",
         "\n---\n\n"
-    ])
-
-    # Group documents by type
-    docs_by_type: Dict[str, List[Dict[str, Any]]] = {}
-    for doc in parsed_docs:
-        doc_type = doc['type']
-        if doc_type not in docs_by_type:
-            docs_by_type[doc_type] = []
-        docs_by_type[doc_type].append(doc)
-
-    # Table of contents
-    consolidated_content.append("## Table of Contents\n\n")
-    for doc_type, docs in docs_by_type.items():
-        type_header = doc_type.replace('_', ' ').title()
-        consolidated_content.append(f"### {type_header}\n\n")
-        for doc in docs:
-            if consolidation_config.get('exclude_patterns'):
-                if any(pattern in doc['filename'] for pattern in consolidation_config['exclude_patterns']):
+    ]))
+
+    exclude_patterns = consolidation_config.get('exclude_patterns')
+    boilerplate = _boilerplate_filter(consolidation_config)
+
+    # Table of contents and content, buffered per type in order of first appearance
+    spills: Dict[str, Tuple[TextIO, TextIO]] = {}
+    # (heading length, content length) of each buffered document, per type
+    layouts: Dict[str, List[Tuple[int, int]]] = {}
+    try:
+        for doc in parsed_docs:
+            doc_type = doc['type']
+            if doc_type not in spills:
+                spills[doc_type] = (open_spill(), open_spill())
+            toc, body = spills[doc_type]
+
+            if exclude_patterns:
+                if any(pattern in doc['filename'] for pattern in exclude_patterns):
                     logger.info(f"Excluding {doc['filename']} based on exclude patterns")
                     continue
             link_text = doc['filename'].replace('_', ' ').replace('.md', '')
             anchor = doc['filename'].lower().replace(' ', '-').replace('.', '')
-            consolidated_content.append(f"- [{link_text}](#{anchor})\n")
-        consolidated_content.append("\n")
-
-    consolidated_content.append("\n---\n\n")
-
-    # Add content grouped by type
-    for doc_type, docs in docs_by_type.items():
-        type_header = doc_type.replace('_', ' ').title()
-        consolidated_content.append(f"# {type_header} Documentation\n\n")
-        for doc in docs:
-            if consolidation_config.get('exclude_patterns'):
-                if any(pattern in doc['filename'] for pattern in consolidation_config['exclude_patterns']):
-                    continue
-            consolidated_content.append(f"## {doc['filename']}\n\n")
-            consolidated_content.append(doc['content'])
-            consolidated_content.append("\n\n---\n\n")
+            toc.write(f"- [{link_text}](#{anchor})\n")
+
+            heading = f"## {doc['filename']}\n\n"
+            body.write(heading)
+            body.write(doc['content'])
+            body.write(DOC_SEPARATOR)
+            if boilerplate is not None:
+                boilerplate.add(doc['content'])
+                layouts.setdefault(doc_type, []).append((len(heading), len(doc['content'])))
+
+        output.write("## Table of Contents\n\n")
+        for doc_type, (toc, _) in spills.items():
+            type_header = doc_type.replace('_', ' ').title()
+            output.write(f"### {type_header}\n\n")
+            toc.seek(0)
+            shutil.copyfileobj(toc, output)
+            output.write("\n")
+
+        output.write("\n---\n\n")
+
+        # Add content grouped by type
+        for doc_type, (_, body) in spills.items():
+            type_header = doc_type.replace('_', ' ').title()
+            output.write(f"# {type_header} Documentation\n\n")
+            body.seek(0)
+            if boilerplate is None:
+                shutil.copyfileobj(body, output)
+            else:
+                _copy_without_boilerplate(body, layouts.get(doc_type, []), boilerplate, output)
+    finally:
+        for toc, body in spills.values():
+            toc.close()
+            body.close()
 
     if consolidation_config.get('include_changelog'):
         changelog_path = consolidation_config.get('changelog_path')
         if changelog_path:
             changelog_content = _get_changelog(Path(changelog_path))
             if changelog_content:
-                consolidated_content.extend([
+                output.write(''.join([
                     "# Changelog\n\n",
                     changelog_content,
                     "\n\n---\n\n"
-                ])
+                ]))
 
+    if boilerplate is not None and boilerplate.dropped:
+        logger.info(f"Removed {boilerplate.dropped} boilerplate blocks from {boilerplate.pages} pages")
     logger.info("Documentation consolidation completed")
-    return ''.join(consolidated_content)
+
+def _boilerplate_filter(consolidation_config: Dict[str, Any]) -> Optional[BoilerplateFilter]:
+    """Return the boilerplate filter configured for consolidation, or None if disabled (the default)."""
+    threshold = consolidation_config.get('boilerplate_threshold', 0)
+    if not threshold:
+        return None
+    min_pages = consolidation_config.get('boilerplate_min_pages', DEFAULT_MIN_PAGES)
+    return BoilerplateFilter(threshold, min_pages)
+
+def _copy_without_boilerplate(
+    body: TextIO,
+    layout: List[Tuple[int, int]],
+    boilerplate: BoilerplateFilter,
+    output: TextIO
+) -> None:
+    """
+    Copy buffered documents to `output`, removing boilerplate from their content.
+
+    Args:
+        body (TextIO): Buffer of headings, contents and separators, positioned at the start.
+        layout (List[Tuple[int, int]]): Heading and content length of each buffered document.
+        boilerplate (BoilerplateFilter): Filter that has seen every document.
+        output (TextIO): Stream receiving the documents.
+    """
+    for heading_length, content_length in layout:
+        output.write(body.read(heading_length))
+        output.write(boilerplate.filter(body.read(content_length)))
+        output.write(body.read(len(DOC_SEPARATOR)))
 
 
 def _get_changelog(changelog_path: Path) -> str:
@@ -0,0 +1,198 @@
+"""
+Duplicate elimination between documentation sources and built pages.
+
+Parsers of static-site frameworks (MkDocs, Docusaurus, Hugo, Jekyll,
+VuePress) read the Markdown sources and also build the site and convert the
+resulting HTML. Most built pages are renderings of a source file, so keeping
+both doubles the output. The SourceRegistry maps built pages back to their
+sources through a page key index and decides which version of each page is
+kept, before any HTML is converted.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import toml
+import yaml
+
+logger = logging.getLogger(__name__)
+
+PREFER_OPTIONS = ['source', 'built', 'both']
+DEFAULT_PREFER = 'source'
+
+# File stems that render as the page of their directory.
+INDEX_STEMS = {'index', 'readme', '_index'}
+
+# Extensions stripped from page paths; anything else is part of the page name.
+PAGE_SUFFIXES = {'.md', '.markdown', '.mdx', '.html', '.htm'}
+
+_FRONT_MATTER_RE = re.compile(r'\A---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)', re.DOTALL)
+
+# YAML (---) or TOML (+++) front matter block, as used by Hugo
+_FRONT_MATTER_BLOCK_RE = re.compile(
+    r'\A(?:(?P<yaml>---)|(?P<toml>\+\+\+))[ \t]*\r?\n(?P<body>.*?)\r?\n(?(yaml)---|\+\+\+)[ \t]*(?:\r?\n|\Z)',
+    re.DOTALL
+)
+
+# Front matter is parsed once per page; use the LibYAML loader when PyYAML has it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def page_key(relative_path: str) -> str:
+    """
+    Return the key identifying the page a source or built file renders.
+
+    `guide/setup.md`, `guide/setup.html`, `guide/setup/index.html` and
+    `/guide/setup/` all map to `guide/setup`.
+
+    Args:
+        relative_path (str): Source path, built path or URL path of the page.
+
+    Returns:
+        str: Page key.
+    """
+    path = PurePosixPath(relative_path.strip('/') or '.')
+    parts = [part for part in path.parent.parts if part != '.']
+    stem = path.stem if path.suffix.lower() in PAGE_SUFFIXES else path.name
+    if stem != '.' and stem.lower() not in INDEX_STEMS:
+        parts.append(stem)
+    return '/'.join(parts).lower()
+
+def front_matter_value(content: str, key: str) -> Optional[str]:
+    """
+    Return a top-level scalar from the YAML front matter of a Markdown file.
+
+    Args:
+        content (str): Markdown content.
+        key (str): Front matter key, e.g. 'permalink'.
+
+    Returns:
+        Optional[str]: The value, or None if the file has no such key.
+    """
+    match = _FRONT_MATTER_RE.match(content)
+    if not match:
+        return None
+    value_match = re.search(rf'^{re.escape(key)}:[ \t]*(.+?)[ \t]*$', match.group(1), re.MULTILINE)
+    if not value_match:
+        return None
+    return value_match.group(1).strip('\'"') or None
+
+def split_front_matter(content: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split a Markdown page into its front matter (YAML, TOML or JSON) and body.
+
+    Args:
+        content (str): Page content.
+
+    Returns:
+        Tuple[Dict[str, Any], str]: Front matter (empty if missing or invalid) and body.
+    """
+    if content.startswith('{'):
+        try:
+            front_matter, end = json.JSONDecoder().raw_decode(content)
+            if isinstance(front_matter, dict):
+                return front_matter, content[end:].lstrip('\r\n')
+        except json.JSONDecodeError:
+            pass
+        return {}, content
+
+    match = _FRONT_MATTER_BLOCK_RE.match(content)
+    if not match:
+        return {}, content
+    try:
+        if match.group('yaml'):
+            front_matter = yaml.load(match.group('body'), Loader=_YAML_LOADER)
+        else:
+            front_matter = toml.loads(match.group('body'))
+    except (yaml.YAMLError, toml.TomlDecodeError) as e:
+        logger.warning(f"Invalid front matter: {str(e)}")
+        front_matter = {}
+    return front_matter if isinstance(front_matter, dict) else {}, content[match.end():]
+
+class SourceRegistry:
+    """
+    Index of source pages and built pages of one documentation build.
+
+    With prefer='source' (the default), built pages rendered from a known
+    source are skipped and never converted. With prefer='built', sources that
+    have a built page are dropped instead. prefer='both' keeps everything.
+    """
+
+    def __init__(self, prefer: Optional[str] = None):
+        """
+        Args:
+            prefer (Optional[str]): Version kept for pages available as source and as
+                built HTML: 'source', 'built' or 'both'. Defaults to 'source'.
+
+        Raises:
+            ValueError: If `prefer` is not supported.
+        """
+        prefer = prefer or DEFAULT_PREFER
+        if prefer not in PREFER_OPTIONS:
+            raise ValueError(f"Unsupported prefer option: {prefer}. Must be one of: {', '.join(PREFER_OPTIONS)}")
+        self.prefer = prefer
+        self._source_keys: Dict[str, str] = {}
+        self._source_pages: Set[str] = set()
+        self._built_pages: Set[str] = set()
+
+    def add_source(self, filename: str, url_path: Optional[str] = None) -> None:
+        """
+        Register a source page.
+
+        Args:
+            filename (str): Filename of the parsed source document.
+            url_path (Optional[str]): Path the page is served at, when it does not follow
+                from `filename` (e.g. a permalink or a route prefix).
+        """
+        key = page_key(url_path if url_path is not None else filename)
+        self._source_keys[filename] = key
+        self._source_pages.add(key)
+
+    def select_built(self, html_files: Iterable[Path], build_dir: Path) -> List[Path]:
+        """
+        Register built pages and return the ones to convert.
+
+        Args:
+            html_files (Iterable[Path]): Built HTML files.
+            build_dir (Path): Build output directory the files are relative to.
+
+        Returns:
+            List[Path]: Built files to keep, in their original order.
+        """
+        selected = []
+        skipped = 0
+        for html_file in html_files:
+            key = page_key(html_file.relative_to(build_dir).as_posix())
+            self._built_pages.add(key)
+            if self.prefer == 'source' and key in self._source_pages:
+                skipped += 1
+                continue
+            selected.append(html_file)
+        if skipped:
+            logger.info(f"Skipping {skipped} built pages that duplicate a source page")
+        return selected
+
+    def select_sources(self, parsed_docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop source documents that are superseded by a built page.
+
+        Only applies with prefer='built'; call it after select_built(). Documents
+        that were not registered as sources are always kept.
+
+        Args:
+            parsed_docs (List[Dict[str, Any]]): Parsed documentation elements.
+
+        Returns:
+            List[Dict[str, Any]]: Documents to keep, in their original order.
+        """
+        if self.prefer != 'built':
+            return parsed_docs
+        kept = [
+            doc for doc in parsed_docs
+            if self._source_keys.get(doc['filename']) not in self._built_pages
+        ]
+        if len(kept) < len(parsed_docs):
+            logger.info(f"Dropping {len(parsed_docs) - len(kept)} source pages in favour of their built version")
+        return kept
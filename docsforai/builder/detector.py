@@ -4,27 +4,202 @@ Framework detector for DocsForAI.
 This module is responsible for detecting the documentation framework used in a repository.
 """
 
+import copy
+import functools
+import hashlib
 import logging
 import json
+import mmap
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Callable, List
+from typing import Any, Dict, Callable, List, Set, Iterator, Optional, Tuple
+from ..utils.cache import get_cache_dir, load_json, save_json
+from ..utils.discovery import walk_files
 
 logger = logging.getLogger(__name__)
 
-def _has_content_match(file_path: Path, patterns: List[str]) -> bool:
-    """Check if file content matches any of the given patterns."""
+# Bump whenever a change to the checks can alter the detected framework, so
+# that cached detection results from older versions are ignored.
+DETECTOR_VERSION = 2
+
+# Bytes read from the start of a file when probing its content. A budget of 0
+# (or None) memory-maps and scans the whole file instead.
+DEFAULT_PROBE_BYTES = 64 * 1024
+
+# Per-check probe budgets. Markers such as Go package clauses, doc comments or
+# Markdown headings show up near the top of a file, so source-scanning checks
+# can stop much earlier than the default.
+DETECTION_BYTE_BUDGETS: Dict[str, int] = {
+    'apiblueprint': 8 * 1024,
+    'asciidoc': 16 * 1024,
+    'doxygen': 32 * 1024,
+    'godoc': 8 * 1024,
+    'javadoc': 32 * 1024,
+    'jsdoc': 32 * 1024,
+    'jupyter': 4 * 1024,
+    'markdown': 16 * 1024,
+    'restructuredtext': 16 * 1024,
+    'rustdoc': 32 * 1024,
+}
+
+class DetectionStats:
+    """Thread-safe counters for the I/O performed during detection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files_probed = 0
+        self.bytes_read = 0
+        self.per_check: Dict[str, List[int]] = {}
+
+    def record(self, check: str, nbytes: int) -> None:
+        """Record one probed file for `check`."""
+        with self._lock:
+            self.files_probed += 1
+            self.bytes_read += nbytes
+            counters = self.per_check.setdefault(check, [0, 0])
+            counters[0] += 1
+            counters[1] += nbytes
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for debug logging."""
+        per_check = ', '.join(
+            f"{check}={files} files/{nbytes} B"
+            for check, (files, nbytes) in sorted(self.per_check.items())
+        )
+        return f"{self.files_probed} files probed, {self.bytes_read} bytes read ({per_check or 'none'})"
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> 're.Pattern[bytes]':
+    """Compile literal patterns into one regex alternation matched in a single pass."""
+    return re.compile(b'|'.join(re.escape(pattern.encode('utf-8')) for pattern in patterns))
+
+def _has_content_match(
+    file_path: Path,
+    patterns: List[str],
+    max_bytes: Optional[int] = DEFAULT_PROBE_BYTES,
+    stats: Optional[DetectionStats] = None,
+    check: str = 'unknown',
+    tail: bool = False
+) -> bool:
+    """
+    Check if file content matches any of the given patterns.
+
+    Only the first `max_bytes` bytes are read (the last ones with `tail`); with
+    a budget of 0 or None the file is memory-mapped and scanned in full. All
+    patterns are matched in one pass with a compiled alternation.
+    """
+    regex = _compile_patterns(tuple(patterns))
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        return any(pattern in content for pattern in patterns)
+        with open(file_path, 'rb') as f:
+            if max_bytes:
+                if tail:
+                    f.seek(max(0, os.fstat(f.fileno()).st_size - max_bytes))
+                data = f.read(max_bytes)
+                if stats is not None:
+                    stats.record(check, len(data))
+                return regex.search(data) is not None
+
+            size = os.fstat(f.fileno()).st_size
+            if stats is not None:
+                stats.record(check, size)
+            if size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return regex.search(mapped) is not None
     except Exception:
         return False
 
-def _check_sphinx(path: Path) -> bool:
+class RepoScan:
+    """
+    In-memory index of a repository tree, built with a single discovery walk.
+
+    Framework checks query this index instead of globbing the tree themselves,
+    so detection walks the disk only once no matter how many checks run. Checks
+    also probe file contents through the scan, which applies the per-check
+    byte budget and records detection I/O.
+    """
+
+    def __init__(self, root: Path, byte_budgets: Optional[Dict[str, int]] = None):
+        self.root = root
+        self.files_by_ext: Dict[str, List[Path]] = {}
+        self.basenames: Set[str] = set()
+        self.top_level_dirs: Set[str] = set()
+        self.byte_budgets = {**DETECTION_BYTE_BUDGETS, **(byte_budgets or {})}
+        self.byte_budget = self.byte_budgets.get('default', DEFAULT_PROBE_BYTES)
+        self.check = 'unknown'
+        self.stats = DetectionStats()
+        self.cancelled = threading.Event()
+        self._package_deps: Dict[str, Optional[Dict[str, str]]] = {}
+        self._walk()
+
+    def _walk(self) -> None:
+        """Walk the tree once and populate the index."""
+        prefix_len = len(str(self.root).rstrip(os.sep)) + 1
+        for file_path in walk_files(self.root):
+            name = file_path.name
+            self.basenames.add(name)
+            ext = os.path.splitext(name)[1].lower()
+            self.files_by_ext.setdefault(ext, []).append(file_path)
+            rel_parts = str(file_path)[prefix_len:].split(os.sep, 1)
+            if len(rel_parts) > 1:
+                self.top_level_dirs.add(rel_parts[0])
+
+    def for_check(self, check: str) -> 'RepoScan':
+        """Return a view of this scan bound to `check` and its byte budget."""
+        view = copy.copy(self)
+        view.check = check
+        view.byte_budget = self.byte_budgets.get(check, self.byte_budgets.get('default', DEFAULT_PROBE_BYTES))
+        return view
+
+    def files(self, *extensions: str) -> Iterator[Path]:
+        """Yield indexed files having any of the given extensions (e.g. '.md')."""
+        for ext in extensions:
+            yield from self.files_by_ext.get(ext.lower(), [])
+
+    def has_files(self, *extensions: str) -> bool:
+        """Check whether any indexed file has one of the given extensions."""
+        return any(self.files_by_ext.get(ext.lower()) for ext in extensions)
+
+    def probe(self, file_path: Path, patterns: List[str], tail: bool = False) -> bool:
+        """
+        Check whether the head (or with `tail`, the end) of `file_path` matches any of `patterns`.
+
+        Returns False without touching the disk once detection has been
+        cancelled, so content-scanning loops wind down immediately.
+        """
+        if self.cancelled.is_set():
+            return False
+        return _has_content_match(file_path, patterns, self.byte_budget, self.stats, self.check, tail)
+
+    def package_dependencies(self, path: Path) -> Optional[Dict[str, str]]:
+        """
+        Return the merged dependencies declared in `path`/package.json.
+
+        The file is parsed once per scan and shared by every check. Returns None
+        if package.json is missing or invalid.
+        """
+        key = str(path)
+        if key not in self._package_deps:
+            deps = None
+            package_json = path / 'package.json'
+            if package_json.exists():
+                try:
+                    with open(package_json) as f:
+                        data = json.load(f)
+                    deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
+                except Exception:
+                    pass
+            self._package_deps[key] = deps
+        return self._package_deps[key]
+
+def _check_sphinx(path: Path, scan: RepoScan) -> bool:
     # Primary check for conf.py
     conf_py = path / 'conf.py'
     if conf_py.exists():
-        return _has_content_match(conf_py, ['sphinx', 'sphinx-build'])
+        return scan.probe(conf_py, ['sphinx', 'sphinx-build'])
     
     # Check for sphinx-specific files and directories
     sphinx_indicators = [
@@ -40,30 +215,30 @@ def _check_sphinx(path: Path) -> bool:
     req_files = ['requirements.txt', 'dev-requirements.txt', 'docs/requirements.txt']
     for req_file in req_files:
         req_path = path / req_file
-        if req_path.exists() and _has_content_match(req_path, ['sphinx']):
+        if req_path.exists() and scan.probe(req_path, ['sphinx']):
             return True
     
     return False
 
-def _check_mkdocs(path: Path) -> bool:
+def _check_mkdocs(path: Path, scan: RepoScan) -> bool:
     # Check for mkdocs.yml or .yaml
     mkdocs_files = [path / 'mkdocs.yml', path / 'mkdocs.yaml', 
                     path / 'docs' / 'mkdocs.yml', path / 'docs' / 'mkdocs.yaml']
     
     for mkdocs_file in mkdocs_files:
         if mkdocs_file.exists():
-            return _has_content_match(mkdocs_file, ['site_name:', 'docs_dir:', 'mkdocs'])
+            return scan.probe(mkdocs_file, ['site_name:', 'docs_dir:', 'mkdocs'])
     
     # Check requirements files
     req_files = ['requirements.txt', 'dev-requirements.txt', 'docs/requirements.txt']
     for req_file in req_files:
         req_path = path / req_file
-        if req_path.exists() and _has_content_match(req_path, ['mkdocs']):
+        if req_path.exists() and scan.probe(req_path, ['mkdocs']):
             return True
     
     return False
 
-def _check_docusaurus(path: Path) -> bool:
+def _check_docusaurus(path: Path, scan: RepoScan) -> bool:
     # Check for configuration files
     config_files = [
         path / 'docusaurus.config.js',
@@ -73,22 +248,16 @@ def _check_docusaurus(path: Path) -> bool:
     
     for config_file in config_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['docusaurus', '@docusaurus/core'])
+            return scan.probe(config_file, ['docusaurus', '@docusaurus/core'])
     
     # Check package.json for docusaurus dependencies
-    package_json = path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                return any('docusaurus' in dep for dep in deps)
-        except Exception:
-            pass
+    deps = scan.package_dependencies(path)
+    if deps is not None:
+        return any('docusaurus' in dep for dep in deps)
     
     return False
 
-def _check_jekyll(path: Path) -> bool:
+def _check_jekyll(path: Path, scan: RepoScan) -> bool:
     # Check for Jekyll configuration files
     jekyll_files = [
         path / '_config.yml',
@@ -98,7 +267,7 @@ def _check_jekyll(path: Path) -> bool:
     
     for config_file in jekyll_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['jekyll', 'theme:', 'plugins:', 'collections:'])
+            return scan.probe(config_file, ['jekyll', 'theme:', 'plugins:', 'collections:'])
     
     # Check for typical Jekyll directory structure
     jekyll_dirs = ['_layouts', '_includes', '_posts', '_site']
@@ -108,11 +277,11 @@ def _check_jekyll(path: Path) -> bool:
     # Check Gemfile for Jekyll
     gemfile = path / 'Gemfile'
     if gemfile.exists():
-        return _has_content_match(gemfile, ['jekyll'])
+        return scan.probe(gemfile, ['jekyll'])
     
     return False
 
-def _check_hugo(path: Path) -> bool:
+def _check_hugo(path: Path, scan: RepoScan) -> bool:
     # Check for Hugo configuration files
     hugo_files = [
         path / 'config.toml',
@@ -125,7 +294,7 @@ def _check_hugo(path: Path) -> bool:
     
     for config_file in hugo_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['baseURL', 'theme', 'hugo'])
+            return scan.probe(config_file, ['baseURL', 'theme', 'hugo'])
     
     # Check for Hugo-specific directories
     hugo_dirs = ['layouts', 'content', 'themes', 'archetypes']
@@ -134,35 +303,24 @@ def _check_hugo(path: Path) -> bool:
     
     return False
 
-def _check_apiblueprint(path: Path) -> bool:
+def _check_apiblueprint(path: Path, scan: RepoScan) -> bool:
     # Check for API Blueprint files
-    for apib_file in path.glob('**/*.apib'):
-        if _has_content_match(apib_file, ['FORMAT: 1A', '# Group', '## Action']):
-            return True
-    
-    for blueprint_file in path.glob('**/*.apiblueprint'):
-        if _has_content_match(blueprint_file, ['FORMAT: 1A', '# Group', '## Action']):
+    for apib_file in scan.files('.apib', '.apiblueprint'):
+        if scan.probe(apib_file, ['FORMAT: 1A', '# Group', '## Action']):
             return True
     
     # Check package.json for aglio or other API Blueprint tools
-    package_json = path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                return any(dep in ['aglio', 'apib2swagger', 'apiary-client'] for dep in deps)
-        except Exception:
-            pass
+    deps = scan.package_dependencies(path)
+    if deps is not None:
+        return any(dep in ['aglio', 'apib2swagger', 'apiary-client'] for dep in deps)
     
     return False
 
-def _check_asciidoc(path: Path) -> bool:
+def _check_asciidoc(path: Path, scan: RepoScan) -> bool:
     # Check for AsciiDoc files
-    for ext in ['.adoc', '.asciidoc', '.asc']:
-        for doc_file in path.glob(f'**/*{ext}'):
-            if _has_content_match(doc_file, ['= ', '== ', ':toc:', 'ifdef::', 'include::']):
-                return True
+    for doc_file in scan.files('.adoc', '.asciidoc', '.asc'):
+        if scan.probe(doc_file, ['= ', '== ', ':toc:', 'ifdef::', 'include::']):
+            return True
     
     # Check for AsciiDoctor configuration
     config_files = [
@@ -178,18 +336,18 @@ def _check_asciidoc(path: Path) -> bool:
     # Check Gemfile for AsciiDoctor
     gemfile = path / 'Gemfile'
     if gemfile.exists():
-        return _has_content_match(gemfile, ['asciidoctor'])
+        return scan.probe(gemfile, ['asciidoctor'])
     
     return False
 
-def _check_docsify(path: Path) -> bool:
+def _check_docsify(path: Path, scan: RepoScan) -> bool:
     # Check for Docsify setup
     if not (path / '.nojekyll').exists():
         return False
     
     index_files = [path / 'index.html', path / 'docs' / 'index.html']
     for index_file in index_files:
-        if index_file.exists() and _has_content_match(index_file, ['docsify', 'window.$docsify']):
+        if index_file.exists() and scan.probe(index_file, ['docsify', 'window.$docsify']):
             return True
     
     # Check for docsify configuration file
@@ -199,19 +357,13 @@ def _check_docsify(path: Path) -> bool:
             return True
     
     # Check package.json for docsify
-    package_json = path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                return any('docsify' in dep for dep in deps)
-        except Exception:
-            pass
+    deps = scan.package_dependencies(path)
+    if deps is not None:
+        return any('docsify' in dep for dep in deps)
     
     return False
 
-def _check_doxygen(path: Path) -> bool:
+def _check_doxygen(path: Path, scan: RepoScan) -> bool:
     # Check for Doxygen configuration files
     doxygen_files = [
         path / 'Doxyfile',
@@ -223,17 +375,16 @@ def _check_doxygen(path: Path) -> bool:
     
     for config_file in doxygen_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['GENERATE_HTML', 'PROJECT_NAME', 'DOXYGEN'])
+            return scan.probe(config_file, ['GENERATE_HTML', 'PROJECT_NAME', 'DOXYGEN'])
     
     # Check for Doxygen-style comments in source files
-    for ext in ['.cpp', '.hpp', '.c', '.h', '.java']:
-        for source_file in path.glob(f'**/*{ext}'):
-            if _has_content_match(source_file, ['/**', '///', '\\brief', '@brief', '@param', '@return']):
-                return True
+    for source_file in scan.files('.cpp', '.hpp', '.c', '.h', '.java'):
+        if scan.probe(source_file, ['/**', '///', '\\brief', '@brief', '@param', '@return']):
+            return True
     
     return False
 
-def _check_gitbook(path: Path) -> bool:
+def _check_gitbook(path: Path, scan: RepoScan) -> bool:
     # Check for GitBook configuration files
     gitbook_files = [
         path / 'book.json',
@@ -244,42 +395,36 @@ def _check_gitbook(path: Path) -> bool:
     
     for config_file in gitbook_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['gitbook', 'structure', 'plugins'])
+            return scan.probe(config_file, ['gitbook', 'structure', 'plugins'])
     
     # Check for GitBook directory structure
     if (path / 'SUMMARY.md').exists() and (path / 'README.md').exists():
         return True
     
     # Check package.json for GitBook
-    package_json = path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                return any('gitbook' in dep for dep in deps)
-        except Exception:
-            pass
+    deps = scan.package_dependencies(path)
+    if deps is not None:
+        return any('gitbook' in dep for dep in deps)
     
     return False
 
-def _check_godoc(path: Path) -> bool:
+def _check_godoc(path: Path, scan: RepoScan) -> bool:
     # Check for Go module
     if not (path / 'go.mod').exists():
         return False
     
     # Look for Go files with package documentation
-    for go_file in path.glob('**/*.go'):
-        if _has_content_match(go_file, ['package ', '// ', '/* ', 'func ', 'type ']):
+    for go_file in scan.files('.go'):
+        if scan.probe(go_file, ['package ', '// ', '/* ', 'func ', 'type ']):
             return True
     
     # Check for doc.go files (common in Go projects)
-    return any((path / d / 'doc.go').exists() for d in path.iterdir() if d.is_dir())
+    return any((path / d / 'doc.go').exists() for d in scan.top_level_dirs)
 
-def _check_javadoc(path: Path) -> bool:
+def _check_javadoc(path: Path, scan: RepoScan) -> bool:
     # Look for Java files with Javadoc comments
-    for java_file in path.glob('**/*.java'):
-        if _has_content_match(java_file, ['/**', '@param', '@return', '@throws', '@author', '@see']):
+    for java_file in scan.files('.java'):
+        if scan.probe(java_file, ['/**', '@param', '@return', '@throws', '@author', '@see']):
             return True
     
     # Check for Maven or Gradle configuration with Javadoc plugin
@@ -291,11 +436,11 @@ def _check_javadoc(path: Path) -> bool:
     
     for build_file in build_files:
         if build_file.exists():
-            return _has_content_match(build_file, ['javadoc', 'maven-javadoc-plugin', 'org.gradle.api.tasks.javadoc'])
+            return scan.probe(build_file, ['javadoc', 'maven-javadoc-plugin', 'org.gradle.api.tasks.javadoc'])
     
     return False
 
-def _check_jsdoc(path: Path) -> bool:
+def _check_jsdoc(path: Path, scan: RepoScan) -> bool:
     # Check for JSDoc configuration files
     jsdoc_files = [
         path / 'jsdoc.json',
@@ -307,37 +452,27 @@ def _check_jsdoc(path: Path) -> bool:
     
     for config_file in jsdoc_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['jsdoc', 'plugins', 'templates'])
+            return scan.probe(config_file, ['jsdoc', 'plugins', 'templates'])
     
     # Check package.json for JSDoc
-    package_json = path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                return any('jsdoc' in dep for dep in deps)
-        except Exception:
-            pass
+    deps = scan.package_dependencies(path)
+    if deps is not None:
+        return any('jsdoc' in dep for dep in deps)
     
     # Look for JS/TS files with JSDoc comments
-    for ext in ['.js', '.jsx', '.ts', '.tsx']:
-        for js_file in path.glob(f'**/*{ext}'):
-            if _has_content_match(js_file, ['/**', '@param', '@returns', '@type', '@typedef', '@module']):
-                return True
+    for js_file in scan.files('.js', '.jsx', '.ts', '.tsx'):
+        if scan.probe(js_file, ['/**', '@param', '@returns', '@type', '@typedef', '@module']):
+            return True
     
     return False
 
-def _check_jupyter(path: Path) -> bool:
+def _check_jupyter(path: Path, scan: RepoScan) -> bool:
     # Check for Jupyter notebooks
-    for notebook in path.glob('**/*.ipynb'):
-        try:
-            with open(notebook) as f:
-                data = json.load(f)
-                if 'cells' in data and 'metadata' in data:
-                    return True
-        except Exception:
-            continue
+    # nbformat 4 writes its keys sorted: "cells" opens the file and "nbformat"
+    # follows the metadata at its end, so a truncated file or other JSON fails
+    for notebook in scan.files('.ipynb'):
+        if scan.probe(notebook, ['"cells"']) and scan.probe(notebook, ['"nbformat"'], tail=True):
+            return True
     
     # Check for Jupyter configuration files
     jupyter_files = [
@@ -348,7 +483,7 @@ def _check_jupyter(path: Path) -> bool:
     
     return any(f.exists() for f in jupyter_files)
 
-def _check_markdown(path: Path) -> bool:
+def _check_markdown(path: Path, scan: RepoScan) -> bool:
     # Look for Markdown files with specific documentation patterns
     doc_patterns = [
         '# ', '## ', '### ',  # Headers
@@ -358,13 +493,13 @@ def _check_markdown(path: Path) -> bool:
         '|---',               # Tables
     ]
     
-    for md_file in path.glob('**/*.md'):
-        if _has_content_match(md_file, doc_patterns):
+    for md_file in scan.files('.md'):
+        if scan.probe(md_file, doc_patterns):
             return True
     
     return False
 
-def _check_openapi(path: Path) -> bool:
+def _check_openapi(path: Path, scan: RepoScan) -> bool:
     # Check for OpenAPI/Swagger files
     api_files = [
         'swagger.yaml', 'swagger.yml', 'swagger.json',
@@ -375,21 +510,15 @@ def _check_openapi(path: Path) -> bool:
     for api_file in api_files:
         file_path = path / api_file
         if file_path.exists():
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                if '.json' in api_file:
-                    data = json.loads(content)
-                    if any(key in data for key in ['swagger', 'openapi']):
-                        return True
-                else:
-                    if any(pattern in content for pattern in ['swagger:', 'openapi:', 'info:', 'paths:']):
-                        return True
-            except Exception:
-                continue
+            if '.json' in api_file:
+                if scan.probe(file_path, ['"swagger"', '"openapi"']):
+                    return True
+            elif scan.probe(file_path, ['swagger:', 'openapi:', 'info:', 'paths:']):
+                return True
     
     return False
 
-def _check_readthedocs(path: Path) -> bool:
+def _check_readthedocs(path: Path, scan: RepoScan) -> bool:
     # Check for Read the Docs configuration files
     rtd_files = [
         path / '.readthedocs.yaml',
@@ -401,17 +530,17 @@ def _check_readthedocs(path: Path) -> bool:
     
     for config_file in rtd_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['version:', 'python:', 'sphinx:', 'mkdocs:'])
+            return scan.probe(config_file, ['version:', 'python:', 'sphinx:', 'mkdocs:'])
     
     # Check for Read the Docs integration in other configuration files
     if (path / '.github' / 'workflows').exists():
         for workflow in (path / '.github' / 'workflows').glob('*.yml'):
-            if _has_content_match(workflow, ['readthedocs', 'Read the Docs']):
+            if scan.probe(workflow, ['readthedocs', 'Read the Docs']):
                 return True
     
     return False
 
-def _check_restructuredtext(path: Path) -> bool:
+def _check_restructuredtext(path: Path, scan: RepoScan) -> bool:
     # Look for reStructuredText files with specific patterns
     rst_patterns = [
         '===', '---', '^^^',  # Section headers
@@ -423,30 +552,30 @@ def _check_restructuredtext(path: Path) -> bool:
         '|release|'           # Substitutions
     ]
     
-    for rst_file in path.glob('**/*.rst'):
-        if _has_content_match(rst_file, rst_patterns):
+    for rst_file in scan.files('.rst'):
+        if scan.probe(rst_file, rst_patterns):
             return True
     
     return False
 
-def _check_rustdoc(path: Path) -> bool:
+def _check_rustdoc(path: Path, scan: RepoScan) -> bool:
     # Check for Rust project
     if not (path / 'Cargo.toml').exists():
         return False
     
     # Look for Rust files with documentation comments
-    for rust_file in path.glob('**/*.rs'):
-        if _has_content_match(rust_file, ['///', '//!', '# Examples', '# Panics', '# Safety']):
+    for rust_file in scan.files('.rs'):
+        if scan.probe(rust_file, ['///', '//!', '# Examples', '# Panics', '# Safety']):
             return True
     
     # Check Cargo.toml for documentation features
     cargo_toml = path / 'Cargo.toml'
     if cargo_toml.exists():
-        return _has_content_match(cargo_toml, ['[package.metadata.docs.rs]', 'documentation ='])
+        return scan.probe(cargo_toml, ['[package.metadata.docs.rs]', 'documentation ='])
     
     return False
 
-def _check_vuepress(path: Path) -> bool:
+def _check_vuepress(path: Path, scan: RepoScan) -> bool:
     # Check for VuePress configuration files
     vuepress_files = [
         path / '.vuepress/config.js',
@@ -457,23 +586,17 @@ def _check_vuepress(path: Path) -> bool:
     
     for config_file in vuepress_files:
         if config_file.exists():
-            return _has_content_match(config_file, ['module.exports', 'export default', 'title:', 'description:'])
+            return scan.probe(config_file, ['module.exports', 'export default', 'title:', 'description:'])
     
     # Check package.json for VuePress
-    package_json = path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                return any('vuepress' in dep for dep in deps)
-        except Exception:
-            pass
+    deps = scan.package_dependencies(path)
+    if deps is not None:
+        return any('vuepress' in dep for dep in deps)
     
     # Check for VuePress directory structure
     return (path / '.vuepress').exists() or (path / 'docs' / '.vuepress').exists()
 
-FRAMEWORK_CHECKS: Dict[str, Callable[[Path], bool]] = {
+FRAMEWORK_CHECKS: Dict[str, Callable[[Path, RepoScan], bool]] = {
     'sphinx': _check_sphinx,
     'mkdocs': _check_mkdocs,
     'docusaurus': _check_docusaurus,
@@ -496,12 +619,75 @@ FRAMEWORK_CHECKS: Dict[str, Callable[[Path], bool]] = {
     'vuepress': _check_vuepress,
 }
 
-def detect_framework(repo_path: Path) -> str:
+# Cost classes of the checks. 'cheap' checks only stat marker files and read a
+# few small configuration files; 'scan' checks iterate over indexed source files
+# and probe their contents. Checks missing here are treated as cheap.
+CHEAP = 'cheap'
+SCAN = 'scan'
+CHECK_COSTS: Dict[str, str] = {
+    'apiblueprint': SCAN,
+    'asciidoc': SCAN,
+    'doxygen': SCAN,
+    'godoc': SCAN,
+    'javadoc': SCAN,
+    'jsdoc': SCAN,
+    'jupyter': SCAN,
+    'markdown': SCAN,
+    'restructuredtext': SCAN,
+    'rustdoc': SCAN,
+}
+
+def _run_checks(repo_path: Path, scan: RepoScan, max_workers: Optional[int] = None) -> Optional[str]:
+    """
+    Run the framework checks and return the highest-priority match.
+
+    Priority is the order of FRAMEWORK_CHECKS. Cheap checks run first, in order,
+    until one matches. Content-scanning checks that outrank that match then run
+    concurrently in a thread pool; their results are consumed in priority order
+    and, as soon as a framework is confirmed, pending checks are cancelled and
+    running ones stop probing files.
+    """
+    frameworks = list(FRAMEWORK_CHECKS)
+    cheap_match = None
+    for framework in frameworks:
+        if CHECK_COSTS.get(framework, CHEAP) != CHEAP:
+            continue
+        if FRAMEWORK_CHECKS[framework](repo_path, scan.for_check(framework)):
+            cheap_match = framework
+            break
+
+    limit = frameworks.index(cheap_match) if cheap_match else len(frameworks)
+    candidates = [fw for fw in frameworks[:limit] if CHECK_COSTS.get(fw, CHEAP) == SCAN]
+    if not candidates:
+        return cheap_match
+
+    pool = ThreadPoolExecutor(max_workers=max_workers or min(len(candidates), (os.cpu_count() or 1) + 4))
+    try:
+        futures = {
+            framework: pool.submit(FRAMEWORK_CHECKS[framework], repo_path, scan.for_check(framework))
+            for framework in candidates
+        }
+        for framework in candidates:
+            if futures[framework].result():
+                return framework
+        return cheap_match
+    finally:
+        scan.cancelled.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def detect_framework(
+    repo_path: Path,
+    byte_budgets: Optional[Dict[str, int]] = None,
+    max_workers: Optional[int] = None
+) -> str:
     """
     Detect the documentation framework used in the repository.
 
     Args:
         repo_path (Path): Path to the repository root.
+        byte_budgets (Optional[Dict[str, int]]): Per-check content probe budgets in bytes,
+            keyed by framework name (or 'default'). 0 scans whole files.
+        max_workers (Optional[int]): Threads used for the content-scanning checks.
 
     Returns:
         str: The detected framework name, or 'unknown' if not detected.
@@ -513,10 +699,17 @@ def detect_framework(repo_path: Path) -> str:
         logger.error(f"Repository path does not exist: {repo_path}")
         raise ValueError(f"Repository path does not exist: {repo_path}")
 
-    for framework, check_func in FRAMEWORK_CHECKS.items():
-        if check_func(repo_path):
-            logger.info(f"Detected framework: {framework}")
-            return framework
+    scan = RepoScan(repo_path, byte_budgets)
+    logger.debug(
+        f"Indexed {sum(len(files) for files in scan.files_by_ext.values())} files "
+        f"across {len(scan.files_by_ext)} extensions under {repo_path}"
+    )
+
+    framework = _run_checks(repo_path, scan, max_workers)
+    logger.debug(f"Detection I/O: {scan.stats.summary()}")
+    if framework:
+        logger.info(f"Detected framework: {framework}")
+        return framework
 
     # If not found, fallback
     common_docs = ['README.md', 'README.rst', 'index.md', 'index.rst']
@@ -526,4 +719,112 @@ def detect_framework(repo_path: Path) -> str:
             return 'common'
 
     logger.warning("No known documentation framework detected")
-    return 'unknown'
\ No newline at end of file
+    return 'unknown'
+
+class DetectionCache:
+    """
+    On-disk cache of detection results.
+
+    Results are keyed by repository URL, commit SHA, docs path, detector version
+    and the settings that influence detection, and stored as JSON in the
+    'detection' cache directory. Hit and miss counts are kept both for the
+    current process and cumulatively in the cache file. Lookups never write
+    the file: the counts of this process are added to it on the next put().
+    """
+
+    MAX_ENTRIES = 1000
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = get_cache_dir('detection')
+        self.path = cache_dir / 'detection.json' if cache_dir is not None else None
+        self.hits = 0
+        self.misses = 0
+        # Counts not yet added to the cache file
+        self._unsaved_hits = 0
+        self._unsaved_misses = 0
+
+    @staticmethod
+    def make_key(
+        repo_url: str,
+        commit_sha: str,
+        docs_path: str,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build the cache key for a detection.
+
+        Args:
+            repo_url (str): URL of the source repository.
+            commit_sha (str): Commit SHA the repository is checked out at.
+            docs_path (str): Documentation path within the repository.
+            settings (Optional[Dict[str, Any]]): Detection settings (byte budgets, excludes, ...).
+
+        Returns:
+            str: A hex digest identifying the detection.
+        """
+        material = json.dumps(
+            [repo_url, commit_sha, str(docs_path).strip('/'), DETECTOR_VERSION, settings or {}],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _load(self) -> Dict[str, Any]:
+        data = load_json(self.path, {}) if self.path is not None else {}
+        if not isinstance(data, dict) or not isinstance(data.get('entries'), dict):
+            data = {'entries': {}, 'hits': 0, 'misses': 0}
+        return data
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached detection result and count the hit or miss.
+
+        Args:
+            key (str): Key returned by make_key().
+
+        Returns:
+            Optional[str]: The cached framework, or None on a miss.
+        """
+        if self.path is None:
+            return None
+        entry = self._load()['entries'].get(key)
+        framework = entry.get('framework') if isinstance(entry, dict) else None
+        if framework:
+            self.hits += 1
+            self._unsaved_hits += 1
+        else:
+            self.misses += 1
+            self._unsaved_misses += 1
+        return framework
+
+    def put(self, key: str, framework: str, **info: Any) -> None:
+        """
+        Store a detection result.
+
+        Args:
+            key (str): Key returned by make_key().
+            framework (str): The detected framework.
+            **info (Any): Extra descriptive fields stored with the entry.
+        """
+        if self.path is None:
+            return
+        data = self._load()
+        entries = data['entries']
+        entries.pop(key, None)
+        entries[key] = {'framework': framework, **info}
+        while len(entries) > self.MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+        data['hits'] = data.get('hits', 0) + self._unsaved_hits
+        data['misses'] = data.get('misses', 0) + self._unsaved_misses
+        save_json(self.path, data)
+        self._unsaved_hits = self._unsaved_misses = 0
+
+    def summary(self) -> str:
+        """Return the hit and miss counts for logging."""
+        data = self._load()
+        total_hits = data.get('hits', 0) + self._unsaved_hits
+        total_misses = data.get('misses', 0) + self._unsaved_misses
+        return (
+            f"{self.hits} hits, {self.misses} misses this build "
+            f"({total_hits} hits, {total_misses} misses total)"
+        )
@@ -4,26 +4,38 @@ Framework-specific parsing modules for DocsForAI.
 This package contains modules for parsing documentation from various frameworks.
 """
 
-from .apiblueprint import parse_apiblueprint
-from .asciidoc import parse_asciidoc
-from .docsify import parse_docsify
-from .docusaurus import parse_docusaurus
-from .doxygen import parse_doxygen
-from .gitbook import parse_gitbook
-from .godoc import parse_godoc
-from .hugo import parse_hugo
-from .javadoc import parse_javadoc
-from .jekyll import parse_jekyll
-from .jsdoc import parse_jsdoc
-from .jupyter import parse_jupyter
-from .markdown import parse_markdown
-from .mkdocs import parse_mkdocs
-from .openapi import parse_openapi
-from .readthedocs import parse_readthedocs
-from .restructuredtext import parse_restructuredtext
-from .rustdoc import parse_rustdoc
-from .sphinx import parse_sphinx
-from .vuepress import parse_vuepress
+import importlib
+
+# Parser modules are imported on first access (PEP 562) so that importing this
+# package does not pull in every framework's dependencies.
+_PARSER_MODULES = {
+    'parse_apiblueprint': '.apiblueprint',
+    'parse_asciidoc': '.asciidoc',
+    'parse_docsify': '.docsify',
+    'parse_docusaurus': '.docusaurus',
+    'parse_doxygen': '.doxygen',
+    'parse_gitbook': '.gitbook',
+    'parse_godoc': '.godoc',
+    'parse_hugo': '.hugo',
+    'parse_javadoc': '.javadoc',
+    'parse_jekyll': '.jekyll',
+    'parse_jsdoc': '.jsdoc',
+    'parse_jupyter': '.jupyter',
+    'parse_markdown': '.markdown',
+    'parse_mkdocs': '.mkdocs',
+    'parse_openapi': '.openapi',
+    'parse_readthedocs': '.readthedocs',
+    'parse_restructuredtext': '.restructuredtext',
+    'parse_rustdoc': '.rustdoc',
+    'parse_sphinx': '.sphinx',
+    'parse_vuepress': '.vuepress',
+}
+
+def __getattr__(name):
+    if name in _PARSER_MODULES:
+        module = importlib.import_module(_PARSER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'parse_apiblueprint',
@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any
 import subprocess
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ def parse_asciidoc(docs_path: Path) -> List[Dict[str, Any]]:
 
     parsed_docs = []
 
-    for adoc_file in docs_path.rglob('*.adoc'):
+    for adoc_file in walk_files(docs_path, ['.adoc']):
         try:
             # Convert AsciiDoc to HTML using AsciiDoctor
             result = subprocess.run(
@@ -6,6 +6,7 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any
 import json
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ def parse_docsify(docs_path: Path) -> List[Dict[str, Any]]:
         })
 
     # Parse markdown files
-    for md_file in docs_path.rglob('*.md'):
+    for md_file in walk_files(docs_path, ['.md']):
         with md_file.open('r', encoding='utf-8') as f:
             content = f.read()
             parsed_docs.append({
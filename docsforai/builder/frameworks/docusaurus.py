@@ -6,24 +6,51 @@ Requires:
 """
 
 import logging
+import re
 from pathlib import Path
 import shutil
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
 import subprocess
-from docsforai.converter.html_to_md import html_to_md
-from docsforai.utils import run_subprocess_with_logging
+from docsforai.builder.dedup import SourceRegistry, front_matter_value, split_front_matter
+from docsforai.builder.mdx import page_title, sidebar_order, strip_mdx, with_title
+from docsforai.builder.node_deps import install_node_dependencies
+from docsforai.converter.html_to_md import convert_html_files
+from docsforai.utils import run_subprocess_with_logging, walk_files
 
 logger = logging.getLogger(__name__)
 
-def parse_docusaurus(docs_path: Path, npm_install_args: Optional[List[str]] = None, npm_build_args: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+SIDEBAR_FILES = ['sidebars.js', 'sidebars.ts', 'sidebars.json']
+
+# Docusaurus strips number prefixes used for ordering ("01-intro.md") from doc ids
+_NUMBER_PREFIX_RE = re.compile(r'^\d+\s*[-_.]+\s*')
+
+def parse_docusaurus(
+    docs_path: Path,
+    npm_install_args: Optional[List[str]] = None,
+    npm_build_args: Optional[List[str]] = None,
+    prefer: Optional[str] = None,
+    node_modules_cache: bool = True,
+    node_build: bool = False
+) -> List[Dict[str, Any]]:
     """
     Parse Docusaurus documentation.
 
+    By default only the sources are read: the pages of `docs/` and
+    `versioned_docs/` are converted from MDX to Markdown in Python and ordered
+    by the sidebars. With `node_build`, the npm dependencies are installed and
+    the site is built, and the built pages are converted as well.
+
     Args:
         docs_path (Path): Path to the Docusaurus documentation source.
         npm_install_args (Optional[List[str]]): Additional arguments for npm install command.
         npm_build_args (Optional[List[str]]): Additional arguments for npm run build command.
+        prefer (Optional[str]): Version kept for pages that exist as source and as built HTML:
+            'source' (default), 'built' or 'both'.
+        node_modules_cache (bool): Whether to reuse node_modules installed by earlier builds
+            with the same lockfile and Node version.
+        node_build (bool): Whether to build the site with Node. The npm arguments, `prefer`
+            and `node_modules_cache` only apply to such builds.
 
     Returns:
         List[Dict[str, Any]]: Parsed Docusaurus documentation.
@@ -46,6 +73,7 @@ def parse_docusaurus(docs_path: Path, npm_install_args: Optional[List[str]] = No
         raise FileNotFoundError("Neither docusaurus.config.js nor docusaurus.config.ts found")
 
     parsed_docs = []
+    registry = SourceRegistry(prefer)
 
     # Parse sidebar.json
     sidebar_path = docs_path / 'sidebars.json'
@@ -62,36 +90,42 @@ def parse_docusaurus(docs_path: Path, npm_install_args: Optional[List[str]] = No
             logger.error(f"Invalid sidebars.json: {str(e)}")
             raise
 
+    if not node_build:
+        parsed_docs.extend(_parse_sources(docs_path))
+        return parsed_docs
+
     # Parse documentation files
     docs_dir = docs_path / 'docs'
     if docs_dir.exists():
-        for md_file in docs_dir.rglob('*.md'):
+        for md_file in walk_files(docs_dir, ['.md']):
             with md_file.open('r', encoding='utf-8') as f:
                 content = f.read()
+                filename = md_file.relative_to(docs_dir).as_posix()
                 parsed_docs.append({
                     'type': 'docusaurus',
-                    'filename': md_file.relative_to(docs_dir).as_posix(),
+                    'filename': filename,
                     'content': content
                 })
+                registry.add_source(filename, _source_url(filename, content))
 
     build_dir = docs_path / 'build'
     try:
         # Install and build with detailed logging
         logger.debug(f"Running npm install with args: {npm_install_args}")
-        run_subprocess_with_logging(['npm', 'install'], cwd=docs_path, additional_args=npm_install_args)
+        install_node_dependencies(docs_path, npm_install_args, use_cache=node_modules_cache)
         
         logger.debug(f"Running npm run build with args: {npm_build_args}")
         run_subprocess_with_logging(['npm', 'run', 'build'], cwd=docs_path, additional_args=npm_build_args)
 
         # Parse built HTML
-        for html_file in build_dir.rglob('*.html'):
-            with html_file.open('r', encoding='utf-8') as f:
-                content = f.read()
-                parsed_docs.append({
-                    'type': 'docusaurus_built',
-                    'filename': html_file.relative_to(build_dir).as_posix(),
-                    'content': html_to_md(content)  # <--- real HTML -> MD conversion
-                })
+        html_files = registry.select_built(walk_files(build_dir, ['.html']), build_dir)
+        parsed_docs = registry.select_sources(parsed_docs)
+        for html_file, markdown in zip(html_files, convert_html_files(html_files, framework='docusaurus')):
+            parsed_docs.append({
+                'type': 'docusaurus_built',
+                'filename': html_file.relative_to(build_dir).as_posix(),
+                'content': markdown
+            })
 
     except subprocess.CalledProcessError as e:
         logger.error(f"Docusaurus build process failed")
@@ -101,4 +135,78 @@ def parse_docusaurus(docs_path: Path, npm_install_args: Optional[List[str]] = No
         # If you want to keep the built site, comment out the rmtree below
         shutil.rmtree(build_dir, ignore_errors=True)
 
-    return parsed_docs
\ No newline at end of file
+    return parsed_docs
+
+def _source_url(filename: str, content: str) -> str:
+    """Return the path a docs page is served at, following its front matter slug."""
+    slug = front_matter_value(content, 'slug')
+    if slug is None:
+        return f"docs/{filename}"
+    if slug.startswith('/'):
+        return f"docs{slug}"
+    parent = Path(filename).parent.as_posix()
+    return f"docs/{slug}" if parent == '.' else f"docs/{parent}/{slug}"
+
+def _parse_sources(docs_path: Path) -> List[Dict[str, Any]]:
+    """
+    Read the current and versioned docs without building the site.
+
+    Args:
+        docs_path (Path): Path to the Docusaurus documentation source.
+
+    Returns:
+        List[Dict[str, Any]]: Markdown pages, current docs first, each version in sidebar order.
+    """
+    sets: List[Tuple[Path, str, List[Path]]] = [
+        (docs_path / 'docs', '', [docs_path / name for name in SIDEBAR_FILES])
+    ]
+    versions_dir = docs_path / 'versioned_docs'
+    if versions_dir.is_dir():
+        for version_dir in sorted(path for path in versions_dir.iterdir() if path.is_dir()):
+            sidebar = docs_path / 'versioned_sidebars' / f"{version_dir.name}-sidebars.json"
+            sets.append((version_dir, f"versioned_docs/{version_dir.name}/", [sidebar]))
+
+    parsed_docs = []
+    for docs_dir, prefix, sidebar_files in sets:
+        pages = []
+        for md_file in walk_files(docs_dir, ['.md', '.mdx']):
+            filename = md_file.relative_to(docs_dir).as_posix()
+            front_matter, body = split_front_matter(md_file.read_text(encoding='utf-8'))
+            if front_matter.get('draft') is True:
+                continue
+            body = strip_mdx(body)
+            title = page_title(front_matter, body, Path(filename).stem)
+            pages.append((_doc_id(filename, front_matter), filename, front_matter, with_title(title, body)))
+
+        sidebar_source = ''.join(path.read_text(encoding='utf-8') for path in sidebar_files if path.is_file())
+        # Sidebars of old versions prefix doc ids with the version ("version-1.0/intro")
+        version_prefix = f"{docs_dir.name}/" if prefix else ''
+        doc_ids = [doc_id for doc_id, *_ in pages]
+        order = sidebar_order(sidebar_source, doc_ids + [version_prefix + doc_id for doc_id in doc_ids])
+
+        def sort_key(page: Tuple[str, str, Dict[str, Any], str]) -> Tuple:
+            doc_id, filename, front_matter, _ = page
+            position = order.get(doc_id, order.get(version_prefix + doc_id))
+            if position is not None:
+                return (0, position)
+            sidebar_position = front_matter.get('sidebar_position')
+            if not isinstance(sidebar_position, (int, float)):
+                sidebar_position = float('inf')
+            return (1, str(Path(filename).parent), sidebar_position, filename)
+
+        for doc_id, filename, front_matter, content in sorted(pages, key=sort_key):
+            parsed_docs.append({
+                'type': 'docusaurus',
+                'filename': prefix + filename,
+                'content': content
+            })
+    logger.info(f"Read {len(parsed_docs)} Docusaurus pages from the sources")
+    return parsed_docs
+
+def _doc_id(filename: str, front_matter: Dict[str, Any]) -> str:
+    """Return the id sidebars refer to a doc by."""
+    parts = [_NUMBER_PREFIX_RE.sub('', part) for part in Path(filename).with_suffix('').parts]
+    doc_id = front_matter.get('id')
+    if isinstance(doc_id, str) and doc_id:
+        parts[-1] = doc_id
+    return '/'.join(parts)
@@ -7,25 +7,56 @@ Requires:
 """
 
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import shutil
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import subprocess
 import xml.etree.ElementTree as ET
+from docsforai.builder.profiles import doxygen_profile
 from docsforai.utils import run_subprocess_with_logging
+from docsforai.utils.subprocess_utils import process_pool_context
 
 logger = logging.getLogger(__name__)
 
-def parse_doxygen(docs_path: Path, doxygen_args: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+# Below this many compounds, parsing in worker processes costs more than it saves
+MIN_COMPOUNDS_FOR_POOL = 64
+
+SIMPLESECT_TITLES = {'return': 'Returns', 'see': 'See also', 'note': 'Note', 'warning': 'Warning'}
+PARAMETERLIST_TITLES = {
+    'param': 'Parameters',
+    'retval': 'Return values',
+    'exception': 'Throws',
+    'templateparam': 'Template parameters',
+}
+
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n[ \t]*\n(?:[ \t]*\n)+')
+
+def parse_doxygen(
+    docs_path: Path,
+    doxygen_args: Optional[List[str]] = None,
+    lean_build: bool = True,
+    doxygen_workers: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
     """
     Parse Doxygen documentation.
 
+    index.xml and the compound files are read with iterparse, clearing
+    elements once they are rendered, so memory stays bounded by the largest
+    member rather than the largest file. Compound files are parsed in a
+    process pool, in index order.
+
     Args:
         docs_path (Path): Path to the Doxygen configuration file.
         doxygen_args (Optional[List[str]]): Additional arguments for doxygen command.
+        lean_build (bool): Run doxygen with an overlay Doxyfile that only generates XML
+            into the output directory read here (see docsforai.builder.profiles).
+        doxygen_workers (Optional[int]): Processes parsing compound files. Defaults to the CPU count.
 
-    Returns:
-        List[Dict[str, Any]]: Parsed Doxygen documentation.
+    Yields:
+        Dict[str, Any]: Parsed Doxygen documentation, one compound at a time.
 
     Raises:
         FileNotFoundError: If Doxyfile is not found.
@@ -42,34 +73,25 @@ def parse_doxygen(docs_path: Path, doxygen_args: Optional[List[str]] = None) ->
     output_dir.mkdir(exist_ok=True)
 
     try:
-        run_subprocess_with_logging(['doxygen', str(doxyfile_path)], cwd=docs_path, additional_args=doxygen_args)
+        doxyfile = doxygen_profile(doxyfile_path, output_dir) if lean_build else doxyfile_path
+        run_subprocess_with_logging(['doxygen', str(doxyfile)], cwd=docs_path, additional_args=doxygen_args)
 
-        parsed_docs = []
         xml_dir = output_dir / 'xml'
-        if xml_dir.exists():
-            index_xml = xml_dir / 'index.xml'
-            if index_xml.exists():
-                tree = ET.parse(index_xml)
-                root = tree.getroot()
-
-                for compound in root.findall('.//compound'):
-                    kind = compound.get('kind')
-                    name = compound.find('name').text if compound.find('name') is not None else 'unknown'
-                    filename = compound.get('refid') + '.xml'
-
-                    compound_xml = xml_dir / filename
-                    if compound_xml.exists():
-                        compound_tree = ET.parse(compound_xml)
-                        compound_root = compound_tree.getroot()
-
-                        content = _parse_compound(compound_root, kind)
-                        parsed_docs.append({
-                            'type': f'doxygen_{kind}',
-                            'filename': f"{kind}_{name}.md",
-                            'content': content
-                        })
-
-        return parsed_docs
+        index_xml = xml_dir / 'index.xml'
+        if index_xml.exists():
+            compounds = [
+                (kind, name, xml_dir / f"{refid}.xml")
+                for kind, name, refid in _iter_index(index_xml)
+                if (xml_dir / f"{refid}.xml").exists()
+            ]
+            paths = [str(path) for _, _, path in compounds]
+            kinds = [kind for kind, _, _ in compounds]
+            for (kind, name, _), content in zip(compounds, _parse_compound_files(paths, kinds, doxygen_workers)):
+                yield {
+                    'type': f'doxygen_{kind}',
+                    'filename': f"{kind}_{name}.md",
+                    'content': content
+                }
 
     except subprocess.CalledProcessError as e:
         logger.error(f"Doxygen build process failed")
@@ -78,42 +100,124 @@ def parse_doxygen(docs_path: Path, doxygen_args: Optional[List[str]] = None) ->
         # Remove doxygen_output if you want ephemeral usage
         shutil.rmtree(output_dir, ignore_errors=True)
 
+def _iter_index(index_xml: Path) -> Iterator[Tuple[str, str, str]]:
+    """Yield (kind, name, refid) of the compounds listed in index.xml."""
+    for _, elem in ET.iterparse(index_xml, events=('end',)):
+        if elem.tag != 'compound':
+            continue
+        name = elem.find('name')
+        yield elem.get('kind'), name.text if name is not None and name.text else 'unknown', elem.get('refid')
+        elem.clear()
+
+def _parse_compound_files(paths: List[str], kinds: List[str], workers: Optional[int] = None) -> Iterator[str]:
+    """Render compound files to Markdown, in worker processes unless there are few of them."""
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1 or len(paths) < MIN_COMPOUNDS_FOR_POOL:
+        for path, kind in zip(paths, kinds):
+            yield _parse_compound_file(path, kind)
+        return
+
+    chunksize = max(1, min(64, len(paths) // (workers * 4)))
+    logger.info(f"Parsing {len(paths)} Doxygen compounds with {workers} workers (chunks of {chunksize})")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as pool:
+        yield from pool.map(_parse_compound_file, paths, kinds, chunksize=chunksize)
+
+def _parse_compound_file(path: str, kind: str) -> str:
+    """
+    Render a compound (class, namespace, file, ...) XML file to Markdown in one streaming pass.
 
-def _parse_compound(compound_root: ET.Element, kind: str) -> str:
-    """Parse a compound (class, namespace, etc.) from Doxygen XML."""
-    content = []
-    name = compound_root.find('.//compoundname')
-    name_text = name.text if name is not None else 'Unnamed'
-    content.append(f"# {kind.capitalize()}: {name_text}\n")
-
-    brief = compound_root.find('.//briefdescription')
-    if brief is not None and brief.text:
-        content.append(f"\n{brief.text.strip()}\n")
-
-    detailed = compound_root.find('.//detaileddescription')
-    if detailed is not None:
-        for para in detailed.findall('.//para'):
-            if para.text:
-                content.append(f"\n{para.text.strip()}\n")
-
-    for section in compound_root.findall('.//sectiondef'):
-        section_kind = section.get('kind')
-        content.append(f"\n## {section_kind.replace('_', ' ').capitalize()}\n")
-
-        for member in section.findall('memberdef'):
-            member_name = member.find('name').text if member.find('name') is not None else 'unknown'
-            member_type = member.find('type')
-            member_type_text = member_type.text if (member_type is not None and member_type.text) else ''
-            content.append(f"\n### {member_type_text} {member_name}\n")
-
-            member_brief = member.find('briefdescription')
-            if member_brief is not None and member_brief.text:
-                content.append(f"\n{member_brief.text.strip()}\n")
-
-            member_detailed = member.find('detaileddescription')
-            if member_detailed is not None:
-                for para in member_detailed.findall('.//para'):
-                    if para.text:
-                        content.append(f"\n{para.text.strip()}\n")
-
-    return '\n'.join(content)
\ No newline at end of file
+    Members are rendered and cleared as soon as they end; a section's heading
+    is known once its members are, so each section is assembled at its end.
+    """
+    name_text = 'Unnamed'
+    brief = detailed = ''
+    sections: List[str] = []
+    members: List[str] = []
+
+    for _, elem in ET.iterparse(path, events=('end',)):
+        tag = elem.tag
+        if tag == 'memberdef':
+            members.append(_render_member(elem))
+            elem.clear()
+        elif tag == 'sectiondef':
+            section_kind = elem.get('kind') or ''
+            sections.append(f"\n## {section_kind.replace('_', ' ').capitalize()}\n")
+            sections.extend(members)
+            members = []
+            elem.clear()
+        elif tag == 'compounddef':
+            name_text = elem.findtext('compoundname') or name_text
+            brief = _child_description(elem, 'briefdescription')
+            detailed = _child_description(elem, 'detaileddescription')
+            elem.clear()
+
+    content = [f"# {kind.capitalize()}: {name_text}\n"]
+    for text in (brief, detailed):
+        if text:
+            content.append(f"\n{text}\n")
+    content.extend(sections)
+    return '\n'.join(content)
+
+def _render_member(memberdef: ET.Element) -> str:
+    """Render a memberdef element: heading, then brief and detailed descriptions."""
+    member_type = memberdef.find('type')
+    type_text = ''.join(member_type.itertext()).strip() if member_type is not None else ''
+    name = memberdef.findtext('name') or 'unknown'
+    parts = [f"\n### {type_text} {name.strip()}\n"]
+    for tag in ('briefdescription', 'detaileddescription'):
+        text = _child_description(memberdef, tag)
+        if text:
+            parts.append(f"\n{text}\n")
+    return '\n'.join(parts)
+
+def _child_description(elem: ET.Element, tag: str) -> str:
+    child = elem.find(tag)
+    return _description_text(child) if child is not None else ''
+
+def _description_text(elem: ET.Element) -> str:
+    """Return the full text of a description, including markup, lists and code blocks."""
+    return _EXCESS_BLANK_LINES_RE.sub('\n\n', _inline(elem)).strip()
+
+def _inline(elem: ET.Element) -> str:
+    parts = [elem.text or '']
+    for child in elem:
+        parts.append(_render_child(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+def _render_child(child: ET.Element) -> str:
+    """Render one element of Doxygen's description markup."""
+    tag = child.tag
+    if tag == 'para':
+        return f"\n\n{_inline(child).strip()}\n\n"
+    if tag == 'computeroutput':
+        return f"`{''.join(child.itertext()).strip()}`"
+    if tag == 'bold':
+        return f"**{_inline(child)}**"
+    if tag == 'emphasis':
+        return f"*{_inline(child)}*"
+    if tag == 'programlisting':
+        lines = [''.join(codeline.itertext()) for codeline in child.iter('codeline')]
+        return "\n\n```\n" + '\n'.join(lines) + "\n```\n\n"
+    if tag in ('itemizedlist', 'orderedlist'):
+        items = [f"- {_description_text(item)}" for item in child.findall('listitem')]
+        return "\n\n" + '\n'.join(items) + "\n\n"
+    if tag == 'parameterlist':
+        items = []
+        for item in child.findall('parameteritem'):
+            names = ', '.join(''.join(name.itertext()).strip() for name in item.iter('parametername'))
+            description = item.find('parameterdescription')
+            items.append(f"- `{names}`: {_description_text(description) if description is not None else ''}")
+        title = PARAMETERLIST_TITLES.get(child.get('kind'), 'Parameters')
+        return f"\n\n**{title}:**\n\n" + '\n'.join(items) + "\n\n"
+    if tag == 'simplesect':
+        kind = child.get('kind') or ''
+        title = SIMPLESECT_TITLES.get(kind, kind.capitalize())
+        return f"\n\n**{title}:** {_description_text(child)}\n\n"
+    if tag == 'linebreak':
+        return '\n'
+    if tag == 'sp':
+        return ' '
+    if tag in ('title', 'xreftitle'):
+        return ''
+    return _inline(child)
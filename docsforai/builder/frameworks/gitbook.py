@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import json
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +65,7 @@ def parse_gitbook(docs_path: Path, config_file: Optional[str] = None) -> List[Di
             })
 
     # Parse all markdown
-    for md_file in docs_path.rglob('*.md'):
+    for md_file in walk_files(docs_path, ['.md']):
         if md_file.name != 'SUMMARY.md':
             with md_file.open('r', encoding='utf-8') as f:
                 content = f.read()
@@ -5,68 +5,117 @@ Requires:
 - `go` installed.
 """
 
+import itertools
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Deque, List, Dict, Any, Iterator, Optional, Tuple
 import subprocess
-import re
+from docsforai.utils import walk_files
 from docsforai.utils.subprocess_utils import run_subprocess_with_logging
 
 logger = logging.getLogger(__name__)
 
-def parse_godoc(docs_path: Path) -> List[Dict[str, Any]]:
+# Directories never holding modules of the project itself
+MODULE_EXCLUDE_DIRS = ['testdata', 'vendor']
+
+def parse_godoc(docs_path: Path, godoc_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
     """
     Parse Godoc documentation.
 
+    The packages of the project are listed with `go list ./...`, in the
+    workspace (go.work) or else in every module (go.mod) below `docs_path`.
+    `go doc -all` runs for each package in a pool of `godoc_workers`
+    threads, and one document per package is yielded in package order while
+    the following packages are still being documented.
+
     Args:
         docs_path (Path): Path to the Go project.
+        godoc_workers (Optional[int]): Concurrent `go doc` processes. Defaults to the CPU count.
 
-    Returns:
-        List[Dict[str, Any]]: Parsed Godoc documentation.
+    Yields:
+        Dict[str, Any]: Parsed Godoc documentation, one package at a time.
 
     Raises:
-        subprocess.CalledProcessError: If Godoc generation fails.
+        subprocess.CalledProcessError: If listing the packages fails.
     """
     logger.info(f"Parsing Godoc documentation at {docs_path}")
 
     try:
-        result = run_subprocess_with_logging(
-            ['go', 'doc', '-all'],
-            cwd=str(docs_path),
-            capture_output=True,
-            text=True
-        )
-        parsed_docs = _parse_godoc_output(result.stdout)
-        return parsed_docs
-
+        packages = [package for module_dir in _module_dirs(docs_path) for package in _list_packages(module_dir)]
     except subprocess.CalledProcessError as e:
-        logger.error(f"Godoc generation failed: {str(e)}")
+        logger.error(f"Listing Go packages failed: {str(e)}")
         raise
 
-def _parse_godoc_output(output: str) -> List[Dict[str, Any]]:
-    """Parse Godoc output."""
-    parsed_docs = []
-    current_package = None
-    current_content = []
-
-    for line in output.split('\n'):
-        if line.startswith('package '):
-            if current_package:
-                parsed_docs.append({
-                    'type': 'godoc_package',
-                    'filename': f"{current_package}.md",
-                    'content': '\n'.join(current_content)
-                })
-            current_package = line.split()[1]
-            current_content = [f"# Package: {current_package}\n"]
-        else:
-            current_content.append(line)
-
-    if current_package:
-        parsed_docs.append({
-            'type': 'godoc_package',
-            'filename': f"{current_package}.md",
-            'content': '\n'.join(current_content)
-        })
-
-    return parsed_docs
\ No newline at end of file
+    workers = max(1, min(godoc_workers or os.cpu_count() or 1, len(packages)))
+    logger.info(f"Documenting {len(packages)} Go packages with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Results are yielded in order; at most this many packages are documented ahead
+        pending: Deque[Tuple[str, 'Future[Optional[str]]']] = deque()
+        remaining = iter(packages)
+
+        def submit(package: Tuple[Path, str]) -> None:
+            module_dir, import_path = package
+            pending.append((import_path, pool.submit(_package_doc, module_dir, import_path)))
+
+        for package in itertools.islice(remaining, workers * 2):
+            submit(package)
+        while pending:
+            import_path, future = pending.popleft()
+            package = next(remaining, None)
+            if package is not None:
+                submit(package)
+            content = future.result()
+            if content is None:
+                continue
+            yield {
+                'type': 'godoc_package',
+                'filename': f"{import_path}.md",
+                'content': content
+            }
+
+def _module_dirs(docs_path: Path) -> List[Path]:
+    """Return the directories to list packages in: the workspace, or each module."""
+    if (docs_path / 'go.work').exists():
+        return [docs_path]
+    module_dirs = [
+        go_mod.parent for go_mod in walk_files(docs_path, ['.mod'], exclude=MODULE_EXCLUDE_DIRS)
+        if go_mod.name == 'go.mod'
+    ]
+    return module_dirs or [docs_path]
+
+def _list_packages(module_dir: Path) -> List[Tuple[Path, str]]:
+    """Return (module directory, import path) of the packages of a module or workspace."""
+    result = run_subprocess_with_logging(
+        ['go', 'list', '-e', '-f', '{{.ImportPath}}', './...'],
+        cwd=str(module_dir),
+        capture_output=True,
+        text=True
+    )
+    return [(module_dir, line.strip()) for line in result.stdout.splitlines() if line.strip()]
+
+def _package_doc(module_dir: Path, import_path: str) -> Optional[str]:
+    """Return the Markdown documentation of one package, or None if `go doc` fails."""
+    result = run_subprocess_with_logging(
+        ['go', 'doc', '-all', import_path],
+        cwd=str(module_dir),
+        check=False,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        logger.warning(f"go doc failed for {import_path}: {result.stderr.strip()}")
+        return None
+    return _parse_godoc_output(import_path, result.stdout)
+
+def _parse_godoc_output(import_path: str, output: str) -> str:
+    """Parse the `go doc -all` output of a package."""
+    lines = output.split('\n')
+    # The clause `package name // import "path"` is replaced by the heading
+    if lines and lines[0].startswith('package '):
+        lines = lines[1:]
+    body = '\n'.join(lines).strip('\n')
+    return f"# Package: {import_path}\n\n{body}\n"
@@ -7,34 +7,65 @@ Requires:
 """
 
 import logging
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import shutil
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterable, Optional, Set, Tuple
 import toml
 import subprocess
-from docsforai.converter.html_to_md import html_to_md
-from docsforai.utils import run_subprocess_with_logging
+from docsforai.builder.dedup import SourceRegistry, front_matter_value, page_key, split_front_matter
+from docsforai.builder.profiles import hugo_profile
+from docsforai.builder.shortcodes import ShortcodeExpander
+from docsforai.converter.html_to_md import convert_html_files
+from docsforai.utils import run_subprocess_with_logging, walk_files
 
 logger = logging.getLogger(__name__)
 
-def parse_hugo(docs_path: Path, hugo_args: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+HUGO_MODES = ['build', 'content']
+
+def parse_hugo(
+    docs_path: Path,
+    hugo_args: Optional[List[str]] = None,
+    prefer: Optional[str] = None,
+    hugo_mode: Optional[str] = None,
+    hugo_build_sections: Optional[List[str]] = None,
+    lean_build: bool = True
+) -> List[Dict[str, Any]]:
     """
     Parse Hugo documentation.
 
+    In 'build' mode (the default), the content files are read and the site is
+    also built with the `hugo` binary and converted from HTML. In 'content'
+    mode, front matter is parsed and shortcodes are expanded in Python
+    instead (see docsforai.builder.shortcodes), so the Hugo binary only runs
+    if some page types are listed in `hugo_build_sections`; only those pages
+    are taken from the built site.
+
     Args:
         docs_path (Path): Path to the Hugo documentation source.
         hugo_args (Optional[List[str]]): Additional arguments for hugo command.
+        prefer (Optional[str]): Version kept for pages that exist as source and as built HTML:
+            'source' (default), 'built' or 'both'. Only used in 'build' mode.
+        hugo_mode (Optional[str]): 'build' (default) or 'content'.
+        hugo_build_sections (Optional[List[str]]): In 'content' mode, page types (top-level
+            content sections, or the `type` front matter) whose pages are built with Hugo.
+        lean_build (bool): Skip page kinds without documentation content (feeds, sitemaps,
+            taxonomies) when building.
 
     Returns:
         List[Dict[str, Any]]: Parsed Hugo documentation.
 
     Raises:
+        ValueError: If the mode is not supported.
         FileNotFoundError: If config.toml is not found.
         toml.TomlDecodeError: If config.toml is invalid.
         subprocess.CalledProcessError: If Hugo build fails.
     """
     logger.info(f"Parsing Hugo documentation at {docs_path}")
 
+    hugo_mode = hugo_mode or 'build'
+    if hugo_mode not in HUGO_MODES:
+        raise ValueError(f"Unsupported Hugo mode: {hugo_mode}. Must be one of: {', '.join(HUGO_MODES)}")
+
     config_path = docs_path / 'config.toml'
     if not config_path.exists():
         logger.error("config.toml not found")
@@ -47,32 +78,75 @@ def parse_hugo(docs_path: Path, hugo_args: Optional[List[str]] = None) -> List[D
         logger.error(f"Invalid config.toml: {str(e)}")
         raise
 
+    content_dir = docs_path / 'content'
+    if hugo_mode == 'content':
+        parsed_docs, build_keys = _parse_content(docs_path, content_dir, config, set(hugo_build_sections or []))
+        if not build_keys:
+            return parsed_docs
+        logger.info(f"Building {len(build_keys)} pages of the sections {', '.join(sorted(hugo_build_sections))} with Hugo")
+
+        def select(html_files: Iterable[Path], build_dir: Path) -> List[Path]:
+            return [
+                html_file for html_file in html_files
+                if page_key(html_file.relative_to(build_dir).as_posix()) in build_keys
+            ]
+
+        return parsed_docs + _parse_built(docs_path, hugo_args, select, lean_build)
+
     parsed_docs = []
+    registry = SourceRegistry(prefer)
 
     # Markdown files in content/
-    content_dir = docs_path / 'content'
-    for md_file in content_dir.rglob('*.md'):
+    for md_file in walk_files(content_dir, ['.md']):
         with md_file.open('r', encoding='utf-8') as f:
             content = f.read()
+            filename = md_file.relative_to(content_dir).as_posix()
             parsed_docs.append({
                 'type': 'hugo',
-                'filename': md_file.relative_to(content_dir).as_posix(),
+                'filename': filename,
                 'content': content
             })
+            registry.add_source(filename, front_matter_value(content, 'url'))
+
+    built_docs = _parse_built(docs_path, hugo_args, registry.select_built, lean_build)
+    return registry.select_sources(parsed_docs) + built_docs
+
+def _parse_built(
+    docs_path: Path,
+    hugo_args: Optional[List[str]],
+    select: Callable[[Iterable[Path], Path], List[Path]],
+    lean_build: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Build the site with Hugo and convert the selected pages to Markdown.
+
+    Args:
+        docs_path (Path): Path to the Hugo documentation source.
+        hugo_args (Optional[List[str]]): Additional arguments for hugo command.
+        select (Callable[[Iterable[Path], Path], List[Path]]): Returns the built pages to
+            convert, given the HTML files and the build directory.
+        lean_build (bool): Whether to apply the lean Hugo profile.
+
+    Returns:
+        List[Dict[str, Any]]: Converted pages.
 
+    Raises:
+        subprocess.CalledProcessError: If Hugo build fails.
+    """
+    built_docs = []
     build_dir = docs_path / 'public'
     try:
-        run_subprocess_with_logging(['hugo'], cwd=docs_path, additional_args=hugo_args)
+        args = (hugo_profile() if lean_build else []) + list(hugo_args or [])
+        run_subprocess_with_logging(['hugo'], cwd=docs_path, additional_args=args)
 
         # Convert built HTML to MD
-        for html_file in build_dir.rglob('*.html'):
-            with html_file.open('r', encoding='utf-8') as f:
-                content = f.read()
-                parsed_docs.append({
-                    'type': 'hugo_built',
-                    'filename': html_file.relative_to(build_dir).as_posix(),
-                    'content': html_to_md(content)
-                })
+        html_files = select(walk_files(build_dir, ['.html']), build_dir)
+        for html_file, markdown in zip(html_files, convert_html_files(html_files, framework='hugo')):
+            built_docs.append({
+                'type': 'hugo_built',
+                'filename': html_file.relative_to(build_dir).as_posix(),
+                'content': markdown
+            })
 
     except subprocess.CalledProcessError as e:
         logger.error(f"Hugo build process failed")
@@ -81,4 +155,64 @@ def parse_hugo(docs_path: Path, hugo_args: Optional[List[str]] = None) -> List[D
         # Cleanup build if you don't need it
         shutil.rmtree(build_dir, ignore_errors=True)
 
-    return parsed_docs
+    return built_docs
+
+def _parse_content(
+    docs_path: Path,
+    content_dir: Path,
+    config: Dict[str, Any],
+    build_sections: Set[str]
+) -> Tuple[List[Dict[str, Any]], Set[str]]:
+    """
+    Read the content files and expand their shortcodes without building the site.
+
+    Drafts and headless bundles are skipped, as Hugo does not render them.
+
+    Args:
+        docs_path (Path): Path to the Hugo documentation source.
+        content_dir (Path): Content directory of the site.
+        config (Dict[str, Any]): Site configuration.
+        build_sections (Set[str]): Page types left to the Hugo build.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Set[str]]: Parsed pages, and the page keys of the pages
+        left to the Hugo build.
+    """
+    expander = ShortcodeExpander(docs_path, content_dir, config.get('params'))
+    pages = []
+    for md_file in walk_files(content_dir, ['.md']):
+        with md_file.open('r', encoding='utf-8') as f:
+            front_matter, body = split_front_matter(f.read())
+        if front_matter.get('draft') is True or front_matter.get('headless') is True:
+            continue
+        filename = md_file.relative_to(content_dir).as_posix()
+        url = expander.add_page(filename, front_matter)
+        pages.append((filename, front_matter, body, url))
+
+    parsed_docs = []
+    build_keys = set()
+    for filename, front_matter, body, url in pages:
+        if _page_type(filename, front_matter) in build_sections:
+            build_keys.add(page_key(url))
+            continue
+        content = expander.expand(body, filename)
+        title = front_matter.get('title')
+        if title and not content.lstrip().startswith('#'):
+            description = front_matter.get('description')
+            header = f"# {title}\n\n" + (f"{description}\n\n" if description else '')
+            content = header + content.lstrip('\r\n')
+        parsed_docs.append({
+            'type': 'hugo',
+            'filename': filename,
+            'content': content
+        })
+    logger.info(f"Extracted {len(parsed_docs)} Hugo pages from the content directory")
+    return parsed_docs, build_keys
+
+def _page_type(filename: str, front_matter: Dict[str, Any]) -> str:
+    """Return the Hugo page type: the `type` front matter, or the top-level section."""
+    page_type = front_matter.get('type')
+    if isinstance(page_type, str) and page_type:
+        return page_type
+    parts = PurePosixPath(filename).parts
+    return parts[0] if len(parts) > 1 else ''
@@ -5,25 +5,63 @@ Requires:
 - Ruby, bundler, and jekyll in PATH
 """
 
+import contextlib
+import hashlib
 import logging
+import platform
+import re
 from pathlib import Path
 import shutil
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import yaml
 import subprocess
-from docsforai.converter.html_to_md import html_to_md
-from docsforai.utils import run_subprocess_with_logging
+from docsforai.builder.dedup import SourceRegistry, front_matter_value
+from docsforai.builder.profiles import jekyll_profile
+from docsforai.converter.html_to_md import convert_html_files
+from docsforai.utils import run_subprocess_with_logging, walk_files
+from docsforai.utils.build_cache import (
+    MtimeManifest, build_cache_dir, cache_lock, prune_build_caches, touch_build_cache
+)
+from docsforai.utils.git_handler import get_remote_url, get_repo_root
 
 logger = logging.getLogger(__name__)
 
-def parse_jekyll(docs_path: Path, bundle_install_args: Optional[List[str]] = None, bundle_build_args: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+# Number of gem install directories kept in the cache
+MAX_CACHED_BUNDLES = 8
+
+METADATA_FILE = '.jekyll-metadata'
+
+_POST_FILENAME_RE = re.compile(r'^(?:.*/)?_posts/(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})-(?P<title>[^/]+)\.md$')
+
+def parse_jekyll(
+    docs_path: Path,
+    bundle_install_args: Optional[List[str]] = None,
+    bundle_build_args: Optional[List[str]] = None,
+    prefer: Optional[str] = None,
+    bundle_cache: bool = True,
+    jekyll_incremental: bool = False,
+    lean_build: bool = True
+) -> List[Dict[str, Any]]:
     """
     Parse Jekyll documentation.
 
+    Gems are installed into a directory of the build cache keyed by
+    Gemfile.lock, so builds of projects with the same lockfile only run
+    `bundle install` once. With `jekyll_incremental`, `_site` and
+    `.jekyll-metadata` are kept in a per-repository workspace and Jekyll runs
+    with `--incremental`, so rebuilds only regenerate changed pages.
+
     Args:
         docs_path (Path): Path to the Jekyll documentation source.
         bundle_install_args (Optional[List[str]]): Additional arguments for bundle install command.
         bundle_build_args (Optional[List[str]]): Additional arguments for bundle exec jekyll build command.
+        prefer (Optional[str]): Version kept for pages that exist as source and as built HTML:
+            'source' (default), 'built' or 'both'.
+        bundle_cache (bool): Whether to install gems into the shared gem cache.
+        jekyll_incremental (bool): Whether to keep the built site between builds and
+            build incrementally.
+        lean_build (bool): Build without feed and sitemap plugins, through an overlay config.
+            Skipped if `bundle_build_args` passes its own --config.
 
     Returns:
         List[Dict[str, Any]]: Parsed Jekyll documentation.
@@ -48,34 +86,163 @@ def parse_jekyll(docs_path: Path, bundle_install_args: Optional[List[str]] = Non
         raise
 
     parsed_docs = []
+    registry = SourceRegistry(prefer)
     # Parse .md
-    for md_file in docs_path.rglob('*.md'):
+    for md_file in walk_files(docs_path, ['.md']):
         with md_file.open('r', encoding='utf-8') as f:
             content = f.read()
+            filename = md_file.relative_to(docs_path).as_posix()
             parsed_docs.append({
                 'type': 'jekyll',
-                'filename': md_file.relative_to(docs_path).as_posix(),
+                'filename': filename,
                 'content': content
             })
+            registry.add_source(filename, _source_url(filename, content))
 
     build_dir = docs_path / '_site'
+    keep_site = False
     try:
-        run_subprocess_with_logging(['bundle', 'install'], cwd=docs_path, additional_args=bundle_install_args)
-        run_subprocess_with_logging(['bundle', 'exec', 'jekyll', 'build'], cwd=docs_path, additional_args=bundle_build_args)
+        lean = lean_build and '--config' not in (bundle_build_args or [])
+        profile = jekyll_profile(config_path, config) if lean else contextlib.nullcontext([])
+        with _bundle_env(docs_path, bundle_cache) as env, \
+                _site_workspace(docs_path, jekyll_incremental) as workspace, \
+                profile as profile_args:
+            build_args = profile_args + list(bundle_build_args or [])
+            if workspace is not None:
+                build_dir = workspace / '_site'
+                build_args = ['--incremental', '--destination', str(build_dir)] + build_args
+                keep_site = True
+            _bundle_install(docs_path, bundle_install_args, env)
+            run_subprocess_with_logging(
+                ['bundle', 'exec', 'jekyll', 'build'], cwd=docs_path, additional_args=build_args, env=env
+            )
 
-        for html_file in build_dir.rglob('*.html'):
-            with html_file.open('r', encoding='utf-8') as f:
-                content = f.read()
+            html_files = registry.select_built(walk_files(build_dir, ['.html']), build_dir)
+            parsed_docs = registry.select_sources(parsed_docs)
+            for html_file, markdown in zip(html_files, convert_html_files(html_files, framework='jekyll')):
                 parsed_docs.append({
                     'type': 'jekyll_built',
                     'filename': html_file.relative_to(build_dir).as_posix(),
-                    'content': html_to_md(content)
+                    'content': markdown
                 })
 
     except subprocess.CalledProcessError as e:
         logger.error(f"Jekyll build process failed")
         raise
     finally:
-        shutil.rmtree(build_dir, ignore_errors=True)
+        if not keep_site:
+            shutil.rmtree(build_dir, ignore_errors=True)
 
     return parsed_docs
+
+def _bundle_install(docs_path: Path, install_args: Optional[List[str]], env: Dict[str, str]) -> None:
+    """Run bundle install, unless the cached gems already satisfy the Gemfile."""
+    if env:
+        result = run_subprocess_with_logging(['bundle', 'check'], cwd=docs_path, check=False, env=env)
+        if result.returncode == 0:
+            logger.info("Gems from the build cache satisfy the Gemfile, skipping bundle install")
+            return
+    run_subprocess_with_logging(['bundle', 'install'], cwd=docs_path, additional_args=install_args, env=env)
+
+def _ruby_version() -> str:
+    """Return the version of the Ruby on PATH."""
+    try:
+        result = run_subprocess_with_logging(['ruby', '--version'], check=False)
+        return result.stdout.strip() or 'unknown'
+    except OSError:
+        return 'unknown'
+
+@contextlib.contextmanager
+def _bundle_env(docs_path: Path, enabled: bool) -> Iterator[Dict[str, str]]:
+    """
+    Provide the environment that points Bundler at the shared gem cache.
+
+    The gem directory is keyed by Gemfile.lock, Ruby version and platform, and
+    stays locked while the build uses it.
+
+    Yields:
+        Dict[str, str]: Environment variables for bundle commands (empty if the cache
+        is disabled, in use or the project has no Gemfile.lock).
+    """
+    lockfile = docs_path / 'Gemfile.lock'
+    if not enabled or not lockfile.is_file():
+        yield {}
+        return
+
+    key = {
+        'lockfile': hashlib.sha256(lockfile.read_bytes()).hexdigest(),
+        'ruby': _ruby_version(),
+        'platform': f"{platform.system()}-{platform.machine()}"
+    }
+    cache_dir = build_cache_dir('bundler', key)
+    if cache_dir is None:
+        yield {}
+        return
+
+    with cache_lock(cache_dir) as locked:
+        if not locked:
+            yield {}
+            return
+        logger.info(f"Using gem cache {cache_dir}")
+        touch_build_cache(cache_dir)
+        yield {'BUNDLE_PATH': str(cache_dir / 'bundle')}
+    prune_build_caches('bundler', MAX_CACHED_BUNDLES, exclude=cache_dir)
+
+@contextlib.contextmanager
+def _site_workspace(docs_path: Path, enabled: bool) -> Iterator[Optional[Path]]:
+    """
+    Provide a persistent directory for the built site of `docs_path`.
+
+    The workspace is keyed by repository and documentation path. Jekyll keeps
+    its regeneration state in `.jekyll-metadata` in the source directory, which
+    is moved between the workspace and the checkout around the build. Files of
+    the source directory that are unchanged since the previous build get back
+    their previous modification time, which is what Jekyll compares to find changed
+    pages. The metadata records absolute paths, so the checkout must be at the
+    same location as before.
+
+    Yields:
+        Optional[Path]: The workspace directory, or None if incremental builds are
+        disabled or the workspace is in use.
+    """
+    if not enabled:
+        yield None
+        return
+
+    repo_root = get_repo_root(docs_path) or docs_path
+    key = {
+        'repository': get_remote_url(repo_root) or str(repo_root.resolve()),
+        'docs_path': docs_path.resolve().relative_to(repo_root.resolve()).as_posix()
+    }
+    workspace = build_cache_dir('jekyll', key)
+    if workspace is None:
+        yield None
+        return
+
+    with cache_lock(workspace) as locked:
+        if not locked:
+            yield None
+            return
+        manifest = MtimeManifest(workspace / 'manifest.json')
+        # Jekyll only reads the source directory
+        manifest.restore(docs_path, walk_files(docs_path))
+        if (workspace / METADATA_FILE).exists():
+            shutil.copy2(workspace / METADATA_FILE, docs_path / METADATA_FILE)
+        logger.info(f"Building Jekyll site incrementally in {workspace}")
+        try:
+            yield workspace
+        finally:
+            if (docs_path / METADATA_FILE).exists():
+                shutil.copy2(docs_path / METADATA_FILE, workspace / METADATA_FILE)
+            manifest.record()
+
+def _source_url(filename: str, content: str) -> Optional[str]:
+    """Return the path a page is served at if it differs from its filename (permalinks, posts)."""
+    permalink = front_matter_value(content, 'permalink')
+    if permalink is not None:
+        return permalink
+    match = _POST_FILENAME_RE.match(filename)
+    if match:
+        # Default post permalink: /:year/:month/:day/:title.html
+        return f"{match.group('year')}/{match.group('month')}/{match.group('day')}/{match.group('title')}.html"
+    return None
@@ -7,22 +7,28 @@ Requires:
 
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterator
 import subprocess
 import json
 import shutil
+from docsforai.builder.node_deps import install_node_dependencies
 
 logger = logging.getLogger(__name__)
 
-def parse_jsdoc(docs_path: Path) -> List[Dict[str, Any]]:
+def parse_jsdoc(docs_path: Path, node_modules_cache: bool = True) -> Iterator[Dict[str, Any]]:
     """
     Parse JSDoc documentation.
 
+    If the project has a package.json but no node_modules, its dependencies
+    (which provide the jsdoc-json template) are installed first.
+
     Args:
         docs_path (Path): Path to the JavaScript source files.
+        node_modules_cache (bool): Whether to reuse node_modules installed by earlier builds
+            with the same lockfile and Node version.
 
-    Returns:
-        List[Dict[str, Any]]: Parsed JSDoc documentation.
+    Yields:
+        Dict[str, Any]: Parsed JSDoc documentation, one item at a time.
 
     Raises:
         subprocess.CalledProcessError: If JSDoc generation fails.
@@ -34,6 +40,9 @@ def parse_jsdoc(docs_path: Path) -> List[Dict[str, Any]]:
     output_dir.mkdir(exist_ok=True)
 
     try:
+        if (docs_path / 'package.json').exists() and not (docs_path / 'node_modules').exists():
+            install_node_dependencies(docs_path, use_cache=node_modules_cache)
+
         subprocess.run([
             'jsdoc',
             '-r',
@@ -43,7 +52,6 @@ def parse_jsdoc(docs_path: Path) -> List[Dict[str, Any]]:
             '-q', 'format=json'
         ], check=True, cwd=str(docs_path))
 
-        parsed_docs = []
         json_file = output_dir / 'jsdoc.json'
         with json_file.open('r') as f:
             jsdoc_data = json.load(f)
@@ -51,13 +59,11 @@ def parse_jsdoc(docs_path: Path) -> List[Dict[str, Any]]:
         for item in jsdoc_data:
             content = _parse_jsdoc_item(item)
             filename = f"{item['name']}.md"
-            parsed_docs.append({
+            yield {
                 'type': f"jsdoc_{item['kind']}",
                 'filename': filename,
                 'content': content
-            })
-
-        return parsed_docs
+            }
 
     except subprocess.CalledProcessError as e:
         logger.error(f"JSDoc generation failed: {str(e)}")
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import List, Dict, Any
 import nbformat
 from nbconvert import MarkdownExporter
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ def parse_jupyter(docs_path: Path) -> List[Dict[str, Any]]:
     parsed_docs = []
     exporter = MarkdownExporter()
 
-    for ipynb_file in docs_path.rglob('*.ipynb'):
+    for ipynb_file in walk_files(docs_path, ['.ipynb']):
         try:
             with ipynb_file.open('r', encoding='utf-8') as f:
                 nb = nbformat.read(f, as_version=4)
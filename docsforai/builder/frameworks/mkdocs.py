@@ -5,15 +5,19 @@ Requires:
 - mkdocs installed (Python-based)
 """
 
+import contextlib
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union
 import yaml
 from yaml.nodes import ScalarNode
 import subprocess
 import shutil
 import os
-from docsforai.converter.html_to_md import html_to_md
+from docsforai.builder.dedup import SourceRegistry
+from docsforai.builder.profiles import mkdocs_profile
+from docsforai.converter.html_to_md import convert_html_files
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +38,16 @@ MkDocsLoader.add_multi_constructor(
     _construct_python_name
 )
 
-def parse_mkdocs(docs_path: Path) -> List[Dict[str, Any]]:
+def parse_mkdocs(docs_path: Path, prefer: Optional[str] = None, lean_build: bool = True) -> List[Dict[str, Any]]:
     """
     Parse MkDocs documentation.
 
     Args:
         docs_path (Path): Path to the MkDocs documentation source.
+        prefer (Optional[str]): Version kept for pages that exist as source and as built HTML:
+            'source' (default), 'built' or 'both'.
+        lean_build (bool): Build with a config inheriting mkdocs.yml without plugins that
+            only decorate pages or write extra files (see docsforai.builder.profiles).
 
     Returns:
         List[Dict[str, Any]]: Parsed MkDocs documentation.
@@ -54,10 +62,11 @@ def parse_mkdocs(docs_path: Path) -> List[Dict[str, Any]]:
     mkdocs_yaml = docs_path / 'mkdocs.yml'
     if not mkdocs_yaml.exists():
         # check for mkdocs.yml in subdirs
-        for subdir in docs_path.rglob('mkdocs.yml'):
-            mkdocs_yaml = subdir
-            docs_path = subdir.parent
-            break
+        for subdir in walk_files(docs_path, ['.yml']):
+            if subdir.name == 'mkdocs.yml':
+                mkdocs_yaml = subdir
+                docs_path = subdir.parent
+                break
         if not mkdocs_yaml.exists():
             logger.error("mkdocs.yml not found")
             raise FileNotFoundError("mkdocs.yml not found")
@@ -70,6 +79,8 @@ def parse_mkdocs(docs_path: Path) -> List[Dict[str, Any]]:
         raise
 
     nav = config.get('nav', [])
+    # site_dir is relative to the directory of mkdocs.yml, like docs_dir
+    build_dir = mkdocs_yaml.parent / config.get('site_dir', 'site')
     docs_dir = config.get('docs_dir', 'docs')
     if os.path.isabs(docs_dir):
         docs_path = Path(docs_dir)
@@ -82,27 +93,37 @@ def parse_mkdocs(docs_path: Path) -> List[Dict[str, Any]]:
 
     if not parsed_docs:
         logger.info("No files found in nav, searching for markdown files directly.")
-        for md_file in docs_path.rglob('*.md'):
+        for md_file in walk_files(docs_path, ['.md']):
             relative_path = md_file.relative_to(docs_path)
             _parse_markdown_file(md_file, str(relative_path), parsed_docs)
 
-    build_dir = docs_path / 'site'
+    registry = SourceRegistry(prefer)
+    seen_filenames = set()
+    for doc in parsed_docs:
+        registry.add_source(doc['filename'])
+        seen_filenames.add(doc['filename'])
+
     try:
-        subprocess.run(['mkdocs', 'build', '-f', str(mkdocs_yaml.absolute())], 
-                       cwd=str(mkdocs_yaml.parent), check=True)
+        profile = mkdocs_profile(mkdocs_yaml, MkDocsLoader) if lean_build else contextlib.nullcontext(mkdocs_yaml)
+        with profile as build_config:
+            subprocess.run(['mkdocs', 'build', '-f', str(build_config.absolute())],
+                           cwd=str(mkdocs_yaml.parent), check=True)
 
-        for md_file in build_dir.rglob('*.md'):
+        for md_file in walk_files(build_dir, ['.md']):
             relative_path = md_file.relative_to(build_dir)
-            if not any(doc['filename'] == str(relative_path) for doc in parsed_docs):
+            if str(relative_path) not in seen_filenames:
+                seen_filenames.add(str(relative_path))
                 _parse_markdown_file(md_file, str(relative_path), parsed_docs)
 
         # Convert .html in site/ to Markdown
-        for html_file in build_dir.rglob('*.html'):
+        html_files = registry.select_built(walk_files(build_dir, ['.html']), build_dir)
+        parsed_docs = registry.select_sources(parsed_docs)
+        for html_file, markdown in zip(html_files, convert_html_files(html_files, framework='mkdocs')):
             relative_path = html_file.relative_to(build_dir)
             parsed_docs.append({
                 'type': 'mkdocs_built',
                 'filename': str(relative_path),
-                'content': html_to_md(html_file.read_text(encoding='utf-8'))
+                'content': markdown
             })
 
     except subprocess.CalledProcessError as e:
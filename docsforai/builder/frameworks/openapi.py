@@ -13,12 +13,19 @@ import json
 
 logger = logging.getLogger(__name__)
 
+SPEC_FILENAMES = [
+    'swagger.yaml', 'swagger.yml', 'swagger.json',
+    'openapi.yaml', 'openapi.yml', 'openapi.json',
+    'api.yaml', 'api.yml', 'api.json'
+]
+
 def parse_openapi(docs_path: Path) -> List[Dict[str, Any]]:
     """
     Parse OpenAPI documentation.
 
     Args:
-        docs_path (Path): Path to the OpenAPI specification file.
+        docs_path (Path): Path to the OpenAPI specification file, or to a directory
+            containing specification files (swagger.yaml, openapi.json, ...).
 
     Returns:
         List[Dict[str, Any]]: Parsed OpenAPI documentation.
@@ -28,6 +35,15 @@ def parse_openapi(docs_path: Path) -> List[Dict[str, Any]]:
     """
     logger.info(f"Parsing OpenAPI documentation at {docs_path}")
 
+    if docs_path.is_dir():
+        spec_files = [docs_path / name for name in SPEC_FILENAMES if (docs_path / name).is_file()]
+        if not spec_files:
+            raise ValueError(f"No OpenAPI specification found in {docs_path}")
+        parsed_docs = []
+        for spec_file in spec_files:
+            parsed_docs.extend(parse_openapi(spec_file))
+        return parsed_docs
+
     if docs_path.suffix in ['.yaml', '.yml']:
         with docs_path.open('r', encoding='utf-8') as f:
             try:
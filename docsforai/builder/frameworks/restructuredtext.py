@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import List, Dict, Any
 from docutils.core import publish_parts
 from docutils.writers.html4css1 import Writer
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,7 @@ def parse_restructuredtext(docs_path: Path) -> List[Dict[str, Any]]:
     logger.info(f"Parsing reStructuredText documentation at {docs_path}")
 
     parsed_docs = []
-    for rst_file in docs_path.rglob('*.rst'):
+    for rst_file in walk_files(docs_path, ['.rst']):
         try:
             content = rst_file.read_text(encoding='utf-8')
             html_parts = publish_parts(
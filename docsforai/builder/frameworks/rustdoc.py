@@ -3,26 +3,54 @@ Rustdoc documentation parser for DocsForAI.
 
 Requires:
 - Rust toolchain (cargo, rustc)
+- A nightly toolchain for `rustdoc_format: json`
 """
 
+import contextlib
+import itertools
+import json
 import logging
+import os
 from pathlib import Path
 import shutil
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import subprocess
-import json
+from docsforai.builder.rustdoc_json import parse_rustdoc_json
+from docsforai.utils import run_subprocess_with_logging, walk_files
+from docsforai.utils.build_cache import (
+    MtimeManifest, build_cache_dir, cache_lock, prune_build_caches, touch_build_cache
+)
+from docsforai.utils.git_handler import get_remote_url, get_repo_root
 
 logger = logging.getLogger(__name__)
 
-def parse_rustdoc(docs_path: Path) -> List[Dict[str, Any]]:
+# Number of Cargo target directories kept in the cache; they hold compiled dependencies
+MAX_CACHED_TARGETS = 4
+
+RUSTDOC_JSON_FLAGS = '-Z unstable-options --output-format json'
+
+def parse_rustdoc(
+    docs_path: Path,
+    cargo_target_cache: bool = True,
+    rustdoc_format: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
     """
     Parse Rustdoc documentation.
 
+    Cargo builds into a `CARGO_TARGET_DIR` in the build cache, keyed by crate
+    (repository and path) and toolchain, so dependencies are compiled once
+    and later builds only re-document the crate. With the 'json' format,
+    rustdoc's JSON output is read item by item (see
+    docsforai.builder.rustdoc_json), with signatures and full documentation.
+
     Args:
         docs_path (Path): Path to the Rust project.
+        cargo_target_cache (bool): Whether to build in the shared Cargo target directory.
+        rustdoc_format (Optional[str]): Rustdoc output read: 'html' (default, the search
+            index) or 'json' (requires a nightly toolchain).
 
-    Returns:
-        List[Dict[str, Any]]: Parsed Rustdoc documentation.
+    Yields:
+        Dict[str, Any]: Parsed Rustdoc documentation.
 
     Raises:
         subprocess.CalledProcessError: If Rustdoc generation fails.
@@ -30,41 +58,151 @@ def parse_rustdoc(docs_path: Path) -> List[Dict[str, Any]]:
     """
     logger.info(f"Parsing Rustdoc documentation at {docs_path}")
 
-    output_dir = docs_path / 'target' / 'doc'
+    with _cargo_target_dir(docs_path, cargo_target_cache) as target_dir:
+        cached = target_dir is not None
+        target_dir = target_dir or docs_path / 'target'
+        output_dir = target_dir / 'doc'
+        env = {'CARGO_TARGET_DIR': str(target_dir)}
+        if rustdoc_format == 'json':
+            env['RUSTDOCFLAGS'] = f"{os.environ.get('RUSTDOCFLAGS', '')} {RUSTDOC_JSON_FLAGS}".strip()
+
+        try:
+            run_subprocess_with_logging([
+                'cargo', 'doc',
+                '--no-deps',
+                '--document-private-items'
+            ], cwd=docs_path, env=env)
+
+            if rustdoc_format == 'json':
+                for json_file in _crate_json_files(docs_path, output_dir):
+                    yield from parse_rustdoc_json(json_file)
+            else:
+                yield from _parse_search_index(output_dir)
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Rustdoc generation failed: {str(e)}")
+            raise
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid Rustdoc JSON output: {str(e)}")
+            raise
+        finally:
+            # Cargo only re-documents crates whose doc output it remembers as stale
+            if not cached:
+                shutil.rmtree(output_dir, ignore_errors=True)
+
+def _parse_search_index(output_dir: Path) -> List[Dict[str, Any]]:
+    """Read the items of the HTML output's search index."""
+    parsed_docs = []
+    json_file = output_dir / 'search-index.js'
+    with json_file.open('r') as f:
+        json_content = f.read().replace('searchIndex=', '')
+        rustdoc_data = json.loads(json_content)
+
+    for item in rustdoc_data['index']:
+        content = _parse_rustdoc_item(item, rustdoc_data)
+        filename = f"{item['name'].replace('::', '_')}.md"
+
+        parsed_docs.append({
+            'type': f"rustdoc_{item['type']}",
+            'filename': filename,
+            'content': content
+        })
+
+    return parsed_docs
+
+def _crate_json_files(docs_path: Path, output_dir: Path) -> List[Path]:
+    """
+    Return the JSON output of the project's own crates.
+
+    The doc directory of a cached target directory also holds the output of
+    earlier builds, so only the crates `cargo metadata` lists are read.
+    """
+    result = run_subprocess_with_logging(
+        ['cargo', 'metadata', '--no-deps', '--format-version', '1'], cwd=docs_path
+    )
+    names: List[str] = []
+    for package in json.loads(result.stdout).get('packages', []):
+        for target in package.get('targets', []):
+            if set(target.get('kind', [])) & {'lib', 'rlib', 'dylib', 'proc-macro', 'bin'}:
+                names.append(target['name'].replace('-', '_'))
+    json_files = [output_dir / f"{name}.json" for name in dict.fromkeys(names)]
+    return [json_file for json_file in json_files if json_file.exists()]
+
+def _toolchain_version(docs_path: Path) -> str:
+    """Return the version of the toolchain rustup selects for the project."""
+    try:
+        result = run_subprocess_with_logging(['rustc', '-vV'], cwd=docs_path, check=False)
+        return result.stdout.strip() or 'unknown'
+    except OSError:
+        return 'unknown'
+
+def _package_dirs(docs_path: Path, repo_root: Path) -> List[Path]:
+    """
+    Return the directories of the packages `cargo metadata` lists (the crate or workspace members).
 
+    Falls back to `docs_path` if the metadata cannot be read. Directories outside
+    `repo_root` or inside another returned directory are left out.
+    """
     try:
-        subprocess.run([
-            'cargo', 'doc',
-            '--no-deps',
-            '--document-private-items'
-        ], check=True, cwd=str(docs_path))
-
-        parsed_docs = []
-        json_file = output_dir / 'search-index.js'
-        with json_file.open('r') as f:
-            json_content = f.read().replace('searchIndex=', '')
-            rustdoc_data = json.loads(json_content)
-
-        for item in rustdoc_data['index']:
-            content = _parse_rustdoc_item(item, rustdoc_data)
-            filename = f"{item['name'].replace('::', '_')}.md"
-
-            parsed_docs.append({
-                'type': f"rustdoc_{item['type']}",
-                'filename': filename,
-                'content': content
-            })
-
-        return parsed_docs
-
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Rustdoc generation failed: {str(e)}")
-        raise
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid Rustdoc JSON output: {str(e)}")
-        raise
-    finally:
-        shutil.rmtree(output_dir, ignore_errors=True)
+        result = run_subprocess_with_logging(
+            ['cargo', 'metadata', '--no-deps', '--format-version', '1'], cwd=docs_path, check=False
+        )
+        packages = json.loads(result.stdout).get('packages', []) if result.returncode == 0 else []
+    except (OSError, ValueError) as e:
+        logger.debug(f"Cannot read Cargo metadata of {docs_path}: {str(e)}")
+        packages = []
+
+    root = repo_root.resolve()
+    dirs = sorted({
+        Path(package['manifest_path']).resolve().parent
+        for package in packages if package.get('manifest_path')
+    })
+    dirs = [path for path in dirs if path == root or root in path.parents]
+    dirs = [path for path in dirs if not any(other in path.parents for other in dirs)]
+    return dirs or [docs_path.resolve()]
+
+@contextlib.contextmanager
+def _cargo_target_dir(docs_path: Path, enabled: bool) -> Iterator[Optional[Path]]:
+    """
+    Provide a persistent Cargo target directory for the crate at `docs_path`.
+
+    The directory is keyed by repository, crate path and toolchain. Cargo
+    decides whether the crate's own sources changed by their modification
+    times, so files of the workspace members unchanged since the previous
+    build get back their previous modification time.
+
+    Yields:
+        Optional[Path]: The target directory, or None if the cache is disabled or in use.
+    """
+    if not enabled:
+        yield None
+        return
+
+    repo_root = get_repo_root(docs_path) or docs_path
+    key = {
+        'repository': get_remote_url(repo_root) or str(repo_root.resolve()),
+        'crate': docs_path.resolve().relative_to(repo_root.resolve()).as_posix(),
+        'toolchain': _toolchain_version(docs_path)
+    }
+    cache_dir = build_cache_dir('cargo', key)
+    if cache_dir is None:
+        yield None
+        return
+
+    with cache_lock(cache_dir) as locked:
+        if not locked:
+            yield None
+            return
+        manifest = MtimeManifest(cache_dir / 'manifest.json')
+        files = itertools.chain.from_iterable(walk_files(path) for path in _package_dirs(docs_path, repo_root))
+        manifest.restore(repo_root.resolve(), files)
+        touch_build_cache(cache_dir)
+        logger.info(f"Using Cargo target cache {cache_dir}")
+        try:
+            yield cache_dir / 'target'
+        finally:
+            manifest.record()
+    prune_build_caches('cargo', MAX_CACHED_TARGETS, exclude=cache_dir)
 
 #TODO: Add signature
 def _parse_rustdoc_item(item: Dict[str, Any], rustdoc_data: Dict[str, Any]) -> str:
@@ -84,4 +222,4 @@ def _parse_rustdoc_item(item: Dict[str, Any], rustdoc_data: Dict[str, Any]) -> s
     if 'parent' in item:
         content.append(f"\n## Defined in: {item['parent']}\n")
 
-    return '\n'.join(content)
\ No newline at end of file
+    return '\n'.join(content)
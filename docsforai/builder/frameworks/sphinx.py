@@ -2,23 +2,67 @@
 Sphinx documentation parser for DocsForAI.
 """
 
+import contextlib
 import logging
+import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional
 import subprocess
 import shutil
-from docsforai.converter.html_to_md import html_to_md
-from docsforai.utils import run_subprocess_with_logging
+from docsforai.builder.profiles import sphinx_profile
+from docsforai.builder.sphinx_runner import resolve_jobs, run_sphinx
+from docsforai.converter.html_to_md import convert_html_files
+from docsforai.utils import run_subprocess_with_logging, walk_files
+from docsforai.utils.build_cache import (
+    MtimeManifest, build_cache_dir, cache_lock, prune_build_caches, touch_build_cache
+)
+from docsforai.utils.git_handler import get_remote_url, get_repo_root
 
 logger = logging.getLogger(__name__)
 
-def parse_sphinx(docs_path: Path, sphinx_args: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+SPHINX_BUILDERS = ['auto', 'markdown', 'text', 'html']
+
+# Number of doctree caches kept
+MAX_CACHED_DOCTREES = 8
+
+# Output suffix of the builders whose pages are read as they are
+DIRECT_BUILDER_SUFFIXES = {'markdown': '.md', 'text': '.txt'}
+
+def parse_sphinx(
+    docs_path: Path,
+    sphinx_args: Optional[List[str]] = None,
+    sphinx_builder: Optional[str] = None,
+    sphinx_cache: bool = False,
+    sphinx_runner: Optional[str] = None,
+    sphinx_jobs: Optional[int] = None,
+    lean_build: bool = True
+) -> List[Dict[str, Any]]:
     """
     Parse Sphinx documentation.
 
+    By default the pages are written directly as Markdown with the `markdown`
+    builder of sphinx-markdown-builder, which skips HTML theming, search
+    indexes, static assets and the HTML-to-Markdown conversion. If that builder
+    is not installed or its build fails, the HTML builder is used and its pages
+    are converted. The plain-text builder (reStructuredText-style output) is
+    only used when requested.
+
+    With `sphinx_cache`, doctrees and the pickled environment are kept in the
+    build cache between runs, so Sphinx only re-reads changed sources.
+
+    Sphinx reads and writes in parallel with `sphinx_jobs` jobs (the CPU
+    budget by default). With sphinx_runner='inprocess' the build runs in a warm
+    worker process that is reused by later builds.
+
     Args:
         docs_path (Path): Path to the Sphinx documentation source.
         sphinx_args (Optional[List[str]]): Additional arguments for sphinx-build command.
+        sphinx_builder (Optional[str]): 'auto' (default), 'markdown', 'text' or 'html'.
+        sphinx_cache (bool): Keep doctrees between builds of the same repository.
+        sphinx_runner (Optional[str]): 'subprocess' (default) or 'inprocess'.
+        sphinx_jobs (Optional[int]): Number of parallel Sphinx jobs.
+        lean_build (bool): Turn off HTML outputs that are not converted (source copies,
+            general and domain indexes) when the HTML builder runs.
 
     Returns:
         List[Dict[str, Any]]: Parsed Sphinx documentation.
@@ -26,6 +70,7 @@ def parse_sphinx(docs_path: Path, sphinx_args: Optional[List[str]] = None) -> Li
     Raises:
         subprocess.CalledProcessError: If Sphinx build fails.
         FileNotFoundError: If required files are missing.
+        ValueError: If the requested builder or runner is not supported, or the builder is not installed.
     """
     logger.info(f"Parsing Sphinx documentation at {docs_path}")
 
@@ -34,21 +79,36 @@ def parse_sphinx(docs_path: Path, sphinx_args: Optional[List[str]] = None) -> Li
         logger.error("conf.py not found in Sphinx docs directory")
         raise FileNotFoundError("conf.py not found in Sphinx docs directory")
 
+    builder = _resolve_builder(sphinx_builder)
     build_dir = docs_path / '_build'
     build_dir.mkdir(exist_ok=True)
 
+    jobs = resolve_jobs(sphinx_jobs)
+    # Modules of the documented repository must not outlive the build in a reused worker
+    isolate_dir = get_repo_root(docs_path) if sphinx_runner == 'inprocess' else None
+
+    def run(builder_name: str, args: List[str]) -> None:
+        run_sphinx(builder_name, docs_path, build_dir, args, runner=sphinx_runner, isolate_dir=isolate_dir)
+
     try:
-        run_subprocess_with_logging(['sphinx-build', '-b', 'html', str(docs_path), str(build_dir)], additional_args=sphinx_args)
-
-        parsed_docs = []
-        for html_file in build_dir.rglob('*.html'):
-            with html_file.open('r', encoding='utf-8') as f:
-                content = f.read()
-                parsed_docs.append({
-                    'type': 'sphinx',
-                    'filename': html_file.relative_to(build_dir).as_posix(),
-                    'content': html_to_md(content)
-                })
+        with _doctree_cache(docs_path, sphinx_cache) as cache_args:
+            build_args = cache_args + (['-j', str(jobs)] if jobs > 1 else [])
+            # Before the user's arguments, so that their -D settings win
+            html_args = build_args + (sphinx_profile('html') if lean_build else []) + list(sphinx_args or [])
+            build_args += list(sphinx_args or [])
+            logger.debug(f"Building with {jobs} Sphinx jobs")
+            if builder == 'html':
+                parsed_docs = _build_html(run, build_dir, html_args)
+            else:
+                try:
+                    parsed_docs = _build_direct(run, build_dir, builder, build_args)
+                except subprocess.CalledProcessError:
+                    if sphinx_builder not in (None, 'auto'):
+                        raise
+                    logger.warning(f"Sphinx {builder} build failed, falling back to the HTML builder")
+                    shutil.rmtree(build_dir, ignore_errors=True)
+                    build_dir.mkdir(exist_ok=True)
+                    parsed_docs = _build_html(run, build_dir, html_args)
 
         index_path = docs_path / 'index.rst'
         if index_path.exists():
@@ -65,3 +125,113 @@ def parse_sphinx(docs_path: Path, sphinx_args: Optional[List[str]] = None) -> Li
         raise
     finally:
         shutil.rmtree(build_dir, ignore_errors=True)
+
+def _sphinx_version() -> str:
+    """Return the version of the installed Sphinx."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+        return version('sphinx')
+    except (ImportError, PackageNotFoundError):
+        result = run_subprocess_with_logging(['sphinx-build', '--version'], check=False)
+        return result.stdout.strip() or 'unknown'
+
+@contextlib.contextmanager
+def _doctree_cache(docs_path: Path, enabled: bool) -> Iterator[List[str]]:
+    """
+    Provide a persistent doctree directory for the build of `docs_path`.
+
+    The directory is keyed by repository, documentation path, Sphinx and
+    Python version. Before the build, files of the checkout that are unchanged
+    since the previous build get back their previous modification time, which
+    is what Sphinx compares against to find outdated documents. Sphinx also
+    requires the source directory to be at the same absolute path as before.
+
+    Yields:
+        List[str]: sphinx-build arguments selecting the doctree directory (empty if the
+        cache is disabled or in use).
+    """
+    if not enabled:
+        yield []
+        return
+
+    repo_root = get_repo_root(docs_path) or docs_path
+    key = {
+        'repository': get_remote_url(repo_root) or str(repo_root.resolve()),
+        'docs_path': docs_path.resolve().relative_to(repo_root.resolve()).as_posix(),
+        'sphinx': _sphinx_version(),
+        'python': f"{sys.version_info[0]}.{sys.version_info[1]}"
+    }
+    cache_dir = build_cache_dir('sphinx', key)
+    if cache_dir is None:
+        yield []
+        return
+
+    with cache_lock(cache_dir) as locked:
+        if not locked:
+            yield []
+            return
+        manifest = MtimeManifest(cache_dir / 'manifest.json')
+        manifest.restore(repo_root, walk_files(repo_root))
+        touch_build_cache(cache_dir)
+        logger.info(f"Using Sphinx doctree cache {cache_dir}")
+        try:
+            yield ['-d', str(cache_dir / 'doctrees')]
+        finally:
+            manifest.record()
+    prune_build_caches('sphinx', MAX_CACHED_DOCTREES, exclude=cache_dir)
+
+def _markdown_builder_available() -> bool:
+    """Return True if a Sphinx builder named 'markdown' is installed."""
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group='sphinx.builders')
+    except (ImportError, TypeError):
+        return False
+    return any(ep.name == 'markdown' for ep in eps)
+
+def _resolve_builder(sphinx_builder: Optional[str]) -> str:
+    """Return the Sphinx builder to run for the requested extraction mode."""
+    sphinx_builder = sphinx_builder or 'auto'
+    if sphinx_builder not in SPHINX_BUILDERS:
+        raise ValueError(f"Unsupported Sphinx builder: {sphinx_builder}. Must be one of: {', '.join(SPHINX_BUILDERS)}")
+    if sphinx_builder == 'auto':
+        if _markdown_builder_available():
+            logger.debug("Using the Sphinx markdown builder")
+            return 'markdown'
+        logger.info("sphinx-markdown-builder is not installed, building HTML and converting it to Markdown")
+        return 'html'
+    if sphinx_builder == 'markdown' and not _markdown_builder_available():
+        raise ValueError("The Sphinx markdown builder is not installed (pip install sphinx-markdown-builder)")
+    return sphinx_builder
+
+def _build_direct(
+    run: Callable[[str, List[str]], None],
+    build_dir: Path,
+    builder: str,
+    sphinx_args: List[str]
+) -> List[Dict[str, Any]]:
+    """Build with a Markdown or text builder and read the pages as they are."""
+    run(builder, sphinx_args)
+
+    parsed_docs = []
+    for page in walk_files(build_dir, [DIRECT_BUILDER_SUFFIXES[builder]]):
+        parsed_docs.append({
+            'type': 'sphinx',
+            'filename': page.relative_to(build_dir).as_posix(),
+            'content': page.read_text(encoding='utf-8')
+        })
+    return parsed_docs
+
+def _build_html(run: Callable[[str, List[str]], None], build_dir: Path, sphinx_args: List[str]) -> List[Dict[str, Any]]:
+    """Build HTML and convert every page to Markdown."""
+    run('html', sphinx_args)
+
+    parsed_docs = []
+    html_files = list(walk_files(build_dir, ['.html']))
+    for html_file, markdown in zip(html_files, convert_html_files(html_files, framework='sphinx')):
+        parsed_docs.append({
+            'type': 'sphinx',
+            'filename': html_file.relative_to(build_dir).as_posix(),
+            'content': markdown
+        })
+    return parsed_docs
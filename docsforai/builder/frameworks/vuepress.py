@@ -4,20 +4,41 @@ VuePress documentation parser for DocsForAI.
 
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 import subprocess
 import shutil
-from docsforai.converter.html_to_md import html_to_md
+from docsforai.builder.dedup import SourceRegistry, front_matter_value, page_key, split_front_matter
+from docsforai.builder.mdx import page_title, sidebar_order, strip_mdx, with_title
+from docsforai.builder.node_deps import install_node_dependencies
+from docsforai.converter.html_to_md import convert_html_files
+from docsforai.utils import run_subprocess_with_logging, walk_files
 
 logger = logging.getLogger(__name__)
 
-def parse_vuepress(docs_path: Path) -> List[Dict[str, Any]]:
+def parse_vuepress(
+    docs_path: Path,
+    prefer: Optional[str] = None,
+    node_modules_cache: bool = True,
+    node_build: bool = False
+) -> List[Dict[str, Any]]:
     """
     Parse VuePress documentation.
 
+    By default only the sources are read: Vue components and script blocks
+    are removed from the Markdown pages in Python and the pages are ordered by
+    the sidebar of .vuepress/config.js. With `node_build`, the npm
+    dependencies are installed and the site is built, and the built pages are
+    converted as well.
+
     Args:
         docs_path (Path): Path to the VuePress documentation source.
+        prefer (Optional[str]): Version kept for pages that exist as source and as built HTML:
+            'source' (default), 'built' or 'both'.
+        node_modules_cache (bool): Whether to reuse node_modules installed by earlier builds
+            with the same lockfile and Node version.
+        node_build (bool): Whether to build the site with Node. `prefer` and
+            `node_modules_cache` only apply to such builds.
 
     Returns:
         List[Dict[str, Any]]: Parsed VuePress documentation.
@@ -34,31 +55,37 @@ def parse_vuepress(docs_path: Path) -> List[Dict[str, Any]]:
         logger.error("config.js not found in .vuepress directory")
         raise FileNotFoundError("config.js not found in .vuepress directory")
 
+    if not node_build:
+        return _parse_sources(docs_path, config_path)
+
     parsed_docs = []
+    registry = SourceRegistry(prefer)
 
     # parse .md
-    for md_file in docs_path.rglob('*.md'):
+    for md_file in walk_files(docs_path, ['.md']):
         with md_file.open('r', encoding='utf-8') as f:
             content = f.read()
+            filename = md_file.relative_to(docs_path).as_posix()
             parsed_docs.append({
                 'type': 'vuepress',
-                'filename': md_file.relative_to(docs_path).as_posix(),
+                'filename': filename,
                 'content': content
             })
+            registry.add_source(filename, front_matter_value(content, 'permalink'))
 
     build_dir = docs_path / '.vuepress' / 'dist'
     try:
-        subprocess.run(['npm', 'install'], cwd=str(docs_path), check=True)
-        subprocess.run(['npx', 'vuepress', 'build', str(docs_path)], check=True)
-
-        for html_file in build_dir.rglob('*.html'):
-            with html_file.open('r', encoding='utf-8') as f:
-                content = f.read()
-                parsed_docs.append({
-                    'type': 'vuepress_built',
-                    'filename': html_file.relative_to(build_dir).as_posix(),
-                    'content': html_to_md(content)
-                })
+        install_node_dependencies(docs_path, use_cache=node_modules_cache)
+        run_subprocess_with_logging(['npx', 'vuepress', 'build', str(docs_path)])
+
+        html_files = registry.select_built(walk_files(build_dir, ['.html']), build_dir)
+        parsed_docs = registry.select_sources(parsed_docs)
+        for html_file, markdown in zip(html_files, convert_html_files(html_files, framework='vuepress')):
+            parsed_docs.append({
+                'type': 'vuepress_built',
+                'filename': html_file.relative_to(build_dir).as_posix(),
+                'content': markdown
+            })
 
         sidebar_config = _extract_sidebar_config(config_path)
         if sidebar_config:
@@ -76,6 +103,36 @@ def parse_vuepress(docs_path: Path) -> List[Dict[str, Any]]:
 
     return parsed_docs
 
+def _parse_sources(docs_path: Path, config_path: Path) -> List[Dict[str, Any]]:
+    """
+    Read the Markdown pages without building the site.
+
+    Args:
+        docs_path (Path): Path to the VuePress documentation source.
+        config_path (Path): Path to .vuepress/config.js.
+
+    Returns:
+        List[Dict[str, Any]]: Markdown pages in sidebar order, then the other pages by path.
+    """
+    pages = []
+    for md_file in walk_files(docs_path, ['.md'], exclude=['.vuepress']):
+        filename = md_file.relative_to(docs_path).as_posix()
+        front_matter, body = split_front_matter(md_file.read_text(encoding='utf-8'))
+        body = strip_mdx(body)
+        title = page_title(front_matter, body, Path(filename).stem)
+        permalink = front_matter.get('permalink')
+        key = page_key(permalink if isinstance(permalink, str) else filename)
+        pages.append((key, filename, with_title(title, body)))
+
+    order = sidebar_order(config_path.read_text(encoding='utf-8'), [key for key, *_ in pages], normalize=page_key)
+    pages.sort(key=lambda page: (0, order[page[0]]) if page[0] in order else (1, 0))
+
+    logger.info(f"Read {len(pages)} VuePress pages from the sources")
+    return [
+        {'type': 'vuepress', 'filename': filename, 'content': content}
+        for _, filename, content in pages
+    ]
+
 def _extract_sidebar_config(config_path: Path) -> Dict[str, Any]:
     """
     Extract sidebar configuration from VuePress config file.
@@ -0,0 +1,205 @@
+"""
+Source-only extraction for Node-based documentation sites.
+
+Docusaurus and VuePress pages are Markdown (or MDX) with front matter, JSX or
+Vue components and module imports that only mean something to the site
+bundler. This module turns such a page into plain Markdown without running
+Node: import/export statements and `<script>`/`<style>` blocks are removed,
+component tags are dropped while their content is kept, and the front matter
+title becomes the page heading. It also orders pages the way the site's
+sidebar configuration lists them.
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_FENCE_RE = re.compile(r'^([ \t]*)(`{3,}|~{3,})', re.MULTILINE)
+_IMPORT_RE = re.compile(
+    r'^import[ \t]+(?:[\w$*{}\s,]*?\bfrom[ \t]+)?([\'"])[^\'"\n]+\1[ \t]*;?[ \t]*(?:\r?\n|\Z)',
+    re.MULTILINE
+)
+_EXPORT_RE = re.compile(r'^export[ \t]+(?:default[ \t]+|const|let|var|function|class|async|\{)', re.MULTILINE)
+_BLOCK_TAG_RE = re.compile(r'^<(script|style)\b[^>]*>.*?</\1>[ \t]*(?:\r?\n|\Z)', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_JSX_COMMENT_RE = re.compile(r'\{/\*.*?\*/\}', re.DOTALL)
+_INLINE_CODE_RE = re.compile(r'(`+)(?:(?!\1).)+?\1', re.DOTALL)
+# PascalCase (JSX, Vue) component tags; attribute values may hold {expressions}
+_COMPONENT_TAG_RE = re.compile(
+    r'<(?P<close>/)?(?P<name>[A-Z][\w.]*)(?P<attrs>(?:[^<>{}"\']|"[^"]*"|\'[^\']*\'|\{(?:[^{}]|\{[^{}]*\})*\})*?)(?P<self>/)?>'
+)
+_LABEL_ATTR_RE = re.compile(r'\b(?:label|title)=(?:"([^"]*)"|\'([^\']*)\'|\{[\'"]([^\'"]*)[\'"]\})')
+_HEADING_RE = re.compile(r'^#[ \t]+(.+?)[ \t#]*$', re.MULTILINE)
+_BLANK_LINE_RE = re.compile(r'^[ \t]+$', re.MULTILINE)
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_QUOTED_RE = re.compile(r'([\'"`])((?:(?!\1)[^\\\n]|\\.)+)\1')
+
+def strip_mdx(content: str) -> str:
+    """
+    Convert an MDX or VuePress Markdown body to plain Markdown.
+
+    Fenced code blocks and inline code are left untouched.
+
+    Args:
+        content (str): Page body without front matter.
+
+    Returns:
+        str: Markdown without imports, exports and component tags.
+    """
+    parts = _split_code_fences(content)
+    for index in range(0, len(parts), 2):
+        parts[index] = _strip_prose(parts[index])
+    return _EXCESS_BLANK_LINES_RE.sub('\n\n', ''.join(parts)).strip() + '\n'
+
+def page_title(front_matter: Dict[str, Any], body: str, fallback: str) -> str:
+    """
+    Return the title of a page.
+
+    Args:
+        front_matter (Dict[str, Any]): Front matter of the page.
+        body (str): Page body.
+        fallback (str): Title used when neither front matter nor body has one.
+
+    Returns:
+        str: The `title` front matter, else the first heading, else the `sidebar_label`
+        front matter, else `fallback`.
+    """
+    title = front_matter.get('title')
+    if isinstance(title, str) and title.strip():
+        return title.strip()
+    match = _HEADING_RE.search(body)
+    if match:
+        return match.group(1)
+    label = front_matter.get('sidebar_label')
+    if isinstance(label, str) and label.strip():
+        return label.strip()
+    return fallback
+
+def with_title(title: str, body: str) -> str:
+    """
+    Make sure a page starts with a top-level heading.
+
+    Args:
+        title (str): Page title.
+        body (str): Markdown body.
+
+    Returns:
+        str: The body, preceded by `# title` unless it already starts with a heading.
+    """
+    if body.lstrip().startswith('# '):
+        return body
+    return f"# {title}\n\n{body}"
+
+def sidebar_order(
+    sidebar_source: str,
+    keys: Iterable[str],
+    normalize: Optional[Callable[[str], str]] = None
+) -> Dict[str, int]:
+    """
+    Return the position of pages in a sidebar configuration.
+
+    The sidebar file (JSON or JavaScript) is not evaluated: pages are ordered
+    by the first string literal in it that equals their key.
+
+    Args:
+        sidebar_source (str): Content of the sidebar configuration.
+        keys (Iterable[str]): Keys of the known pages (doc ids or page paths).
+        normalize (Optional[Callable[[str], str]]): Maps a string literal to a page key,
+            e.g. dedup.page_key for sidebars listing page paths.
+
+    Returns:
+        Dict[str, int]: Position of each page listed in the sidebar.
+    """
+    wanted = set(keys)
+    order: Dict[str, int] = {}
+    for match in _QUOTED_RE.finditer(sidebar_source):
+        value = normalize(match.group(2)) if normalize else match.group(2)
+        if value in wanted and value not in order:
+            order[value] = len(order)
+    return order
+
+def _split_code_fences(content: str) -> List[str]:
+    """Split text into alternating prose and fenced code parts (prose first)."""
+    parts: List[str] = []
+    position = 0
+    search_from = 0
+    while True:
+        opening = _FENCE_RE.search(content, search_from)
+        if not opening:
+            break
+        fence = opening.group(2)
+        closing_re = re.compile(rf'^[ \t]*{re.escape(fence[0])}{{{len(fence)},}}[ \t]*$', re.MULTILINE)
+        line_end = content.find('\n', opening.end())
+        closing = closing_re.search(content, line_end + 1) if line_end != -1 else None
+        end = closing.end() if closing else len(content)
+        parts.extend((content[position:opening.start()], content[opening.start():end]))
+        position = search_from = end
+    parts.append(content[position:])
+    return parts
+
+def _strip_prose(text: str) -> str:
+    """Remove module statements and component tags from Markdown outside code blocks."""
+    text = _IMPORT_RE.sub('', text)
+    text = _strip_exports(text)
+    text = _BLOCK_TAG_RE.sub('', text)
+    text = _JSX_COMMENT_RE.sub('', text)
+    if '<' not in text:
+        return text
+    # Inline code may show component tags literally
+    pieces = _INLINE_CODE_RE.split(text)
+    spans = [match.group(0) for match in _INLINE_CODE_RE.finditer(text)]
+    result: List[str] = []
+    for index, piece in enumerate(pieces[::2]):
+        result.append(_COMPONENT_TAG_RE.sub(_replace_component_tag, piece))
+        if index < len(spans):
+            result.append(spans[index])
+    # Indentation left behind by removed tags
+    return _BLANK_LINE_RE.sub('', ''.join(result))
+
+def _replace_component_tag(match: 're.Match[str]') -> str:
+    """Drop a component tag, keeping the label of tabs and details-like components."""
+    if match.group('close'):
+        return ''
+    label = _LABEL_ATTR_RE.search(match.group('attrs') or '')
+    if label:
+        text = next(group for group in label.groups() if group is not None)
+        return f"\n**{text}**\n\n" if text else ''
+    return ''
+
+def _strip_exports(text: str) -> str:
+    """Remove export statements, including multi-line object and function bodies."""
+    if 'export' not in text:
+        return text
+    result: List[str] = []
+    position = 0
+    for match in _EXPORT_RE.finditer(text):
+        if match.start() < position:
+            continue
+        result.append(text[position:match.start()])
+        position = _statement_end(text, match.start())
+    result.append(text[position:])
+    return ''.join(result)
+
+def _statement_end(text: str, start: int) -> int:
+    """Return the offset after the line that completes the statement starting at `start`."""
+    depth = 0
+    quote: Optional[str] = None
+    index = start
+    while index < len(text):
+        char = text[index]
+        if quote:
+            if char == '\\':
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in '\'"`':
+            quote = char
+        elif char in '{[(':
+            depth += 1
+        elif char in '}])':
+            depth -= 1
+        elif char == '\n' and depth <= 0:
+            return index + 1
+        index += 1
+    return len(text)
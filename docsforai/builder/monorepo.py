@@ -0,0 +1,162 @@
+"""
+Monorepo support for DocsForAI.
+
+This module finds every documentation root in a repository (a Sphinx `docs/`,
+a Docusaurus `website/`, OpenAPI specs under `api/`, ...) and parses the roots
+in parallel so that a single clone produces one consolidated output.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .parser import parse_documentation
+from ..utils import walk_files
+
+logger = logging.getLogger(__name__)
+
+# Files whose presence marks the directory containing them as a candidate
+# documentation root. Candidates are confirmed by running framework detection.
+DOC_ROOT_MARKERS = {
+    'conf.py',
+    'mkdocs.yml', 'mkdocs.yaml',
+    'docusaurus.config.js', 'docusaurus.config.ts', 'siteConfig.js',
+    '_config.yml',
+    'hugo.toml', 'hugo.yaml', 'config.toml',
+    'book.json', 'SUMMARY.md',
+    '_sidebar.md',
+    'Doxyfile',
+    'swagger.yaml', 'swagger.yml', 'swagger.json',
+    'openapi.yaml', 'openapi.yml', 'openapi.json',
+    'antora.yml',
+}
+
+# Markers that live in a configuration directory below the documentation root.
+NESTED_ROOT_MARKERS = {
+    '.vuepress': {'config.js', 'config.ts'},
+}
+
+# Frameworks that do not identify a documentation site on their own.
+UNSPECIFIC_FRAMEWORKS = {'common', 'unknown'}
+
+def find_doc_roots(repo_path: Path, max_depth: int = 3) -> List[Path]:
+    """
+    Find candidate documentation roots in a repository.
+
+    Args:
+        repo_path (Path): Path to the repository (or the directory to search).
+        max_depth (int): Maximum directory depth of a root below `repo_path`.
+
+    Returns:
+        List[Path]: Candidate roots, sorted by path.
+    """
+    roots = set()
+    for file_path in walk_files(repo_path):
+        parent = file_path.parent
+        if parent.name in NESTED_ROOT_MARKERS:
+            if file_path.name in NESTED_ROOT_MARKERS[parent.name]:
+                roots.add(parent.parent)
+        elif file_path.name in DOC_ROOT_MARKERS:
+            roots.add(parent)
+
+    candidates = []
+    for root in sorted(roots):
+        depth = len(root.relative_to(repo_path).parts)
+        if depth <= max_depth:
+            candidates.append(root)
+
+    logger.debug(f"Found {len(candidates)} candidate documentation roots under {repo_path}")
+    return candidates
+
+def resolve_doc_roots(
+    candidates: List[Path],
+    detect: Callable[[Path], str]
+) -> List[Tuple[Path, str]]:
+    """
+    Detect the framework of each candidate root and drop redundant roots.
+
+    A root is dropped if no specific framework is detected for it, or if it is
+    nested in a root of the same framework (e.g. `docs/source` below a Sphinx
+    `docs`), since the outer build already covers it.
+
+    Args:
+        candidates (List[Path]): Candidate roots, sorted by path.
+        detect (Callable[[Path], str]): Function returning the framework of a root.
+
+    Returns:
+        List[Tuple[Path, str]]: (root, framework) pairs in path order.
+    """
+    resolved: List[Tuple[Path, str]] = []
+    for root in candidates:
+        framework = detect(root)
+        if framework in UNSPECIFIC_FRAMEWORKS:
+            logger.debug(f"Skipping {root}: no documentation framework detected")
+            continue
+        enclosing = [(r, f) for r, f in resolved if root != r and r in root.parents]
+        if enclosing and enclosing[-1][1] == framework:
+            logger.debug(f"Skipping {root}: covered by {framework} root {enclosing[-1][0]}")
+            continue
+        resolved.append((root, framework))
+        logger.info(f"Found {framework} documentation root: {root}")
+    return resolved
+
+def parse_doc_roots(
+    repo_path: Path,
+    roots: List[Tuple[Path, str]],
+    build_args: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    ignore_errors: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Parse several documentation roots in parallel and merge the results.
+
+    Each root is parsed with its own framework parser. Filenames are prefixed
+    with the root's path relative to `repo_path`, and results are merged in
+    root order so the output does not depend on scheduling.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        roots (List[Tuple[Path, str]]): (root, framework) pairs to parse.
+        build_args (Optional[Dict[str, Any]]): Additional build arguments for specific frameworks.
+        max_workers (Optional[int]): Maximum number of roots parsed at the same time.
+        ignore_errors (bool): Skip roots that fail to parse instead of failing the build.
+
+    Returns:
+        List[Dict[str, Any]]: Merged list of parsed documentation elements.
+
+    Raises:
+        ValueError: If a root fails to parse and ignore_errors is False.
+    """
+    if not roots:
+        return []
+
+    workers = max_workers or min(len(roots), os.cpu_count() or 1)
+    logger.info(f"Parsing {len(roots)} documentation roots with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(parse_documentation, root, framework, build_args)
+            for root, framework in roots
+        ]
+
+        parsed_docs = []
+        for (root, framework), future in zip(roots, futures):
+            try:
+                docs = future.result()
+            except Exception as e:
+                if not ignore_errors:
+                    for pending in futures:
+                        pending.cancel()
+                    raise ValueError(f"Failed to parse {framework} documentation in {root}: {str(e)}") from e
+                logger.error(f"Skipping {framework} documentation in {root}: {str(e)}")
+                continue
+
+            prefix = root.relative_to(repo_path).as_posix()
+            for doc in docs:
+                if prefix != '.':
+                    doc['filename'] = f"{prefix}/{doc['filename']}"
+                parsed_docs.append(doc)
+
+    return parsed_docs
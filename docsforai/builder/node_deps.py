@@ -0,0 +1,139 @@
+"""
+Cached Node.js dependency installation for DocsForAI.
+
+Node-based parsers (Docusaurus, VuePress, JSDoc) install the project's npm
+dependencies in every fresh clone, which usually takes longer than the
+documentation build itself. This module keeps one installed node_modules tree
+per lockfile, Node version and platform in the build cache. On a cache hit the
+tree is restored with reflinks (falling back to a plain copy) and the install
+step is skipped. Restored files never share storage with the cached tree, so
+postinstall scripts or bundlers rewriting them cannot corrupt the cache.
+"""
+
+import hashlib
+import logging
+import os
+import platform
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+
+from ..utils import run_subprocess_with_logging
+from ..utils.build_cache import build_cache_dir, cache_lock, prune_build_caches, touch_build_cache
+
+logger = logging.getLogger(__name__)
+
+LOCKFILES = ['package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml']
+
+# Number of node_modules trees kept in the cache
+MAX_CACHED_TREES = 8
+
+# Written to node_modules by build tools (webpack, babel-loader); build output,
+# not dependencies, so never cached.
+UNCACHED_DIRS = {'.cache'}
+
+COMPLETE_MARKER = '.complete'
+
+def install_node_dependencies(
+    project_dir: Path,
+    install_args: Optional[List[str]] = None,
+    use_cache: bool = True
+) -> None:
+    """
+    Install the npm dependencies of a project, reusing a cached node_modules tree.
+
+    The cache is only used for projects with a lockfile, since dependency
+    resolution without one is not reproducible.
+
+    Args:
+        project_dir (Path): Directory containing package.json.
+        install_args (Optional[List[str]]): Additional arguments for npm install.
+        use_cache (bool): Whether to restore and save node_modules from the build cache.
+
+    Raises:
+        subprocess.CalledProcessError: If npm install fails.
+    """
+    cache_dir = _node_cache_dir(project_dir, install_args) if use_cache else None
+    if cache_dir is None:
+        run_subprocess_with_logging(['npm', 'install'], cwd=project_dir, additional_args=install_args)
+        return
+
+    with cache_lock(cache_dir) as locked:
+        cached_tree = cache_dir / 'node_modules'
+        target = project_dir / 'node_modules'
+        if locked and (cache_dir / COMPLETE_MARKER).exists():
+            shutil.rmtree(target, ignore_errors=True)
+            method = _restore_tree(cached_tree, target)
+            touch_build_cache(cache_dir)
+            logger.info(f"Restored node_modules from the build cache ({method}), skipping npm install")
+            return
+
+        run_subprocess_with_logging(['npm', 'install'], cwd=project_dir, additional_args=install_args)
+        if locked and target.is_dir():
+            _save_tree(target, cache_dir)
+
+    prune_build_caches('node_modules', MAX_CACHED_TREES, exclude=cache_dir)
+
+def _node_version() -> str:
+    """Return the version of the Node.js on PATH."""
+    try:
+        result = run_subprocess_with_logging(['node', '--version'], check=False)
+        return result.stdout.strip() or 'unknown'
+    except OSError:
+        return 'unknown'
+
+def _node_cache_dir(project_dir: Path, install_args: Optional[List[str]]) -> Optional[Path]:
+    """Return the cache directory for the project's dependencies, or None if it cannot be cached."""
+    lockfiles = [project_dir / name for name in LOCKFILES if (project_dir / name).is_file()]
+    if not lockfiles:
+        logger.info(f"No lockfile in {project_dir}, installing npm dependencies without the cache")
+        return None
+
+    digest = hashlib.sha256()
+    for path in [project_dir / 'package.json'] + lockfiles:
+        if path.is_file():
+            digest.update(path.name.encode('utf-8') + b'\0' + path.read_bytes() + b'\0')
+    key = {
+        'dependencies': digest.hexdigest(),
+        'node': _node_version(),
+        'platform': f"{platform.system()}-{platform.machine()}",
+        'install_args': list(install_args or [])
+    }
+    return build_cache_dir('node_modules', key)
+
+def _save_tree(source: Path, cache_dir: Path) -> None:
+    """Copy an installed node_modules tree into the cache."""
+    staging = cache_dir / f'node_modules.tmp-{os.getpid()}'
+    shutil.rmtree(staging, ignore_errors=True)
+    try:
+        # A real copy: the build may rewrite files of the project's tree in place
+        shutil.copytree(source, staging, symlinks=True, ignore=_ignore_uncached)
+        shutil.rmtree(cache_dir / 'node_modules', ignore_errors=True)
+        os.replace(staging, cache_dir / 'node_modules')
+        (cache_dir / COMPLETE_MARKER).touch()
+        logger.info(f"Saved node_modules to the build cache {cache_dir}")
+    except OSError as e:
+        logger.warning(f"Failed to save node_modules to the build cache: {str(e)}")
+        shutil.rmtree(staging, ignore_errors=True)
+
+def _ignore_uncached(directory: str, names: List[str]) -> List[str]:
+    if Path(directory).name == 'node_modules':
+        return [name for name in names if name in UNCACHED_DIRS]
+    return []
+
+def _restore_tree(source: Path, target: Path) -> str:
+    """Recreate a cached tree at `target` and return the method used."""
+    if platform.system() == 'Linux':
+        result = subprocess.run(
+            ['cp', '-a', '--reflink=always', str(source), str(target)],
+            capture_output=True, text=True
+        )
+        if result.returncode == 0:
+            return 'reflink'
+        logger.debug(f"Reflinking node_modules failed ({result.stderr.strip()}), copying instead")
+        shutil.rmtree(target, ignore_errors=True)
+
+    # Never hardlinks: builds may rewrite package files in place
+    shutil.copytree(source, target, symlinks=True)
+    return 'copy'
@@ -7,54 +7,37 @@ It delegates the actual parsing to framework-specific parsers.
 
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Callable, Optional
-from docsforai.builder.frameworks import (
-    parse_apiblueprint,
-    parse_asciidoc,
-    parse_docsify,
-    parse_docusaurus,
-    parse_doxygen,
-    parse_gitbook,
-    parse_godoc,
-    parse_hugo,
-    parse_javadoc,
-    parse_jekyll,
-    parse_jsdoc,
-    parse_jupyter,
-    parse_markdown,
-    parse_mkdocs,
-    parse_openapi,
-    parse_readthedocs,
-    parse_restructuredtext,
-    parse_rustdoc,
-    parse_sphinx,
-    parse_vuepress,
-)
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from docsforai.builder.registry import FRAMEWORK_PARSERS
+from docsforai.utils import walk_files
 
 logger = logging.getLogger(__name__)
 
-# Mapping of framework names to their respective parsing functions
-FRAMEWORK_PARSERS: Dict[str, Callable] = {
-    'apiblueprint': parse_apiblueprint,
-    'asciidoc': parse_asciidoc,
-    'docsify': parse_docsify,
-    'docusaurus': parse_docusaurus,
-    'doxygen': parse_doxygen,
-    'gitbook': parse_gitbook,
-    'godoc': parse_godoc,
-    'hugo': parse_hugo,
-    'javadoc': parse_javadoc,
-    'jekyll': parse_jekyll,
-    'jsdoc': parse_jsdoc,
-    'jupyter': parse_jupyter,
-    'markdown': parse_markdown,
-    'mkdocs': parse_mkdocs,
-    'openapi': parse_openapi,
-    'readthedocs': parse_readthedocs,
-    'restructuredtext': parse_restructuredtext,
-    'rustdoc': parse_rustdoc,
-    'sphinx': parse_sphinx,
-    'vuepress': parse_vuepress,
+# Build arguments forwarded to each framework parser, as {build_args key: parser keyword}
+PARSER_BUILD_ARGS: Dict[str, Dict[str, str]] = {
+    'docusaurus': {
+        'npm_install_args': 'npm_install_args', 'npm_build_args': 'npm_build_args', 'prefer': 'prefer',
+        'node_modules_cache': 'node_modules_cache', 'node_build': 'node_build'
+    },
+    'doxygen': {'doxygen_args': 'doxygen_args', 'lean_build': 'lean_build', 'doxygen_workers': 'doxygen_workers'},
+    'hugo': {
+        'hugo_args': 'hugo_args', 'prefer': 'prefer', 'hugo_mode': 'hugo_mode',
+        'hugo_build_sections': 'hugo_build_sections', 'lean_build': 'lean_build'
+    },
+    'jekyll': {
+        'bundle_install_args': 'bundle_install_args', 'bundle_build_args': 'bundle_build_args', 'prefer': 'prefer',
+        'bundle_cache': 'bundle_cache', 'jekyll_incremental': 'jekyll_incremental', 'lean_build': 'lean_build'
+    },
+    'mkdocs': {'prefer': 'prefer', 'lean_build': 'lean_build'},
+    'sphinx': {
+        'sphinx_args': 'sphinx_args', 'sphinx_builder': 'sphinx_builder', 'sphinx_cache': 'sphinx_cache',
+        'sphinx_runner': 'sphinx_runner', 'sphinx_jobs': 'sphinx_jobs', 'lean_build': 'lean_build'
+    },
+    'gitbook': {'gitbook_config_file': 'config_file'},
+    'vuepress': {'prefer': 'prefer', 'node_modules_cache': 'node_modules_cache', 'node_build': 'node_build'},
+    'jsdoc': {'node_modules_cache': 'node_modules_cache'},
+    'godoc': {'godoc_workers': 'godoc_workers'},
+    'rustdoc': {'cargo_target_cache': 'cargo_target_cache', 'rustdoc_format': 'rustdoc_format'},
 }
 
 def parse_documentation(docs_path: Path, framework: str, build_args: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
@@ -67,11 +50,17 @@ def parse_documentation(docs_path: Path, framework: str, build_args: Optional[Di
         build_args (Optional[Dict[str, Any]]): Additional build arguments for specific frameworks.
             Supported arguments per framework:
             - docusaurus: npm_install_args, npm_build_args
-            - doxygen: doxygen_args
-            - hugo: hugo_args
-            - jekyll: bundle_install_args, bundle_build_args
-            - sphinx: sphinx_args
+            - doxygen: doxygen_args, doxygen_workers
+            - hugo: hugo_args, hugo_mode, hugo_build_sections
+            - jekyll: bundle_install_args, bundle_build_args, bundle_cache, jekyll_incremental
+            - sphinx: sphinx_args, sphinx_builder, sphinx_cache, sphinx_runner, sphinx_jobs
             - gitbook: gitbook_config_file
+            - godoc: godoc_workers
+            - rustdoc: cargo_target_cache, rustdoc_format
+            - mkdocs, docusaurus, hugo, jekyll, vuepress: prefer
+            - docusaurus, vuepress, jsdoc: node_modules_cache
+            - docusaurus, vuepress: node_build
+            - doxygen, hugo, jekyll, mkdocs, sphinx: lean_build
 
     Returns:
         List[Dict[str, Any]]: List of parsed documentation elements.
@@ -86,6 +75,65 @@ def parse_documentation(docs_path: Path, framework: str, build_args: Optional[Di
     logger.info(f"Starting documentation parsing using {framework} framework")
     logger.debug(f"Received build_args: {build_args}")
 
+    _check_parse_request(docs_path, framework)
+
+    try:
+        parsed_docs = _call_parser(docs_path, framework, build_args or {})
+        if not isinstance(parsed_docs, list):
+            parsed_docs = list(parsed_docs)
+
+        _validate_parsed_docs(parsed_docs)
+        logger.info(f"Successfully parsed {len(parsed_docs)} documentation files")
+        return parsed_docs
+
+    except Exception as e:
+        error_msg = f"Error parsing documentation with {framework}: {str(e)}"
+        logger.error(error_msg)
+        raise ValueError(error_msg) from e
+
+def iter_documentation(docs_path: Path, framework: str, build_args: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Parse documentation lazily, yielding one documentation element at a time.
+
+    Parsers that are generators are consumed as they produce documents, so
+    only the document being processed is held in memory. Parsers returning a
+    list are supported as well.
+
+    Args:
+        docs_path (Path): Path to the documentation directory.
+        framework (str): Name of the documentation framework to use.
+        build_args (Optional[Dict[str, Any]]): Additional build arguments for specific frameworks
+            (see parse_documentation()).
+
+    Returns:
+        Iterator[Dict[str, Any]]: Iterator over validated documentation elements.
+
+    Raises:
+        ValueError: If the framework is not supported, immediately; or if parsing
+            fails, while iterating.
+    """
+    logger.info(f"Starting streaming documentation parsing using {framework} framework")
+    logger.debug(f"Received build_args: {build_args}")
+
+    _check_parse_request(docs_path, framework)
+    return _iter_parsed_docs(docs_path, framework, build_args or {})
+
+def _iter_parsed_docs(docs_path: Path, framework: str, build_args: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Run the parser and yield validated documents, wrapping failures in ValueError."""
+    count = 0
+    try:
+        for doc in _call_parser(docs_path, framework, build_args):
+            _validate_parsed_doc(doc)
+            count += 1
+            yield doc
+    except Exception as e:
+        error_msg = f"Error parsing documentation with {framework}: {str(e)}"
+        logger.error(error_msg)
+        raise ValueError(error_msg) from e
+    logger.info(f"Successfully parsed {count} documentation files")
+
+def _check_parse_request(docs_path: Path, framework: str) -> None:
+    """Check that the framework is supported and the documentation path exists."""
     if framework not in FRAMEWORK_PARSERS:
         supported_frameworks = ', '.join(FRAMEWORK_PARSERS.keys())
         error_msg = f"Unsupported framework: {framework}. Supported frameworks are: {supported_frameworks}"
@@ -97,49 +145,19 @@ def parse_documentation(docs_path: Path, framework: str, build_args: Optional[Di
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-    try:
-        parser_func = FRAMEWORK_PARSERS[framework]
-        build_args = build_args or {}
-        
-        # Call the parser with appropriate arguments based on the framework
-        if framework == 'docusaurus':
-            logger.debug(f"Passing to docusaurus parser - npm_install_args: {build_args.get('npm_install_args')}, npm_build_args: {build_args.get('npm_build_args')}")
-            parsed_docs = parser_func(docs_path, 
-                                   npm_install_args=build_args.get('npm_install_args'),
-                                   npm_build_args=build_args.get('npm_build_args'))
-        elif framework == 'doxygen':
-            logger.debug(f"Passing to doxygen parser - doxygen_args: {build_args.get('doxygen_args')}")
-            parsed_docs = parser_func(docs_path, 
-                                   doxygen_args=build_args.get('doxygen_args'))
-        elif framework == 'hugo':
-            logger.debug(f"Passing to hugo parser - hugo_args: {build_args.get('hugo_args')}")
-            parsed_docs = parser_func(docs_path, 
-                                   hugo_args=build_args.get('hugo_args'))
-        elif framework == 'jekyll':
-            logger.debug(f"Passing to jekyll parser - bundle_install_args: {build_args.get('bundle_install_args')}, bundle_build_args: {build_args.get('bundle_build_args')}")
-            parsed_docs = parser_func(docs_path, 
-                                   bundle_install_args=build_args.get('bundle_install_args'),
-                                   bundle_build_args=build_args.get('bundle_build_args'))
-        elif framework == 'sphinx':
-            logger.debug(f"Passing to sphinx parser - sphinx_args: {build_args.get('sphinx_args')}")
-            parsed_docs = parser_func(docs_path, 
-                                   sphinx_args=build_args.get('sphinx_args'))
-        elif framework == 'gitbook':
-            logger.debug(f"Passing to gitbook parser - config_file: {build_args.get('gitbook_config_file')}")
-            parsed_docs = parser_func(docs_path,
-                                   config_file=build_args.get('gitbook_config_file'))
-        else:
-            logger.debug(f"Using default parser without build args for framework: {framework}")
-            parsed_docs = parser_func(docs_path)
+def _call_parser(docs_path: Path, framework: str, build_args: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Call the framework parser with the build arguments it accepts."""
+    parser_func = FRAMEWORK_PARSERS[framework]
 
-        _validate_parsed_docs(parsed_docs)
-        logger.info(f"Successfully parsed {len(parsed_docs)} documentation files")
-        return parsed_docs
+    parser_args = PARSER_BUILD_ARGS.get(framework)
+    if not parser_args:
+        logger.debug(f"Using default parser without build args for framework: {framework}")
+        return parser_func(docs_path)
 
-    except Exception as e:
-        error_msg = f"Error parsing documentation with {framework}: {str(e)}"
-        logger.error(error_msg)
-        raise ValueError(error_msg) from e
+    # Unset arguments are left out so that the parser's defaults apply
+    kwargs = {parameter: build_args[key] for key, parameter in parser_args.items() if key in build_args}
+    logger.debug(f"Passing to {framework} parser - {', '.join(f'{k}: {v}' for k, v in kwargs.items())}")
+    return parser_func(docs_path, **kwargs)
 
 def _validate_parsed_docs(parsed_docs: List[Dict[str, Any]]) -> None:
     """
@@ -155,18 +173,30 @@ def _validate_parsed_docs(parsed_docs: List[Dict[str, Any]]) -> None:
         raise ValueError("Parsed documentation must be a list")
 
     for doc in parsed_docs:
-        if not isinstance(doc, dict):
-            raise ValueError("Each parsed documentation element must be a dictionary")
-        required_fields = ['type', 'filename', 'content']
-        missing_fields = [field for field in required_fields if field not in doc]
-        if missing_fields:
-            raise ValueError(f"Missing required fields in parsed documentation: {', '.join(missing_fields)}")
-        if not isinstance(doc['type'], str):
-            raise ValueError("'type' field must be a string")
-        if not isinstance(doc['filename'], str):
-            raise ValueError("'filename' field must be a string")
-        if not isinstance(doc['content'], str):
-            raise ValueError("'content' field must be a string")
+        _validate_parsed_doc(doc)
+
+def _validate_parsed_doc(doc: Dict[str, Any]) -> None:
+    """
+    Validate a single parsed documentation element.
+
+    Args:
+        doc (Dict[str, Any]): Parsed documentation element to validate.
+
+    Raises:
+        ValueError: If the element format is invalid.
+    """
+    if not isinstance(doc, dict):
+        raise ValueError("Each parsed documentation element must be a dictionary")
+    required_fields = ['type', 'filename', 'content']
+    missing_fields = [field for field in required_fields if field not in doc]
+    if missing_fields:
+        raise ValueError(f"Missing required fields in parsed documentation: {', '.join(missing_fields)}")
+    if not isinstance(doc['type'], str):
+        raise ValueError("'type' field must be a string")
+    if not isinstance(doc['filename'], str):
+        raise ValueError("'filename' field must be a string")
+    if not isinstance(doc['content'], str):
+        raise ValueError("'content' field must be a string")
 
 def parse_common_documentation(docs_path: Path) -> List[Dict[str, Any]]:
     """
@@ -190,14 +220,13 @@ def parse_common_documentation(docs_path: Path) -> List[Dict[str, Any]]:
         parsed_docs.extend(rst_parser(docs_path))
 
         if not parsed_docs:
-            for file_path in docs_path.rglob('*'):
-                if file_path.is_file() and file_path.suffix in ['.md', '.rst', '.txt']:
-                    content = file_path.read_text(encoding='utf-8')
-                    parsed_docs.append({
-                        'type': 'common',
-                        'filename': file_path.relative_to(docs_path).as_posix(),
-                        'content': content
-                    })
+            for file_path in walk_files(docs_path, ['.md', '.rst', '.txt']):
+                content = file_path.read_text(encoding='utf-8')
+                parsed_docs.append({
+                    'type': 'common',
+                    'filename': file_path.relative_to(docs_path).as_posix(),
+                    'content': content
+                })
 
         if not parsed_docs:
             logger.warning("No documentation files found in common formats")
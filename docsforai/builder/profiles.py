@@ -0,0 +1,259 @@
+"""
+Lean extraction build profiles for DocsForAI.
+
+Framework builds produce much more than the pages docsforai reads: HTML and
+LaTeX next to Doxygen's XML, search indexes, sitemaps and feeds, and the
+output of plugins that only decorate pages (revision dates, social cards,
+minification). The lean profile of each framework turns those off through
+generated override configs and command-line flags. The project's own
+configuration files are never modified.
+"""
+
+import contextlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Doxygen settings overriding the project's Doxyfile; the XML output is all parse_doxygen reads
+DOXYGEN_OVERRIDES = {
+    'GENERATE_HTML': 'NO',
+    'GENERATE_LATEX': 'NO',
+    'GENERATE_RTF': 'NO',
+    'GENERATE_MAN': 'NO',
+    'GENERATE_DOCBOOK': 'NO',
+    'GENERATE_AUTOGEN_DEF': 'NO',
+    'GENERATE_PERLMOD': 'NO',
+    'GENERATE_XML': 'YES',
+    'XML_OUTPUT': 'xml',
+    'HAVE_DOT': 'NO',
+    'SEARCHENGINE': 'NO',
+    'GENERATE_TAGFILE': '',
+}
+
+# MkDocs plugins that only add files or decorations docsforai does not read
+# ('material/' prefixes are ignored). Plugins generating page content, such
+# as mkdocstrings, are kept.
+MKDOCS_DROPPED_PLUGINS = {
+    'search', 'git-revision-date', 'git-revision-date-localized', 'git-authors',
+    'git-committers', 'minify', 'social', 'optimize', 'privacy', 'offline', 'rss',
+    'htmlproofer', 'print-site', 'pdf-export', 'with-pdf', 'exporter',
+}
+
+# Sphinx HTML settings; the text and Markdown builders write nothing extra
+SPHINX_HTML_OVERRIDES = {
+    'html_copy_source': '0',
+    'html_show_sourcelink': '0',
+    'html_use_index': '0',
+    'html_domain_indices': '0',
+}
+
+# Hugo page kinds without documentation content
+HUGO_DISABLED_KINDS = ['rss', 'sitemap', 'robotstxt', '404', 'taxonomy', 'term']
+
+# Jekyll plugins that only generate feeds and sitemaps
+JEKYLL_DROPPED_PLUGINS = {'jekyll-feed', 'jekyll-sitemap'}
+
+LEAN_CONFIG_NAME = '.docsforai-lean'
+
+def doxygen_profile(doxyfile: Path, output_dir: Path) -> Path:
+    """
+    Write a Doxyfile that includes the project's Doxyfile and only generates XML.
+
+    Args:
+        doxyfile (Path): The project's Doxyfile.
+        output_dir (Path): Directory receiving the XML output (in `xml/`); the overlay
+            is written there as well.
+
+    Returns:
+        Path: The overlay Doxyfile to run doxygen with.
+    """
+    overrides = dict(DOXYGEN_OVERRIDES, OUTPUT_DIRECTORY=_doxygen_quote(str(output_dir.resolve())))
+    lines = [f"@INCLUDE = {_doxygen_quote(str(doxyfile.resolve()))}"]
+    lines.extend(f"{name} = {value}" for name, value in overrides.items())
+    overlay = output_dir / f"{LEAN_CONFIG_NAME}.Doxyfile"
+    overlay.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    logger.debug(f"Using lean Doxygen profile {overlay}")
+    return overlay
+
+@contextlib.contextmanager
+def mkdocs_profile(mkdocs_yaml: Path, loader: type) -> Iterator[Path]:
+    """
+    Provide an MkDocs config that inherits mkdocs.yml without the plugins in MKDOCS_DROPPED_PLUGINS.
+
+    The overlay is written next to mkdocs.yml, since MkDocs resolves relative
+    paths (docs_dir, theme directories, hooks) against the config file, and is
+    removed afterwards. The kept plugin entries are copied as YAML text, so
+    their options keep tags such as `!!python/name:` and `!ENV` that a YAML
+    round trip would lose. If an entry cannot be copied on its own (it uses
+    an alias defined elsewhere), mkdocs.yml is used unchanged.
+
+    Args:
+        mkdocs_yaml (Path): The project's mkdocs.yml.
+        loader (type): YAML loader for MkDocs configs.
+
+    Yields:
+        Path: The config to build with (mkdocs.yml itself if no plugin is dropped).
+    """
+    style, plugins = _mkdocs_plugins(mkdocs_yaml, loader)
+    kept = [(name, source) for name, source in plugins if _plugin_name(name) not in MKDOCS_DROPPED_PLUGINS]
+    if len(kept) == len(plugins):
+        yield mkdocs_yaml
+        return
+    if any(source is None for _, source in kept):
+        logger.debug("MkDocs plugin entries cannot be copied, building without the lean profile")
+        yield mkdocs_yaml
+        return
+
+    dropped = sorted({_plugin_name(name) for name, _ in plugins} - {_plugin_name(name) for name, _ in kept})
+    logger.info(f"Lean MkDocs profile: skipping plugins {', '.join(dropped)}")
+    overlay = mkdocs_yaml.with_name(f"{LEAN_CONFIG_NAME}.{os.getpid()}.yml")
+    overlay.write_text(
+        f"INHERIT: {mkdocs_yaml.name}\n{_plugins_yaml(style, [source for _, source in kept])}",
+        encoding='utf-8'
+    )
+    try:
+        yield overlay
+    finally:
+        overlay.unlink(missing_ok=True)
+
+def sphinx_profile(builder: str) -> List[str]:
+    """
+    Return sphinx-build arguments for the lean profile of a builder.
+
+    Args:
+        builder (str): Sphinx builder name.
+
+    Returns:
+        List[str]: `-D` overrides.
+    """
+    if builder != 'html':
+        return []
+    args: List[str] = []
+    for name, value in SPHINX_HTML_OVERRIDES.items():
+        args.extend(['-D', f"{name}={value}"])
+    return args
+
+def hugo_profile() -> List[str]:
+    """
+    Return hugo arguments for the lean profile.
+
+    Returns:
+        List[str]: Arguments disabling page kinds without documentation content.
+    """
+    return ['--disableKinds', ','.join(HUGO_DISABLED_KINDS)]
+
+@contextlib.contextmanager
+def jekyll_profile(config_path: Path, config: Optional[Dict[str, Any]]) -> Iterator[List[str]]:
+    """
+    Provide jekyll build arguments that drop feed and sitemap plugins.
+
+    Jekyll merges the configs passed with --config from left to right, so an
+    overlay after _config.yml replaces its plugin list.
+
+    Args:
+        config_path (Path): The project's _config.yml.
+        config (Optional[Dict[str, Any]]): Its parsed content.
+
+    Yields:
+        List[str]: Arguments for `jekyll build` (empty if no plugin is dropped).
+    """
+    config = config or {}
+    # 'gems' is the name of the plugin list before Jekyll 3.5
+    key = 'plugins' if 'plugins' in config else 'gems'
+    plugins = config.get(key)
+    if not isinstance(plugins, list) or not all(isinstance(plugin, str) for plugin in plugins):
+        yield []
+        return
+    kept = [plugin for plugin in plugins if plugin not in JEKYLL_DROPPED_PLUGINS]
+    if len(kept) == len(plugins):
+        yield []
+        return
+
+    logger.info(f"Lean Jekyll profile: skipping plugins {', '.join(sorted(set(plugins) - set(kept)))}")
+    # Outside the site source, where Jekyll would copy it into _site
+    with tempfile.TemporaryDirectory(prefix='docsforai-') as overlay_dir:
+        overlay = Path(overlay_dir) / f"{LEAN_CONFIG_NAME}.yml"
+        overlay.write_text(yaml.safe_dump({key: kept}, sort_keys=False), encoding='utf-8')
+        yield ['--config', f"{config_path.name},{overlay}"]
+
+def _doxygen_quote(value: str) -> str:
+    return f'"{value}"' if ' ' in value else value
+
+def _plugin_name(name: str) -> str:
+    return name.split('/', 1)[1] if name.startswith('material/') else name
+
+def _mkdocs_plugins(mkdocs_yaml: Path, loader: type) -> Tuple[str, List[Tuple[str, Optional[str]]]]:
+    """
+    Return the plugins an MkDocs config enables, following INHERIT.
+
+    Returns:
+        Tuple[str, List[Tuple[str, Optional[str]]]]: The style of the plugin list
+        ('list', 'mapping', 'flow list' or 'flow mapping') and the (name, YAML
+        source) of each plugin. The source is None if the entry refers to nodes
+        outside itself.
+    """
+    text = mkdocs_yaml.read_text(encoding='utf-8')
+    root = yaml.compose(text, Loader=loader)
+    config = {key.value: value for key, value in root.value} if isinstance(root, yaml.MappingNode) else {}
+    plugins = config.get('plugins')
+    if isinstance(plugins, yaml.SequenceNode):
+        entries = [(_node_name(item), _node_source(text, item, item)) for item in plugins.value]
+        return ('flow list' if plugins.flow_style else 'list'), entries
+    if isinstance(plugins, yaml.MappingNode):
+        entries = [(_node_name(key), _node_source(text, key, value)) for key, value in plugins.value]
+        return ('flow mapping' if plugins.flow_style else 'mapping'), entries
+    if plugins is not None:
+        # plugins: with no value enables none
+        return 'list', []
+    parent = config.get('INHERIT')
+    if isinstance(parent, yaml.ScalarNode) and (mkdocs_yaml.parent / parent.value).is_file():
+        return _mkdocs_plugins(mkdocs_yaml.parent / parent.value, loader)
+    # MkDocs enables the search plugin when no plugins are configured
+    return 'list', [('search', 'search')]
+
+def _node_name(node: yaml.Node) -> str:
+    """Return the plugin name of a plugin list entry: a name, or a mapping from the name to options."""
+    if isinstance(node, yaml.MappingNode) and node.value:
+        node = node.value[0][0]
+    return str(node.value) if isinstance(node, yaml.ScalarNode) else ''
+
+def _node_source(text: str, first: yaml.Node, last: yaml.Node) -> Optional[str]:
+    """
+    Return the YAML text from `first` to `last`, indented as in the file.
+
+    Returns None if a node in between is an alias of a node outside that text.
+    """
+    start, end = first.start_mark.index, last.end_mark.index
+    stack = [first, last]
+    while stack:
+        node = stack.pop()
+        if not start <= node.start_mark.index <= end:
+            return None
+        if isinstance(node, yaml.SequenceNode):
+            stack.extend(node.value)
+        elif isinstance(node, yaml.MappingNode):
+            stack.extend(child for pair in node.value for child in pair)
+    return ' ' * first.start_mark.column + text[start:end].rstrip()
+
+def _plugins_yaml(style: str, sources: List[str]) -> str:
+    """Return the `plugins` setting listing the given entries, in the style of the original list."""
+    if style.startswith('flow'):
+        brackets = '{}' if style == 'flow mapping' else '[]'
+        items = ', '.join(source.strip() for source in sources)
+        return f"plugins: {brackets[0]}{items}{brackets[1]}\n"
+    if not sources:
+        return "plugins: []\n"
+    lines = ["plugins:"]
+    for source in sources:
+        if style == 'list':
+            # The entry starts after '- ' in the original list
+            indent = len(source) - len(source.lstrip(' '))
+            source = ' ' * (indent - 2) + '- ' + source.lstrip(' ')
+        lines.append(source)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,150 @@
+"""
+Framework parser registry for DocsForAI.
+
+Parsers are registered by name as "module:function" references and imported
+only when they are first dispatched, so that importing the builder (and the
+CLI) does not pull in heavy optional dependencies such as nbconvert or
+BeautifulSoup. Third-party packages can register additional parsers through
+the `docsforai.parsers` entry point group:
+
+    entry_points={
+        'docsforai.parsers': ['myformat = mypackage.parser:parse_myformat'],
+    }
+"""
+
+import importlib
+import logging
+from typing import Callable, Dict, Iterator, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'docsforai.parsers'
+
+BUILTIN_PARSERS: Dict[str, str] = {
+    'apiblueprint': 'docsforai.builder.frameworks.apiblueprint:parse_apiblueprint',
+    'asciidoc': 'docsforai.builder.frameworks.asciidoc:parse_asciidoc',
+    'docsify': 'docsforai.builder.frameworks.docsify:parse_docsify',
+    'docusaurus': 'docsforai.builder.frameworks.docusaurus:parse_docusaurus',
+    'doxygen': 'docsforai.builder.frameworks.doxygen:parse_doxygen',
+    'gitbook': 'docsforai.builder.frameworks.gitbook:parse_gitbook',
+    'godoc': 'docsforai.builder.frameworks.godoc:parse_godoc',
+    'hugo': 'docsforai.builder.frameworks.hugo:parse_hugo',
+    'javadoc': 'docsforai.builder.frameworks.javadoc:parse_javadoc',
+    'jekyll': 'docsforai.builder.frameworks.jekyll:parse_jekyll',
+    'jsdoc': 'docsforai.builder.frameworks.jsdoc:parse_jsdoc',
+    'jupyter': 'docsforai.builder.frameworks.jupyter:parse_jupyter',
+    'markdown': 'docsforai.builder.frameworks.markdown:parse_markdown',
+    'mkdocs': 'docsforai.builder.frameworks.mkdocs:parse_mkdocs',
+    'openapi': 'docsforai.builder.frameworks.openapi:parse_openapi',
+    'readthedocs': 'docsforai.builder.frameworks.readthedocs:parse_readthedocs',
+    'restructuredtext': 'docsforai.builder.frameworks.restructuredtext:parse_restructuredtext',
+    'rustdoc': 'docsforai.builder.frameworks.rustdoc:parse_rustdoc',
+    'sphinx': 'docsforai.builder.frameworks.sphinx:parse_sphinx',
+    'vuepress': 'docsforai.builder.frameworks.vuepress:parse_vuepress',
+}
+
+def load_reference(reference: str) -> Callable:
+    """
+    Import the object named by a "module:attribute" reference.
+
+    Args:
+        reference (str): Reference such as 'docsforai.builder.frameworks.sphinx:parse_sphinx'.
+
+    Returns:
+        Callable: The referenced object.
+
+    Raises:
+        ValueError: If the reference is malformed.
+    """
+    module_name, _, attribute = reference.partition(':')
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid parser reference: {reference}")
+    obj = importlib.import_module(module_name)
+    for part in attribute.split('.'):
+        obj = getattr(obj, part)
+    return obj
+
+def _entry_point_parsers() -> Dict[str, str]:
+    """Return the parsers registered by installed packages through entry points."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return {}
+
+    try:
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:
+        eps = entry_points().get(ENTRY_POINT_GROUP, [])
+
+    parsers = {}
+    for ep in eps:
+        parsers[ep.name] = ep.value
+    if parsers:
+        logger.debug(f"Found parser entry points: {', '.join(sorted(parsers))}")
+    return parsers
+
+class LazyParserRegistry(Mapping):
+    """
+    Mapping of framework names to parser functions.
+
+    Parser modules are imported on first lookup and cached. Entry points are
+    only scanned when a name is not a built-in parser or when the registry is
+    enumerated. Built-in parsers take precedence over entry points with the
+    same name.
+    """
+
+    def __init__(self, references: Optional[Dict[str, str]] = None, use_entry_points: bool = True):
+        self._references: Dict[str, str] = dict(references or {})
+        self._loaded: Dict[str, Callable] = {}
+        self._use_entry_points = use_entry_points
+        self._entry_points_scanned = False
+
+    def _scan_entry_points(self) -> None:
+        if self._entry_points_scanned or not self._use_entry_points:
+            return
+        self._entry_points_scanned = True
+        for name, reference in _entry_point_parsers().items():
+            self._references.setdefault(name, reference)
+
+    def register(self, name: str, parser: Union[Callable, str]) -> None:
+        """
+        Register a parser.
+
+        Args:
+            name (str): Framework name.
+            parser (Union[Callable, str]): Parser function or "module:function" reference.
+        """
+        self._loaded.pop(name, None)
+        if callable(parser):
+            self._loaded[name] = parser
+            self._references[name] = f"{parser.__module__}:{parser.__qualname__}"
+        else:
+            self._references[name] = parser
+
+    def __getitem__(self, name: str) -> Callable:
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self._references:
+            self._scan_entry_points()
+        reference = self._references[name]
+        logger.debug(f"Loading {name} parser from {reference}")
+        parser = load_reference(reference)
+        self._loaded[name] = parser
+        return parser
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._references:
+            return True
+        self._scan_entry_points()
+        return name in self._references
+
+    def __iter__(self) -> Iterator[str]:
+        self._scan_entry_points()
+        return iter(list(self._references))
+
+    def __len__(self) -> int:
+        self._scan_entry_points()
+        return len(self._references)
+
+# Registry shared by the builder. Parsers are imported when first dispatched.
+FRAMEWORK_PARSERS = LazyParserRegistry(BUILTIN_PARSERS)
@@ -0,0 +1,458 @@
+"""
+Streaming ingestion of rustdoc's JSON output for DocsForAI.
+
+`rustdoc --output-format json` writes one file per crate with every item of
+the crate, with its documentation and full signature, in an `index` object
+keyed by item id. For large workspaces this file takes gigabytes once
+loaded, so it is never loaded at once: the members of its top-level objects
+are decoded one at a time with raw_decode over a sliding buffer. A first
+pass keeps only the item paths and which type or trait owns which method,
+field and variant. A second pass renders the items one by one.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Collection, Dict, IO, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Characters read from the file at a time
+READ_SIZE = 1024 * 1024
+
+# Item kinds that get their own document when they have a path in `paths`
+PAGE_KINDS = {
+    'module', 'struct', 'enum', 'union', 'trait', 'trait_alias', 'function',
+    'type_alias', 'constant', 'static', 'macro', 'proc_macro'
+}
+
+# Item kinds documented on the page of the type or trait that owns them
+OWNED_KINDS = {'function', 'assoc_const', 'assoc_type'}
+
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+
+class _JsonStream:
+    """Tokenizer over a JSON file that decodes one value at a time."""
+
+    def __init__(self, file: IO[str], read_size: int):
+        self._file = file
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append data to the buffer, dropping what has been consumed. Returns False at EOF."""
+        if self._eof:
+            return False
+        # Read at least as much as is pending, so a value larger than the buffer takes
+        # a logarithmic number of decode attempts
+        chunk = self._file.read(max(self._read_size, len(self._buffer) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end of data", self._buffer, self._pos)
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[Tuple[str, Any]]:
+        """Decode the members of the object starting at the next character, one at a time."""
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key, self.value()
+            if self.peek() == '}':
+                self._pos += 1
+                return
+            self.expect(',')
+
+def iter_json_members(
+    path: Path,
+    keys: Collection[str],
+    read_size: int = READ_SIZE
+) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """
+    Stream the top-level members of a JSON object file.
+
+    Top-level values that are objects are decoded member by member, so only
+    one member is held in memory at a time; other values are decoded whole.
+
+    Args:
+        path (Path): JSON file containing an object.
+        keys (Collection[str]): Top-level keys whose values are wanted.
+        read_size (int): Characters read from the file at a time.
+
+    Yields:
+        Tuple[str, Optional[str], Any]: (top-level key, member key, member value) for
+        object values, (top-level key, None, value) for other values.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a valid JSON object.
+    """
+    with path.open('r', encoding='utf-8') as f:
+        stream = _JsonStream(f, read_size)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if stream.peek() == '{':
+                for member, value in stream.members():
+                    if key in keys:
+                        yield key, member, value
+            else:
+                value = stream.value()
+                if key in keys:
+                    yield key, None, value
+            if stream.peek() == '}':
+                return
+            stream.expect(',')
+
+def parse_rustdoc_json(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Render the items of a rustdoc JSON file to Markdown documents.
+
+    Items of the crate with a path (modules with documentation, types, traits,
+    functions, constants, macros...) become one document each. Methods of
+    inherent impls and trait items get their own document, named after their
+    owner; fields and variants are listed on the page of their type. Items of
+    trait impls are skipped.
+
+    Args:
+        path (Path): rustdoc JSON file of one crate.
+
+    Yields:
+        Dict[str, Any]: Parsed items.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    paths, owners, member_lines, format_version = _scan(path)
+    logger.info(f"Reading rustdoc JSON {path.name} (format version {format_version}, {len(paths)} paths)")
+
+    for _, item_id, item in iter_json_members(path, {'index'}):
+        if item.get('crate_id') != 0 or not item.get('name') or not isinstance(item.get('inner'), dict):
+            continue
+        kind, inner = next(iter(item['inner'].items()))
+        item_id = str(item_id)
+        if item_id in paths and kind in PAGE_KINDS:
+            name = '::'.join(paths[item_id])
+            if kind == 'module' and not item.get('docs') and len(paths[item_id]) > 1:
+                continue
+        elif item_id in owners and kind in OWNED_KINDS and owners[item_id] in paths:
+            name = '::'.join(paths[owners[item_id]] + [item['name']])
+            kind = 'method' if kind == 'function' else kind
+        else:
+            continue
+
+        yield {
+            'type': f"rustdoc_{kind}",
+            'filename': f"{name.replace('::', '_')}.md",
+            'content': _render_item(kind, name, item, inner, member_lines.get(item_id))
+        }
+
+def _scan(path: Path) -> Tuple[Dict[str, List[str]], Dict[str, str], Dict[str, List[str]], Any]:
+    """
+    First pass: collect the paths of the crate's items and the owners of members.
+
+    Returns:
+        Tuple: Paths by item id, owner id by member id, rendered field and variant
+        lines by owner id, and the format version.
+    """
+    paths: Dict[str, List[str]] = {}
+    owners: Dict[str, str] = {}
+    children: Dict[str, List[str]] = {}
+    lines: Dict[str, str] = {}
+    format_version = None
+
+    for key, member, value in iter_json_members(path, {'index', 'paths', 'format_version'}):
+        if key == 'format_version':
+            format_version = value
+        elif key == 'paths':
+            if value.get('crate_id') == 0:
+                paths[str(member)] = list(value.get('path') or [])
+        elif isinstance(value.get('inner'), dict):
+            kind, inner = next(iter(value['inner'].items()))
+            if kind == 'impl':
+                target = (inner.get('for') or {}).get('resolved_path')
+                synthetic = inner.get('is_synthetic', inner.get('synthetic'))
+                if inner.get('trait') is None and not synthetic and target:
+                    for child in inner.get('items') or []:
+                        owners[str(child)] = str(target.get('id'))
+            elif kind == 'trait':
+                for child in inner.get('items') or []:
+                    owners[str(child)] = str(member)
+            elif kind in ('struct', 'union', 'enum'):
+                children[str(member)] = [str(child) for child in _member_ids(kind, inner)]
+            elif kind in ('struct_field', 'variant') and value.get('name'):
+                lines[str(member)] = _member_line(kind, value, inner)
+
+    member_lines = {
+        owner: [lines[child] for child in child_ids if child in lines]
+        for owner, child_ids in children.items()
+    }
+    return paths, owners, member_lines, format_version
+
+def _member_ids(kind: str, inner: Dict[str, Any]) -> List[Any]:
+    """Return the ids of the fields or variants of a struct, union or enum."""
+    if kind == 'enum':
+        return inner.get('variants') or []
+    if kind == 'union':
+        return inner.get('fields') or []
+    struct_kind = inner.get('kind')
+    if isinstance(struct_kind, dict):
+        if 'plain' in struct_kind:
+            return struct_kind['plain'].get('fields') or []
+        if 'tuple' in struct_kind:
+            return [field for field in struct_kind['tuple'] if field is not None]
+    # Format versions before the struct kinds
+    return inner.get('fields') or []
+
+def _member_line(kind: str, item: Dict[str, Any], inner: Any) -> str:
+    """Render a field or variant as a list item."""
+    if kind == 'struct_field':
+        declaration = f"{item['name']}: {render_type(inner)}"
+    else:
+        declaration = item['name']
+        variant_kind = inner.get('kind') if isinstance(inner, dict) else None
+        if isinstance(variant_kind, dict) and 'tuple' in variant_kind:
+            declaration += '(..)'
+        elif isinstance(variant_kind, dict) and 'struct' in variant_kind:
+            declaration += ' { .. }'
+    summary = (item.get('docs') or '').strip().split('\n\n', 1)[0].replace('\n', ' ')
+    return f"- `{declaration}`" + (f": {summary}" if summary else '')
+
+def _render_item(
+    kind: str,
+    name: str,
+    item: Dict[str, Any],
+    inner: Any,
+    member_lines: Optional[List[str]]
+) -> str:
+    """Render one item: title, signature, documentation, then fields or variants."""
+    content = [f"# {kind.replace('_', ' ').capitalize()}: {name}\n"]
+    signature = _signature(kind, item, inner)
+    if signature:
+        content.append(f"\n```rust\n{signature}\n```\n")
+    if item.get('docs'):
+        content.append(f"\n{item['docs'].strip()}\n")
+    if member_lines:
+        title = 'Variants' if kind == 'enum' else 'Fields'
+        content.append(f"\n## {title}\n\n" + '\n'.join(member_lines) + '\n')
+    return '\n'.join(content)
+
+def _signature(kind: str, item: Dict[str, Any], inner: Any) -> str:
+    """Return the Rust declaration of an item."""
+    name = item['name']
+    visibility = _visibility(item.get('visibility'))
+    if not isinstance(inner, dict):
+        # Macros are stored as their source; unit variants as strings
+        return inner if kind == 'macro' and isinstance(inner, str) else ''
+    generics = _generics(inner.get('generics'))
+    if kind in ('function', 'method'):
+        return visibility + _function_signature(name, inner, generics)
+    if kind in ('struct', 'enum', 'union'):
+        return f"{visibility}{kind} {name}{generics}"
+    if kind == 'trait':
+        bounds = _bounds(inner.get('bounds'))
+        return f"{visibility}{'unsafe ' if inner.get('is_unsafe') else ''}trait {name}{generics}" + (
+            f": {bounds}" if bounds else ''
+        )
+    if kind == 'type_alias':
+        return f"{visibility}type {name}{generics} = {render_type(inner.get('type'))};"
+    if kind in ('constant', 'assoc_const'):
+        const = inner.get('const') if isinstance(inner.get('const'), dict) else inner
+        value = const.get('expr') or inner.get('value') or inner.get('default')
+        return f"{visibility}const {name}: {render_type(inner.get('type'))}" + (f" = {value}" if value else '') + ';'
+    if kind == 'static':
+        mutable = 'mut ' if inner.get('is_mutable', inner.get('mutable')) else ''
+        return f"{visibility}static {mutable}{name}: {render_type(inner.get('type'))};"
+    if kind == 'assoc_type':
+        bounds = _bounds(inner.get('bounds'))
+        default = inner.get('type', inner.get('default'))
+        return f"type {name}{generics}" + (f": {bounds}" if bounds else '') + (
+            f" = {render_type(default)}" if default else ''
+        ) + ';'
+    if kind == 'proc_macro':
+        macro_kind = inner.get('kind')
+        if macro_kind == 'derive':
+            return f"#[derive({name})]"
+        return f"#[{name}]" if macro_kind == 'attr' else f"{name}!()"
+    return ''
+
+def _function_signature(name: str, inner: Dict[str, Any], generics: str) -> str:
+    # 'sig' and 'is_*' header flags since format version 33, 'decl' and bare flags before
+    signature = inner.get('sig') or inner.get('decl') or {}
+    header = inner.get('header') or {}
+    qualifiers = ''.join(
+        f"{qualifier} " for qualifier in ('const', 'async', 'unsafe')
+        if header.get(f'is_{qualifier}', header.get(qualifier))
+    )
+    inputs = ', '.join(_parameter(parameter, ptype) for parameter, ptype in signature.get('inputs') or [])
+    output = signature.get('output')
+    return f"{qualifiers}fn {name}{generics}({inputs})" + (f" -> {render_type(output)}" if output else '')
+
+def _parameter(name: str, ptype: Any) -> str:
+    rendered = render_type(ptype)
+    # Receivers: self, &self, &'a mut self
+    if name == 'self' and rendered.endswith('Self') and (rendered == 'Self' or rendered.startswith('&')):
+        return rendered[:-4] + 'self'
+    return f"{name}: {rendered}"
+
+def _visibility(visibility: Any) -> str:
+    if visibility == 'public':
+        return 'pub '
+    if visibility == 'crate':
+        return 'pub(crate) '
+    if isinstance(visibility, dict) and 'restricted' in visibility:
+        return f"pub(in {visibility['restricted'].get('path', '')}) "
+    return ''
+
+def _generics(generics: Optional[Dict[str, Any]]) -> str:
+    """Render generic parameters, without the ones rustdoc adds for `impl Trait` arguments."""
+    params = []
+    for param in (generics or {}).get('params') or []:
+        kind = param.get('kind') or {}
+        if 'lifetime' in kind:
+            params.append(param['name'])
+        elif 'type' in kind:
+            if kind['type'].get('is_synthetic', kind['type'].get('synthetic')):
+                continue
+            bounds = _bounds(kind['type'].get('bounds'))
+            params.append(f"{param['name']}: {bounds}" if bounds else param['name'])
+        elif 'const' in kind:
+            params.append(f"const {param['name']}: {render_type(kind['const'].get('type'))}")
+    return f"<{', '.join(params)}>" if params else ''
+
+def _bounds(bounds: Optional[List[Any]]) -> str:
+    rendered = []
+    for bound in bounds or []:
+        if isinstance(bound, dict) and 'trait_bound' in bound:
+            modifier = '?' if bound['trait_bound'].get('modifier') == 'maybe' else ''
+            rendered.append(modifier + _path(bound['trait_bound'].get('trait')))
+        elif isinstance(bound, dict) and 'outlives' in bound:
+            rendered.append(bound['outlives'])
+    return ' + '.join(rendered)
+
+def _path(path: Optional[Dict[str, Any]]) -> str:
+    """Render a resolved path with its generic arguments."""
+    if not path:
+        return ''
+    # 'path' since format version 42, 'name' before
+    name = path.get('path') or path.get('name') or ''
+    args = path.get('args')
+    if not isinstance(args, dict):
+        return name
+    if 'angle_bracketed' in args:
+        angle = args['angle_bracketed']
+        rendered = [_generic_arg(arg) for arg in angle.get('args') or []]
+        for constraint in angle.get('constraints') or angle.get('bindings') or []:
+            binding = constraint.get('binding') or {}
+            if 'equality' in binding:
+                term = binding['equality']
+                rendered.append(f"{constraint.get('name')} = {render_type(term.get('type', term))}")
+        return f"{name}<{', '.join(rendered)}>" if rendered else name
+    if 'parenthesized' in args:
+        parenthesized = args['parenthesized']
+        inputs = ', '.join(render_type(input_type) for input_type in parenthesized.get('inputs') or [])
+        output = parenthesized.get('output')
+        return f"{name}({inputs})" + (f" -> {render_type(output)}" if output else '')
+    return name
+
+def _generic_arg(arg: Any) -> str:
+    if not isinstance(arg, dict):
+        return '_'
+    if 'lifetime' in arg:
+        return arg['lifetime']
+    if 'type' in arg:
+        return render_type(arg['type'])
+    if 'const' in arg:
+        return str(arg['const'].get('expr', '_'))
+    return '_'
+
+def render_type(rtype: Any) -> str:
+    """
+    Render a type of rustdoc's JSON format as Rust source.
+
+    Args:
+        rtype (Any): Type value (e.g. `{"primitive": "u8"}`).
+
+    Returns:
+        str: The type, e.g. `&'a mut [u8]`.
+    """
+    if not isinstance(rtype, dict) or not rtype:
+        return '_'
+    kind, value = next(iter(rtype.items()))
+    if kind in ('primitive', 'generic'):
+        return value
+    if kind == 'resolved_path':
+        return _path(value)
+    if kind == 'borrowed_ref':
+        lifetime = f"{value['lifetime']} " if value.get('lifetime') else ''
+        mutable = 'mut ' if value.get('is_mutable', value.get('mutable')) else ''
+        return f"&{lifetime}{mutable}{render_type(value.get('type'))}"
+    if kind == 'raw_pointer':
+        mutable = 'mut' if value.get('is_mutable', value.get('mutable')) else 'const'
+        return f"*{mutable} {render_type(value.get('type'))}"
+    if kind == 'tuple':
+        elements = [render_type(element) for element in value]
+        return f"({elements[0]},)" if len(elements) == 1 else f"({', '.join(elements)})"
+    if kind == 'slice':
+        return f"[{render_type(value)}]"
+    if kind == 'array':
+        return f"[{render_type(value.get('type'))}; {value.get('len')}]"
+    if kind == 'impl_trait':
+        return f"impl {_bounds(value)}"
+    if kind == 'dyn_trait':
+        traits = [_path(poly.get('trait')) for poly in value.get('traits') or []]
+        if value.get('lifetime'):
+            traits.append(value['lifetime'])
+        return f"dyn {' + '.join(traits)}"
+    if kind == 'qualified_path':
+        self_type = render_type(value.get('self_type'))
+        trait = _path(value.get('trait'))
+        return f"<{self_type} as {trait}>::{value.get('name')}" if trait else f"{self_type}::{value.get('name')}"
+    if kind == 'function_pointer':
+        signature = value.get('sig') or value.get('decl') or {}
+        inputs = ', '.join(render_type(ptype) for _, ptype in signature.get('inputs') or [])
+        output = signature.get('output')
+        return f"fn({inputs})" + (f" -> {render_type(output)}" if output else '')
+    return '_'
@@ -0,0 +1,286 @@
+"""
+Hugo content extraction without the Hugo binary.
+
+Hugo pages are Markdown with front matter and shortcodes. The front matter
+(YAML, TOML or JSON) is parsed by docsforai.builder.dedup.split_front_matter;
+this module expands the shortcodes that matter for the text of a page in
+Python: `ref`/`relref` become page URLs, `highlight` becomes a fenced code
+block, `include`/`readfile`-style shortcodes inline the referenced file,
+`param` reads the site parameters and `figure` becomes an image. Other
+shortcodes are replaced by their inner content, or dropped when they have
+none.
+"""
+
+import logging
+import re
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from docsforai.builder.dedup import page_key, split_front_matter
+
+logger = logging.getLogger(__name__)
+
+INCLUDE_SHORTCODES = {'include', 'readfile', 'include-file', 'import'}
+REF_SHORTCODES = {'ref', 'relref'}
+
+# Shortcodes that never take inner content; they are not waited on for a closing tag
+INLINE_SHORTCODES = REF_SHORTCODES | INCLUDE_SHORTCODES | {'param', 'figure'}
+
+# Nesting limit for included files including other files
+MAX_INCLUDE_DEPTH = 5
+
+_SHORTCODE_RE = re.compile(
+    r'\{\{(?P<comment>[<%])/\*(?P<literal>.*?)\*/[>%]\}\}'
+    r'|\{\{(?P<delim>[<%])-?\s*(?P<close>/)?\s*(?P<name>[\w./-]+)(?P<args>.*?)(?P<selfclose>/)?\s*-?[>%]\}\}',
+    re.DOTALL
+)
+_ARG_RE = re.compile(r'(?:([\w-]+)=)?("(?:[^"\\]|\\.)*"|`[^`]*`|[^\s"`]+)')
+
+Node = Union[str, 'Shortcode']
+
+def _parse_args(raw: str) -> Tuple[List[str], Dict[str, str]]:
+    """Split shortcode arguments into positional and named values."""
+    positional: List[str] = []
+    named: Dict[str, str] = {}
+    for name, value in _ARG_RE.findall(raw):
+        if value[:1] == '"':
+            value = value[1:-1].replace('\\"', '"')
+        elif value[:1] == '`':
+            value = value[1:-1]
+        if name:
+            named[name] = value
+        else:
+            positional.append(value)
+    return positional, named
+
+def _normalize(path: str) -> str:
+    """Resolve '.' and '..' segments of a relative POSIX path."""
+    parts: List[str] = []
+    for part in path.split('/'):
+        if part == '..':
+            if parts:
+                parts.pop()
+        elif part and part != '.':
+            parts.append(part)
+    return '/'.join(parts)
+
+class Shortcode:
+    """A shortcode call, with its inner content if it has a closing tag."""
+
+    __slots__ = ('name', 'raw_args', 'children', '_args')
+
+    def __init__(self, name: str, raw_args: str):
+        self.name = name
+        self.raw_args = raw_args
+        self.children: List[Node] = []
+        self._args: Optional[Tuple[List[str], Dict[str, str]]] = None
+
+    def arg(self, index: int, *names: str) -> Optional[str]:
+        """Return a named argument, or the positional argument at `index`."""
+        if self._args is None:
+            # Parsed on demand: most shortcodes are rendered without their arguments
+            self._args = _parse_args(self.raw_args)
+        positional, named = self._args
+        for name in names:
+            if name in named:
+                return named[name]
+        return positional[index] if index < len(positional) else None
+
+def parse_shortcodes(text: str) -> List[Node]:
+    """
+    Parse text into plain strings and shortcode calls.
+
+    Closing tags are matched with the nearest open shortcode of the same name;
+    shortcodes that are never closed are self-closing.
+
+    Args:
+        text (str): Page body.
+
+    Returns:
+        List[Node]: Top-level nodes.
+    """
+    root: List[Node] = []
+    stack: List[Shortcode] = []
+
+    def append(node: Node) -> None:
+        (stack[-1].children if stack else root).append(node)
+
+    position = 0
+    for match in _SHORTCODE_RE.finditer(text):
+        if match.start() > position:
+            append(text[position:match.start()])
+        position = match.end()
+        if match.group('comment'):
+            # {{</* x */>}} is the escaped, literal form of {{< x >}}
+            delim = match.group('comment')
+            append(f"{{{{{delim}{match.group('literal')}{'>' if delim == '<' else '%'}}}}}")
+            continue
+        name = match.group('name')
+        if match.group('close'):
+            if not any(open_code.name == name for open_code in stack):
+                continue
+            while stack:
+                open_code = stack.pop()
+                if open_code.name == name:
+                    break
+                # Never closed: its content belongs to the parent
+                children, open_code.children = open_code.children, []
+                (stack[-1].children if stack else root).extend(children)
+            continue
+        shortcode = Shortcode(name, match.group('args'))
+        append(shortcode)
+        if not match.group('selfclose') and name.lower() not in INLINE_SHORTCODES:
+            stack.append(shortcode)
+    if position < len(text):
+        append(text[position:])
+    while stack:
+        open_code = stack.pop()
+        children, open_code.children = open_code.children, []
+        (stack[-1].children if stack else root).extend(children)
+    return root
+
+class ShortcodeExpander:
+    """
+    Expands the shortcodes of the pages of one Hugo site.
+
+    Call add_page() for every page first, so that `ref` and `relref` can
+    resolve links between pages, then expand() each page body.
+    """
+
+    def __init__(self, site_dir: Path, content_dir: Path, params: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            site_dir (Path): Root of the Hugo site.
+            content_dir (Path): Content directory of the site.
+            params (Optional[Dict[str, Any]]): Site parameters (`params` of the site configuration).
+        """
+        self.site_dir = site_dir
+        self.content_dir = content_dir
+        self.params = params or {}
+        self._urls: Dict[str, str] = {}
+        self._names: Dict[str, Optional[str]] = {}
+
+    def add_page(self, filename: str, front_matter: Dict[str, Any]) -> str:
+        """
+        Register a page and return the URL it is served at.
+
+        Args:
+            filename (str): Path of the page relative to the content directory.
+            front_matter (Dict[str, Any]): Front matter of the page.
+
+        Returns:
+            str: URL path of the page.
+        """
+        url = front_matter.get('url')
+        if not isinstance(url, str):
+            key = page_key(filename)
+            slug = front_matter.get('slug')
+            if isinstance(slug, str) and slug and key:
+                key = '/'.join(key.split('/')[:-1] + [slug.strip('/').lower()])
+            url = f"/{key}/" if key else '/'
+        self._urls[filename] = url
+        name = filename.rpartition('/')[2]
+        # Hugo also resolves references by file name, if it is unique
+        self._names[name] = None if name in self._names else filename
+        return url
+
+    def expand(self, body: str, filename: str, depth: int = 0) -> str:
+        """
+        Expand the shortcodes of a page body.
+
+        Args:
+            body (str): Page body without front matter.
+            filename (str): Path of the page relative to the content directory.
+            depth (int): Include nesting depth.
+
+        Returns:
+            str: Markdown without shortcodes.
+        """
+        return self._render(parse_shortcodes(body), filename, depth)
+
+    def _render(self, nodes: List[Node], filename: str, depth: int) -> str:
+        return ''.join(
+            node if isinstance(node, str) else self._render_shortcode(node, filename, depth)
+            for node in nodes
+        )
+
+    def _render_shortcode(self, shortcode: Shortcode, filename: str, depth: int) -> str:
+        name = shortcode.name.lower()
+        inner = self._render(shortcode.children, filename, depth)
+        if name in REF_SHORTCODES:
+            target = shortcode.arg(0, 'path', 'page')
+            return self._resolve_ref(target, filename) if target else ''
+        if name == 'highlight':
+            language = shortcode.arg(0, 'lang') or ''
+            code = inner.strip('\r\n')
+            return f"```{language}\n{code}\n```"
+        if name in INCLUDE_SHORTCODES:
+            target = shortcode.arg(0, 'file', 'path', 'src')
+            return self._include(target, filename, depth) if target else inner
+        if name == 'param':
+            value = self._param(shortcode.arg(0, 'name'))
+            return '' if value is None else str(value)
+        if name == 'figure':
+            src = shortcode.arg(0, 'src')
+            alt = shortcode.arg(1, 'alt', 'caption', 'title') or ''
+            return f"![{alt}]({src})" if src else ''
+        return inner
+
+    def _resolve_ref(self, target: str, filename: str) -> str:
+        """Return the URL of the page a ref/relref points at."""
+        path, _, anchor = target.partition('#')
+        anchor = f"#{anchor}" if anchor else ''
+        if not path:
+            return anchor
+        if path.startswith('/'):
+            candidates = [path]
+        else:
+            current_dir = filename.rpartition('/')[0]
+            candidates = [f"{current_dir}/{path}" if current_dir else path, path]
+        for candidate in candidates:
+            candidate = _normalize(candidate)
+            for suffix in ('', '.md', '/_index.md', '/index.md'):
+                if candidate + suffix in self._urls:
+                    return self._urls[candidate + suffix] + anchor
+        unique = self._names.get(path.rpartition('/')[2])
+        if unique is not None:
+            return self._urls[unique] + anchor
+        logger.debug(f"Unresolved ref {target} in {filename}")
+        return f"/{page_key(path)}/{anchor}"
+
+    def _include(self, target: str, filename: str, depth: int) -> str:
+        """Return the content of an included file, with its shortcodes expanded."""
+        if depth >= MAX_INCLUDE_DEPTH:
+            logger.warning(f"Include depth limit reached in {filename}, not including {target}")
+            return ''
+        page_dir = self.content_dir / PurePosixPath(filename).parent
+        relative = target.lstrip('/')
+        for base in (page_dir, self.content_dir, self.site_dir):
+            path = base / relative
+            if path.is_file():
+                break
+        else:
+            logger.warning(f"Included file {target} not found for {filename}")
+            return ''
+        # Pages come from the repository being documented; never read files outside the site
+        path = path.resolve()
+        site_root = self.site_dir.resolve()
+        if site_root not in path.parents:
+            logger.warning(f"Included file {target} is outside the site, not including it in {filename}")
+            return ''
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Cannot include {path}: {str(e)}")
+            return ''
+        _, body = split_front_matter(content)
+        return self.expand(body, filename, depth + 1)
+
+    def _param(self, name: Optional[str]) -> Any:
+        """Return a (dotted) site parameter."""
+        value: Any = self.params
+        for part in (name or '').split('.'):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part, value.get(part.lower()))
+        return value
@@ -0,0 +1,167 @@
+"""
+Sphinx build runners for DocsForAI.
+
+By default Sphinx runs as a `sphinx-build` subprocess, which imports Sphinx
+and every extension from scratch for each build. The in-process runner keeps
+warm worker processes instead, one per concurrent build, and runs the builds
+in them through Sphinx's own command-line entry point, so later builds of a
+batch (several roots of a monorepo, or several packages built from one
+Python process) skip those imports. The workers are stopped when the Python
+process exits. Both runners pass `-j` to use Sphinx's parallel read and
+write; the CPU budget is shared between the concurrent builds, so workers
+times jobs never exceeds it.
+"""
+
+import atexit
+import contextlib
+import io
+import logging
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ..utils import run_subprocess_with_logging
+from ..utils.subprocess_utils import process_pool_context
+
+logger = logging.getLogger(__name__)
+
+SPHINX_RUNNERS = ['subprocess', 'inprocess']
+DEFAULT_RUNNER = 'subprocess'
+
+_cpu_budget: Optional[int] = None
+_concurrent_builds: int = 1
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+def configure_sphinx_runner(cpu_budget: Optional[int] = None, concurrent_builds: int = 1) -> None:
+    """
+    Configure the Sphinx runners for the current build.
+
+    Args:
+        cpu_budget (Optional[int]): Maximum number of Sphinx jobs. Defaults to the CPU count.
+        concurrent_builds (int): Number of Sphinx builds that may run at the same time
+            (monorepo roots parsed in parallel). Each gets an equal share of the budget.
+    """
+    global _cpu_budget, _concurrent_builds
+    _cpu_budget = cpu_budget
+    _concurrent_builds = max(1, concurrent_builds)
+    logger.debug(f"Sphinx runner configured with cpu_budget={cpu_budget}, concurrent_builds={_concurrent_builds}")
+
+def _budget() -> int:
+    """Return the CPU budget, capped by the CPU count."""
+    cpus = os.cpu_count() or 1
+    return min(_cpu_budget or cpus, cpus)
+
+def resolve_jobs(requested: Optional[int] = None) -> int:
+    """
+    Return the number of parallel Sphinx jobs to use.
+
+    Args:
+        requested (Optional[int]): Job count requested in the configuration.
+
+    Returns:
+        int: The requested count, or the share of the CPU budget of one concurrent
+        build, capped by that share.
+    """
+    limit = max(1, _budget() // _concurrent_builds)
+    return max(1, min(requested or limit, limit))
+
+def run_sphinx(
+    builder: str,
+    source_dir: Path,
+    build_dir: Path,
+    sphinx_args: Optional[List[str]] = None,
+    runner: Optional[str] = None,
+    isolate_dir: Optional[Path] = None
+) -> None:
+    """
+    Run a Sphinx build.
+
+    Args:
+        builder (str): Sphinx builder name, e.g. 'html'.
+        source_dir (Path): Sphinx source directory (containing conf.py).
+        build_dir (Path): Output directory.
+        sphinx_args (Optional[List[str]]): Additional sphinx-build arguments.
+        runner (Optional[str]): 'subprocess' (default) or 'inprocess'.
+        isolate_dir (Optional[Path]): Directory whose Python modules imported by the build
+            (e.g. the documented package, through autodoc) are unloaded from the warm
+            worker afterwards, so a later build never sees them. Defaults to `source_dir`.
+
+    Raises:
+        ValueError: If the runner is not supported.
+        subprocess.CalledProcessError: If the build fails.
+    """
+    runner = runner or DEFAULT_RUNNER
+    if runner not in SPHINX_RUNNERS:
+        raise ValueError(f"Unsupported Sphinx runner: {runner}. Must be one of: {', '.join(SPHINX_RUNNERS)}")
+
+    cmd = ['sphinx-build', '-b', builder, str(source_dir), str(build_dir)]
+    if runner == 'subprocess':
+        run_subprocess_with_logging(cmd, additional_args=sphinx_args)
+        return
+
+    argv = cmd[1:] + list(sphinx_args or [])
+    logger.debug(f"Running in-process Sphinx build: {' '.join(argv)}")
+    future = _get_executor().submit(_build_in_worker, argv, str((isolate_dir or source_dir).resolve()))
+    status, output = future.result()
+    if status != 0:
+        logger.error(f"Sphinx build failed with exit code {status}")
+        if output:
+            logger.error(f"Sphinx output:\n{output}")
+        raise subprocess.CalledProcessError(status, cmd + list(sphinx_args or []), output=output)
+    logger.debug("Sphinx build completed successfully")
+
+def shutdown_sphinx_runner() -> None:
+    """Stop the warm Sphinx worker processes, if any."""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+            _executor_workers = 0
+
+atexit.register(shutdown_sphinx_runner)
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the warm workers, one per concurrent build, (re)starting them when that count changes."""
+    global _executor, _executor_workers
+    workers = min(_concurrent_builds, _budget())
+    with _executor_lock:
+        if _executor is not None and _executor_workers != workers:
+            _executor.shutdown()
+            _executor = None
+        if _executor is None:
+            # Builds are submitted from parser threads, which forking could deadlock
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context())
+            _executor_workers = workers
+            logger.debug(f"Started {workers} warm Sphinx workers")
+        return _executor
+
+def _build_in_worker(argv: List[str], isolate_dir: str) -> Tuple[int, str]:
+    """Run sphinx-build in the worker process and return its exit status and output."""
+    from sphinx.cmd.build import build_main
+
+    modules_before = set(sys.modules)
+    path_before = list(sys.path)
+    cwd_before = os.getcwd()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            status = build_main(argv)
+    except BaseException as e:  # SystemExit from conf.py or an extension included
+        status = e.code if isinstance(e, SystemExit) and isinstance(e.code, int) else 1
+        output.write(f"\n{type(e).__name__}: {e}")
+    finally:
+        os.chdir(cwd_before)
+        sys.path[:] = path_before
+        prefix = isolate_dir.rstrip(os.sep) + os.sep
+        for name in set(sys.modules) - modules_before:
+            module_file = getattr(sys.modules.get(name), '__file__', None) or ''
+            if module_file.startswith(prefix):
+                del sys.modules[name]
+    return status, output.getvalue()
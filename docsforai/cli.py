@@ -9,10 +9,6 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from .builder import build_documentation
-from .downloader.github_api import download_from_github
-from .utils import parse_config
-
 # Configure logging
 logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -47,6 +43,8 @@ def download(package_name: str, version: Optional[str], output: str):
     
     PACKAGE_NAME: Name of the package to download documentation for
     """
+    from .downloader.github_api import download_from_github
+
     try:
         logger.debug(f"Downloading documentation for {package_name} (version: {version}) to {output}")
         output_path = Path(output)
@@ -64,6 +62,9 @@ def build(config_path: str):
     
     CONFIG_PATH: Path to the YAML configuration file
     """
+    from .builder import build_documentation
+    from .utils import parse_config
+
     try:
         logger.debug(f"Building documentation using config file: {config_path}")
         # Convert string path to Path object
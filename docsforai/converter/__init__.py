@@ -4,9 +4,21 @@ Converter module for DocsForAI.
 This module provides functionality to convert between different documentation formats.
 """
 
-from .rst_to_md import rst_to_md
-from .adoc_to_md import adoc_to_md
-from .html_to_md import html_to_md
-from .ipynb_to_md import ipynb_to_md
+import importlib
+
+# Converters are imported on first access (PEP 562): they depend on docutils,
+# BeautifulSoup/html2text and nbconvert, which most commands never need.
+_CONVERTER_MODULES = {
+    'rst_to_md': '.rst_to_md',
+    'adoc_to_md': '.adoc_to_md',
+    'html_to_md': '.html_to_md',
+    'ipynb_to_md': '.ipynb_to_md',
+}
+
+def __getattr__(name):
+    if name in _CONVERTER_MODULES:
+        module = importlib.import_module(_CONVERTER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ['rst_to_md', 'adoc_to_md', 'html_to_md', 'ipynb_to_md']
\ No newline at end of file
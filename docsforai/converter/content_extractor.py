@@ -0,0 +1,161 @@
+"""
+Main-content extraction for built documentation pages.
+
+Documentation themes repeat the same navigation sidebar, header, footer and
+search widgets on every page. This module cuts a built page down to its main
+article before it is converted to Markdown, using per-framework selectors for
+the common themes and a heuristic fallback for everything else.
+
+Extraction works on the raw HTML with a tag-balancing scan instead of a full
+DOM parse, so it costs far less than the conversion it saves.
+"""
+
+import functools
+import logging
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever extraction output changes, to invalidate cached conversions.
+EXTRACTOR_VERSION = 1
+
+# Selectors tried in order for each framework. Supported forms are 'tag',
+# '.class', '#id', '[attr=value]' and combinations such as 'div.body' or
+# 'div[role=main]'.
+FRAMEWORK_SELECTORS: Dict[str, List[str]] = {
+    # alabaster/classic: div.body[role=main]; Read the Docs: div.rst-content div[role=main];
+    # furo: article[role=main]; pydata/book themes: main#main-content, article.bd-article
+    'sphinx': ['article[role=main]', 'div.body', 'div[role=main]', 'article.bd-article', 'div.document'],
+    # Material: article.md-content__inner; default/readthedocs themes: div[role=main]
+    'mkdocs': ['article.md-content__inner', 'div[role=main]', 'div.rst-content', 'div.col-md-9'],
+    'docusaurus': ['div.theme-doc-markdown', 'article', 'main'],
+    'hugo': ['div.td-content', 'article.book-article', 'main', 'article', 'div#content', 'div.content'],
+    'jekyll': ['div.post-content', 'section.main-content', 'main', 'article', 'div#main-content'],
+    'vuepress': ['div.theme-default-content', 'div.content__default', 'main.page', 'main'],
+}
+
+# Fallback selectors for pages of any framework.
+FALLBACK_SELECTORS = ['main', '[role=main]', 'article', 'div#content', 'div.content']
+
+# Chrome elements removed when no main-content element is found.
+CHROME_TAGS = ['nav', 'header', 'footer', 'aside', 'script', 'style', 'noscript']
+
+# Extracted content with less text than this is treated as a failed match.
+MIN_CONTENT_CHARS = 32
+
+_SELECTOR_RE = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?'
+    r'(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|\[(?P<attr>[\w-]+)=["\']?(?P<value>[^\]"\']+)["\']?\])?$'
+)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+_TAG_TEXT_RE = re.compile(r'<[^>]*>')
+
+@functools.lru_cache(maxsize=None)
+def _parse_selector(selector: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Parse a selector into (tag, attribute, value).
+
+    Raises:
+        ValueError: If the selector is not supported.
+    """
+    match = _SELECTOR_RE.match(selector.strip())
+    if not match or not any(match.groupdict().values()):
+        raise ValueError(f"Unsupported content selector: {selector}")
+    tag = match.group('tag').lower() if match.group('tag') else None
+    if match.group('cls'):
+        return tag, 'class', match.group('cls')
+    if match.group('id'):
+        return tag, 'id', match.group('id')
+    if match.group('attr'):
+        return tag, match.group('attr').lower(), match.group('value')
+    return tag, None, None
+
+@functools.lru_cache(maxsize=None)
+def _start_tag_re(tag: Optional[str]) -> 're.Pattern[str]':
+    name = re.escape(tag) if tag else r'[a-zA-Z][\w-]*'
+    return re.compile(rf'<({name})(?=[\s/>])[^>]*>', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=None)
+def _tag_re(tag: str) -> 're.Pattern[str]':
+    return re.compile(rf'<(/?){re.escape(tag)}(?=[\s/>])[^>]*?(/?)>', re.IGNORECASE)
+
+def _attributes_match(start_tag: str, attr: Optional[str], value: Optional[str]) -> bool:
+    if attr is None:
+        return True
+    for name, dq, sq, bare in _ATTR_RE.findall(start_tag):
+        if name.lower() != attr:
+            continue
+        actual = dq or sq or bare
+        if attr == 'class':
+            return value in actual.split()
+        return actual == value
+    return False
+
+def _element_end(html: str, tag: str, start: int) -> int:
+    """Return the end offset of the element whose start tag ends at `start`."""
+    depth = 1
+    for match in _tag_re(tag).finditer(html, start):
+        if match.group(2):
+            continue  # self-closing
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.end()
+    return len(html)
+
+def _select(html: str, selector: str) -> Optional[str]:
+    """Return the HTML of the first element matching `selector`, or None."""
+    tag, attr, value = _parse_selector(selector)
+    for match in _start_tag_re(tag).finditer(html):
+        if _attributes_match(match.group(0), attr, value):
+            end = _element_end(html, match.group(1), match.end())
+            return html[match.start():end]
+    return None
+
+def _text_length(html: str) -> int:
+    return len(_TAG_TEXT_RE.sub('', html).strip())
+
+def _strip_chrome(html: str) -> str:
+    """Remove navigation, header, footer, sidebar and script elements."""
+    for tag in CHROME_TAGS:
+        pieces = []
+        position = 0
+        start_re = _start_tag_re(tag)
+        while True:
+            match = start_re.search(html, position)
+            if match is None:
+                break
+            pieces.append(html[position:match.start()])
+            position = _element_end(html, tag, match.end())
+        pieces.append(html[position:])
+        html = ''.join(pieces)
+    return html
+
+def extract_main_content(
+    html: str,
+    framework: Optional[str] = None,
+    selectors: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Cut a built page down to its main content.
+
+    Custom selectors are tried first, then the selectors of `framework`, then
+    generic ones (main, [role=main], article, ...). If none matches an element
+    with meaningful text, navigation, header, footer, sidebar and script
+    elements are stripped from the page instead.
+
+    Args:
+        html (str): HTML of a built page.
+        framework (Optional[str]): Framework that built the page, e.g. 'sphinx'.
+        selectors (Optional[Sequence[str]]): Additional selectors tried before the built-in ones.
+
+    Returns:
+        str: HTML of the main content.
+    """
+    candidates = list(selectors or []) + FRAMEWORK_SELECTORS.get(framework, []) + FALLBACK_SELECTORS
+    for selector in candidates:
+        content = _select(html, selector)
+        if content is not None and _text_length(content) >= MIN_CONTENT_CHARS:
+            logger.debug(f"Extracted main content with selector {selector}")
+            return content
+    return _strip_chrome(html)
@@ -0,0 +1,217 @@
+"""
+Content-addressed cache for converter output.
+
+Converted Markdown is stored in a SQLite database in the 'conversion' cache
+directory, keyed by the SHA-256 of the input and a fingerprint of the
+converter settings. Unchanged pages are therefore converted only once across
+builds. The cache is bounded in size and evicts least recently used entries.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from ..utils.cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Entries touched within this many seconds are not re-stamped on every hit,
+# which keeps most lookups read-only.
+TOUCH_INTERVAL = 3600
+
+def settings_fingerprint(converter: str, settings: Dict[str, Any]) -> str:
+    """
+    Return a fingerprint of a converter and its settings.
+
+    Args:
+        converter (str): Converter name and version, e.g. 'html_to_md:1'.
+        settings (Dict[str, Any]): Settings that influence the converter output.
+
+    Returns:
+        str: Hex digest identifying the converter configuration.
+    """
+    material = json.dumps([converter, settings], sort_keys=True, default=str)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+def content_key(content: bytes, fingerprint: str) -> str:
+    """
+    Return the cache key of `content` converted with the given settings.
+
+    Args:
+        content (bytes): Raw converter input.
+        fingerprint (str): Value returned by settings_fingerprint().
+
+    Returns:
+        str: Hex digest used as cache key.
+    """
+    digest = hashlib.sha256(content)
+    digest.update(fingerprint.encode('ascii'))
+    return digest.hexdigest()
+
+class ConversionCache:
+    """
+    SQLite-backed, size-bounded LRU cache of converted documents.
+
+    Hit and miss counts are kept for the current instance and cumulatively in
+    the database.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, content TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+        self._conn.commit()
+
+    @classmethod
+    def open_default(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> Optional['ConversionCache']:
+        """
+        Open the cache in the configured cache directory.
+
+        Args:
+            max_bytes (int): Maximum total size of the cached content.
+
+        Returns:
+            Optional[ConversionCache]: The cache, or None if caching is disabled or unavailable.
+        """
+        cache_dir = get_cache_dir('conversion')
+        if cache_dir is None:
+            return None
+        try:
+            return cls(cache_dir / 'conversion.sqlite', max_bytes)
+        except sqlite3.Error as e:
+            logger.warning(f"Conversion cache unavailable: {str(e)}")
+            return None
+
+    def lookup(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of `keys` present in the cache and record hits and misses.
+
+        Args:
+            keys (Iterable[str]): Keys returned by content_key().
+
+        Returns:
+            Set[str]: Keys with cached content.
+        """
+        keys = list(keys)
+        found: Set[str] = set()
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(f'SELECT key FROM entries WHERE key IN ({placeholders})', batch)
+                found.update(row[0] for row in rows)
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return found
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Fetch cached content and mark it as recently used.
+
+        Args:
+            key (str): Key returned by content_key().
+
+        Returns:
+            Optional[str]: The cached content, or None if it is not (or no longer) cached.
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT content, last_used FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[1] > TOUCH_INTERVAL:
+                self._conn.execute('UPDATE entries SET last_used = ? WHERE key = ?', (now, key))
+                self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, content: str) -> None:
+        """
+        Store converted content.
+
+        Args:
+            key (str): Key returned by content_key().
+            content (str): Converted content.
+        """
+        size = len(content.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries (key, content, size, last_used) VALUES (?, ?, ?, ?)',
+                (key, content, size, time.time())
+            )
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """
+        Evict least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of evicted entries.
+        """
+        with self._lock:
+            total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            evicted = 0
+            rows = self._conn.execute('SELECT key, size FROM entries ORDER BY last_used').fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+                evicted += 1
+            self._conn.executemany('DELETE FROM entries WHERE key = ?', doomed)
+            self._conn.commit()
+        logger.debug(f"Evicted {evicted} entries from the conversion cache")
+        return evicted
+
+    def close(self) -> None:
+        """Record the hit and miss counts, evict if needed and close the database."""
+        self.evict()
+        with self._lock:
+            for name, value in (('hits', self.hits), ('misses', self.misses)):
+                self._conn.execute(
+                    'INSERT INTO stats (name, value) VALUES (?, ?) '
+                    'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+                    (name, value)
+                )
+            self._conn.commit()
+            self._conn.close()
+
+    def summary(self) -> str:
+        """Return the hit and miss counts of this instance for logging."""
+        lookups = self.hits + self.misses
+        hit_rate = 100.0 * self.hits / lookups if lookups else 0.0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate)"
+
+    def stats(self) -> Dict[str, int]:
+        """Return cumulative statistics: hits, misses, entries and total size in bytes."""
+        with self._lock:
+            stats = dict(self._conn.execute('SELECT name, value FROM stats').fetchall())
+            entries, size = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        return {
+            'hits': stats.get('hits', 0) + self.hits,
+            'misses': stats.get('misses', 0) + self.misses,
+            'entries': entries,
+            'bytes': size
+        }
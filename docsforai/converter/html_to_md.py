@@ -2,37 +2,227 @@
 Converter for HTML to Markdown.
 """
 
+import itertools
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Sequence
 from bs4 import BeautifulSoup
 import html2text
+from .content_extractor import EXTRACTOR_VERSION, extract_main_content
+from .conversion_cache import ConversionCache, DEFAULT_MAX_BYTES, content_key, settings_fingerprint
+from ..utils.subprocess_utils import process_pool_context
 
 logger = logging.getLogger(__name__)
 
-def html_to_md(html_content: str) -> str:
+# Below this many pages, conversion runs in-process: starting worker processes
+# costs more than it saves.
+MIN_PAGES_FOR_POOL = 16
+
+# Bump whenever html_to_md() output changes, to invalidate cached conversions.
+CONVERTER_VERSION = 1
+
+SUPPORTED_ENGINES = ['html2text', 'bs4']
+DEFAULT_ENGINE = 'html2text'
+
+# html2text options applied to every conversion.
+HTML2TEXT_SETTINGS = {
+    'ignore_links': False,
+    'ignore_images': False,
+    'ignore_tables': False,
+}
+
+_conversion_engine: str = DEFAULT_ENGINE
+_conversion_workers: Optional[int] = None
+_conversion_chunksize: Optional[int] = None
+_cache_enabled: bool = True
+_cache_max_bytes: int = DEFAULT_MAX_BYTES
+_extract_main_content: bool = True
+_content_selectors: List[str] = []
+
+class _PageOptions(NamedTuple):
+    """Per-run conversion options, passed explicitly to worker processes."""
+    engine: str
+    extract: bool
+    framework: Optional[str]
+    selectors: Sequence[str]
+
+def configure_conversion(
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    cache: bool = True,
+    cache_max_bytes: Optional[int] = None,
+    engine: str = DEFAULT_ENGINE,
+    extract_main_content: bool = True,
+    content_selectors: Optional[List[str]] = None
+) -> None:
+    """
+    Configure the HTML conversion stage for the current build.
+
+    Args:
+        workers (Optional[int]): Worker processes used to convert pages. Defaults to the CPU count;
+            1 converts in-process.
+        chunksize (Optional[int]): Pages sent to a worker at a time. Derived from the page count if None.
+        cache (bool): Whether converted pages are cached across builds.
+        cache_max_bytes (Optional[int]): Size limit of the conversion cache.
+        engine (str): HTML conversion engine (see html_to_md()).
+        extract_main_content (bool): Whether pages are cut down to their main content
+            (dropping navigation, headers and footers) before conversion.
+        content_selectors (Optional[List[str]]): Selectors tried before the built-in
+            per-framework ones when extracting the main content.
+
+    Raises:
+        ValueError: If the engine is unknown.
+    """
+    global _conversion_engine, _conversion_workers, _conversion_chunksize, _cache_enabled, _cache_max_bytes
+    global _extract_main_content, _content_selectors
+    if engine not in SUPPORTED_ENGINES:
+        raise ValueError(f"Unsupported HTML conversion engine: {engine}. Must be one of: {', '.join(SUPPORTED_ENGINES)}")
+    _conversion_engine = engine
+    _conversion_workers = workers
+    _conversion_chunksize = chunksize
+    _cache_enabled = cache
+    _cache_max_bytes = cache_max_bytes or DEFAULT_MAX_BYTES
+    _extract_main_content = extract_main_content
+    _content_selectors = list(content_selectors or [])
+    logger.debug(
+        f"HTML conversion configured with engine={engine}, workers={workers}, chunksize={chunksize}, "
+        f"cache={cache}, extract_main_content={extract_main_content}"
+    )
+
+def html_to_md(html_content: str, engine: Optional[str] = None) -> str:
     """
-    Convert HTML to Markdown. Args:
+    Convert HTML to Markdown.
+
+    Args:
         html_content (str): HTML content.
+        engine (Optional[str]): Conversion engine, one of SUPPORTED_ENGINES. Defaults to the
+            configured engine:
+            - html2text: single pass, the raw HTML is streamed straight into html2text.
+            - bs4: legacy path, the HTML is parsed and prettified with BeautifulSoup
+              before being parsed again by html2text.
 
     Returns:
         str: Converted Markdown content.
 
     Raises:
-        ValueError: If conversion fails.
+        ValueError: If the engine is unknown or conversion fails.
     """
+    engine = engine or _conversion_engine
+    if engine not in SUPPORTED_ENGINES:
+        raise ValueError(f"Unsupported HTML conversion engine: {engine}. Must be one of: {', '.join(SUPPORTED_ENGINES)}")
+
     try:
-        # First, clean the HTML if desired
-        soup = BeautifulSoup(html_content, 'html.parser')
-        clean_html = soup.prettify()
-
-        # Convert to Markdown with html2text
-        converter = html2text.HTML2Text()
-        converter.ignore_links = False
-        converter.ignore_images = False
-        converter.ignore_tables = False
-        # You can tweak more settings if you want
-        markdown = converter.handle(clean_html)
+        if engine == 'bs4':
+            # Clean the HTML first; prettify() re-serializes the whole document
+            soup = BeautifulSoup(html_content, 'html.parser')
+            html_content = soup.prettify()
 
+        markdown = _new_html2text().handle(html_content)
         return markdown.strip()
     except Exception as e:
         logger.error(f"Error converting HTML to Markdown: {str(e)}")
-        raise ValueError("Failed to convert HTML to Markdown") from e
\ No newline at end of file
+        raise ValueError("Failed to convert HTML to Markdown") from e
+
+def _new_html2text() -> html2text.HTML2Text:
+    """Create an html2text converter with the shared settings (converters keep per-document state)."""
+    converter = html2text.HTML2Text()
+    for name, value in HTML2TEXT_SETTINGS.items():
+        setattr(converter, name, value)
+    return converter
+
+def _convert_html_file(html_file: str, options: _PageOptions) -> str:
+    """Read, extract and convert one HTML page (runs in a worker process)."""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    if options.extract:
+        html_content = extract_main_content(html_content, options.framework, options.selectors)
+    return html_to_md(html_content, options.engine)
+
+def convert_html_files(
+    html_files: List[Path],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    framework: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Convert built HTML pages to Markdown, in parallel worker processes.
+
+    Unless disabled with configure_conversion(), each page is first cut down
+    to its main content with the selectors for `framework`. Pages already
+    converted by an earlier build are served from the conversion cache, keyed
+    by the SHA-256 of the page and the converter settings. The remaining pages
+    are sent to a ProcessPoolExecutor in chunks; workers read the files
+    themselves, so only paths and Markdown cross process boundaries. Results
+    are yielded in the order of `html_files` regardless of which worker
+    finishes first.
+
+    Args:
+        html_files (List[Path]): HTML pages to convert.
+        workers (Optional[int]): Worker processes. Defaults to the configured value, then the CPU count.
+        chunksize (Optional[int]): Pages per task. Defaults to the configured value, or is
+            derived from the page count.
+        framework (Optional[str]): Framework that built the pages, used to pick content selectors.
+
+    Yields:
+        str: Markdown of each page, in input order.
+
+    Raises:
+        ValueError: If a page fails to convert.
+    """
+    paths = [str(html_file) for html_file in html_files]
+    options = _PageOptions(_conversion_engine, _extract_main_content, framework, tuple(_content_selectors))
+    cache = ConversionCache.open_default(_cache_max_bytes) if _cache_enabled and paths else None
+
+    if cache is None:
+        yield from _convert_paths(paths, options, workers, chunksize)
+        return
+
+    try:
+        settings = {'engine': options.engine, **HTML2TEXT_SETTINGS}
+        if options.extract:
+            settings.update(
+                extractor=EXTRACTOR_VERSION,
+                framework=options.framework,
+                selectors=list(options.selectors)
+            )
+        fingerprint = settings_fingerprint(f'html_to_md:{CONVERTER_VERSION}', settings)
+        keys = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                keys.append(content_key(f.read(), fingerprint))
+        cached = cache.lookup(keys)
+
+        misses = [path for path, key in zip(paths, keys) if key not in cached]
+        converted = _convert_paths(misses, options, workers, chunksize)
+        for path, key in zip(paths, keys):
+            markdown = cache.get(key) if key in cached else None
+            if markdown is None:
+                markdown = next(converted) if key not in cached else _convert_html_file(path, options)
+                cache.put(key, markdown)
+            yield markdown
+        logger.info(f"Conversion cache: {cache.summary()}")
+    finally:
+        cache.close()
+
+def _convert_paths(
+    paths: List[str],
+    options: _PageOptions,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None
+) -> Iterator[str]:
+    """Convert HTML pages, in worker processes unless the batch is small."""
+    workers = workers or _conversion_workers or os.cpu_count() or 1
+    workers = min(workers, len(paths))
+
+    if workers <= 1 or len(paths) < MIN_PAGES_FOR_POOL:
+        for path in paths:
+            yield _convert_html_file(path, options)
+        return
+
+    chunksize = chunksize or _conversion_chunksize or max(1, min(64, len(paths) // (workers * 4)))
+    logger.info(f"Converting {len(paths)} HTML pages with {workers} workers (chunks of {chunksize})")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as pool:
+        # Options are passed explicitly: workers do not inherit the configured globals
+        yield from pool.map(_convert_html_file, paths, itertools.repeat(options), chunksize=chunksize)
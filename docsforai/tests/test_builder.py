@@ -1,10 +1,17 @@
+import os
+import subprocess
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from docsforai.builder import build_documentation
-from docsforai.builder.detector import detect_framework
-from docsforai.builder.parser import parse_documentation
-from docsforai.builder.consolidator import consolidate_documentation
+from docsforai.builder.detector import detect_framework, RepoScan, DetectionCache
+from docsforai.builder.parser import parse_documentation, iter_documentation
+from docsforai.builder.registry import LazyParserRegistry, BUILTIN_PARSERS
+from docsforai.builder.consolidator import consolidate_documentation, write_consolidated_documentation
+from docsforai.builder.boilerplate import split_blocks
+from docsforai.builder.dedup import SourceRegistry, page_key
+from docsforai.builder.monorepo import find_doc_roots, resolve_doc_roots, parse_doc_roots
+from docsforai.utils.discovery import walk_files
 
 @pytest.fixture
 def mock_config():
@@ -31,6 +38,81 @@ def test_detect_framework(mock_repo_path):
     (mock_repo_path / "docs" / "conf.py").touch()
     assert detect_framework(mock_repo_path) == 'sphinx'
 
+def test_repo_scan_index(mock_repo_path):
+    (mock_repo_path / "docs" / "api.rst").write_text("API\n===")
+    (mock_repo_path / "src").mkdir()
+    (mock_repo_path / "src" / "main.go").write_text("package main")
+
+    scan = RepoScan(mock_repo_path)
+    assert scan.top_level_dirs == {'docs', 'src'}
+    assert {'index.md', 'api.rst', 'main.go'} <= scan.basenames
+    assert [p.name for p in scan.files('.md')] == ['index.md']
+    assert scan.has_files('.go', '.rs')
+    assert not scan.has_files('.rs')
+
+def test_repo_scan_probe_budget(mock_repo_path):
+    big_file = mock_repo_path / "docs" / "generated.md"
+    big_file.write_text("x" * 4096 + "\n# Late heading\n")
+
+    scan = RepoScan(mock_repo_path, byte_budgets={'markdown': 1024})
+    assert not scan.for_check('markdown').probe(big_file, ['# ', '```'])
+    assert scan.for_check('markdown').probe(mock_repo_path / "docs" / "index.md", ['```', '# '])
+    assert scan.for_check('sphinx').probe(big_file, ['# Late'])
+    assert scan.stats.files_probed == 3
+    assert scan.stats.per_check['markdown'] == [2, 1024 + len("# Test Documentation")]
+
+def test_jupyter_probe_requires_complete_notebook(tmp_path):
+    import json
+    from docsforai.builder.detector import _check_jupyter
+
+    cells = [{"cell_type": "markdown", "metadata": {}, "source": ["x" * 100]}] * 100
+    notebook = json.dumps({"cells": cells, "metadata": {}, "nbformat": 4, "nbformat_minor": 5}, indent=1)
+    path = tmp_path / "analysis.ipynb"
+    path.write_text(notebook)
+    assert _check_jupyter(tmp_path, RepoScan(tmp_path).for_check('jupyter'))
+
+    path.write_text(notebook[:len(notebook) // 2])
+    assert not _check_jupyter(tmp_path, RepoScan(tmp_path).for_check('jupyter'))
+    path.write_text('{"cells": "not a notebook"}')
+    assert not _check_jupyter(tmp_path, RepoScan(tmp_path).for_check('jupyter'))
+
+def test_detect_framework_priority_with_concurrent_checks(mock_repo_path):
+    docs = mock_repo_path / "docs"
+    (docs / "guide.rst").write_text("Guide\n=====\n\n.. note:: Hi")
+    (docs / "manual.adoc").write_text("= Manual\n:toc:")
+    assert detect_framework(docs) == 'asciidoc'
+
+    (docs / "mkdocs.yml").write_text("site_name: Test")
+    assert detect_framework(docs) == 'mkdocs'
+
+def test_walk_files_prunes_ignored_dirs(mock_repo_path):
+    (mock_repo_path / "node_modules" / "pkg").mkdir(parents=True)
+    (mock_repo_path / "node_modules" / "pkg" / "README.md").write_text("# Dependency")
+    (mock_repo_path / "docs" / "_site").mkdir()
+    (mock_repo_path / "docs" / "_site" / "page.md").write_text("# Built")
+    (mock_repo_path / ".gitignore").write_text("_site/\n")
+
+    found = [p.relative_to(mock_repo_path).as_posix() for p in walk_files(mock_repo_path, ['.md'])]
+    assert found == ['docs/index.md']
+
+    found = list(walk_files(mock_repo_path, ['.md'], exclude=['docs']))
+    assert found == []
+
+def test_walk_files_negated_excludes_and_parent_gitignore(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("docs/drafts/\n")
+    docs = tmp_path / "docs"
+    for rel in ("index.md", "drafts/wip.md", "_build/out.md", "target/doc/api.md", "vendor/lib.md"):
+        (docs / rel).parent.mkdir(parents=True, exist_ok=True)
+        (docs / rel).write_text("# Page")
+
+    found = [p.relative_to(docs).as_posix() for p in walk_files(docs, ['.md'], exclude=['vendor', '!target'])]
+    assert found == ['index.md', 'target/doc/api.md']
+
+    (docs / ".gitignore").write_text("!_build/\n")
+    found = [p.relative_to(docs).as_posix() for p in walk_files(docs, ['.md'])]
+    assert found == ['index.md', '_build/out.md', 'vendor/lib.md']
+
 def test_parse_documentation(mock_repo_path):
     parsed_docs = parse_documentation(mock_repo_path / "docs", 'common')
     assert len(parsed_docs) == 1
@@ -77,4 +159,634 @@ def test_build_documentation_error_handling(mock_config):
     with patch('docsforai.builder.parse_config', return_value=mock_config):
         with patch('docsforai.builder.clone_repository', side_effect=Exception("Clone failed")):
             with pytest.raises(Exception, match="Clone failed"):
-                build_documentation(Path('test_config.yaml'))
\ No newline at end of file
+                build_documentation(Path('test_config.yaml'))
+
+def test_detection_cache_roundtrip(tmp_path):
+    cache = DetectionCache(tmp_path)
+    key = cache.make_key('https://github.com/test/repo', 'abc123', 'docs/')
+    assert key == cache.make_key('https://github.com/test/repo', 'abc123', 'docs')
+    assert key != cache.make_key('https://github.com/test/repo', 'def456', 'docs')
+
+    assert cache.get(key) is None
+    cache.put(key, 'sphinx', commit='abc123')
+
+    fresh = DetectionCache(tmp_path)
+    stat = (tmp_path / 'detection.json').stat()
+    assert fresh.get(key) == 'sphinx'
+    assert (tmp_path / 'detection.json').stat().st_mtime_ns == stat.st_mtime_ns
+    assert (cache.misses, fresh.hits) == (1, 1)
+    assert '1 hits, 1 misses total' in fresh.summary()
+
+def test_monorepo_roots_parsed_and_merged(tmp_path):
+    (tmp_path / "docs" / "source").mkdir(parents=True)
+    (tmp_path / "docs" / "conf.py").write_text("extensions = ['sphinx.ext.autodoc']")
+    (tmp_path / "docs" / "source" / "conf.py").write_text("import sphinx")
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "openapi.yaml").write_text("openapi: 3.0.0\ninfo:\n  title: Pets\npaths: {}\n")
+    (tmp_path / "tests" / "fixtures").mkdir(parents=True)
+    (tmp_path / "tests" / "fixtures" / "_config.yml").write_text("title: fixture")
+
+    candidates = find_doc_roots(tmp_path)
+    assert candidates == [tmp_path / "api", tmp_path / "docs", tmp_path / "docs" / "source", tmp_path / "tests" / "fixtures"]
+
+    detected = {"api": "openapi", "docs": "sphinx", "docs/source": "sphinx", "tests/fixtures": "unknown"}
+    roots = resolve_doc_roots(candidates, lambda root: detected[root.relative_to(tmp_path).as_posix()])
+    assert roots == [(tmp_path / "api", "openapi"), (tmp_path / "docs", "sphinx")]
+
+    (tmp_path / "guide").mkdir()
+    (tmp_path / "guide" / "intro.md").write_text("# Intro")
+    parsed = parse_doc_roots(tmp_path, [(tmp_path / "api", "openapi"), (tmp_path / "guide", "markdown")], max_workers=2)
+    assert [(doc['type'], doc['filename']) for doc in parsed] == [('openapi', 'api/openapi.md'), ('markdown', 'guide/intro.md')]
+
+def test_lazy_parser_registry(mock_repo_path):
+    registry = LazyParserRegistry(BUILTIN_PARSERS, use_entry_points=False)
+    assert 'sphinx' in registry and 'custom' not in registry
+    assert len(registry) == len(BUILTIN_PARSERS)
+    assert registry._loaded == {}
+
+    parsed = list(registry['markdown'](mock_repo_path / "docs"))
+    assert parsed[0]['filename'] == 'index.md'
+    assert list(registry._loaded) == ['markdown']
+
+    registry.register('custom', lambda docs_path: [])
+    assert registry['custom'](mock_repo_path) == []
+    with pytest.raises(KeyError):
+        registry['missing']
+
+def test_streaming_consolidation_matches_in_memory(mock_repo_path, tmp_path):
+    docs = mock_repo_path / "docs"
+    (docs / "guide").mkdir()
+    (docs / "guide" / "setup.md").write_text("# Setup")
+    (docs / "tests").mkdir()
+    (docs / "tests" / "skip.md").write_text("# Skip")
+
+    stream = iter_documentation(docs, 'markdown')
+    assert not isinstance(stream, list)
+    config = {'exclude_patterns': ['tests/']}
+    metadata = {'package_name': 'pkg'}
+
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    output_file = write_consolidated_documentation(stream, config, metadata, output_dir / "out.md")
+    expected = consolidate_documentation(parse_documentation(docs, 'markdown'), config, metadata)
+    assert output_file.read_text(encoding='utf-8') == expected
+    assert "## guide/setup.md" in expected and "# Skip" not in expected
+    assert list(output_dir.iterdir()) == [output_file]
+
+
+def test_consolidation_removes_boilerplate():
+    footer = "Edit this page on GitHub. Last updated on 2024-01-01."
+    parsed_docs = [
+        {'filename': f'page{i}.md', 'type': 'markdown',
+         'content': f"# Page {i}\n\nUnique text of page number {i}.\n\n{footer}"}
+        for i in range(4)
+    ]
+    metadata = {'package_name': 'pkg'}
+
+    consolidated = consolidate_documentation(parsed_docs, {'boilerplate_threshold': 0.5, 'boilerplate_min_pages': 3}, metadata)
+    assert footer not in consolidated
+    assert "Unique text of page number 3.\n\n---" in consolidated
+    assert "# Page 0" in consolidated
+
+    assert footer in consolidate_documentation(parsed_docs, {}, metadata)
+    assert footer in consolidate_documentation(parsed_docs, {'boilerplate_min_pages': 3}, metadata)
+    assert footer in consolidate_documentation(parsed_docs, {'boilerplate_threshold': 0, 'boilerplate_min_pages': 3}, metadata)
+
+def test_split_blocks_keeps_code_fences():
+    content = "Intro text\n\n```python\nx = 1\n\ny = 2\n```\n\nOutro"
+    blocks = split_blocks(content)
+    assert [block for block, _ in blocks] == ["Intro text", "```python\nx = 1\n\ny = 2\n```", "Outro"]
+    assert ''.join(block + separator for block, separator in blocks) == content
+
+@pytest.mark.parametrize("prefer, built, sources", [
+    ('source', ['api/generated.html'], ['index.md', 'guide/setup.md', 'about.md']),
+    ('built', ['index.html', 'guide/setup/index.html', 'api/generated.html'], ['about.md']),
+    ('both', ['index.html', 'guide/setup/index.html', 'api/generated.html'], ['index.md', 'guide/setup.md', 'about.md']),
+])
+def test_source_registry(prefer, built, sources, tmp_path):
+    assert page_key('guide/setup.md') == page_key('guide/setup/index.html') == page_key('/guide/setup/')
+    registry = SourceRegistry(prefer)
+    docs = [{'filename': name} for name in ['index.md', 'guide/setup.md', 'about.md']]
+    for doc in docs:
+        registry.add_source(doc['filename'], '/about-us/' if doc['filename'] == 'about.md' else None)
+
+    html_files = [tmp_path / name for name in ['index.html', 'guide/setup/index.html', 'api/generated.html']]
+    selected = registry.select_built(html_files, tmp_path)
+    assert [f.relative_to(tmp_path).as_posix() for f in selected] == built
+    assert [doc['filename'] for doc in registry.select_sources(docs)] == sources
+
+    with pytest.raises(ValueError):
+        SourceRegistry('html')
+
+def test_sphinx_direct_builder_falls_back_to_html(tmp_path, monkeypatch):
+    import subprocess
+    from docsforai.builder.frameworks import sphinx
+
+    monkeypatch.setenv('DOCSFORAI_CACHE_DIR', str(tmp_path / "cache"))
+    (tmp_path / "conf.py").write_text("project = 'test'")
+    builders = []
+
+    def fake_build(cmd, additional_args=None):
+        builder, build_dir = cmd[2], Path(cmd[4])
+        builders.append(builder)
+        assert '-j' not in (additional_args or [])
+        if builder == 'markdown':
+            raise subprocess.CalledProcessError(2, cmd)
+        if builder == 'text':
+            (build_dir / "intro.txt").write_text("Intro\n*****\n")
+        else:
+            (build_dir / "intro.html").write_text("<html><body><main><p>Introduction page text long enough.</p></main></body></html>")
+
+    with patch('docsforai.builder.sphinx_runner.run_subprocess_with_logging', side_effect=fake_build), \
+         patch.object(sphinx, '_markdown_builder_available', return_value=False):
+        docs = sphinx.parse_sphinx(tmp_path, sphinx_jobs=1)
+        assert builders == ['html'] and docs[0]['filename'] == 'intro.html'
+        builders.clear()
+        docs = sphinx.parse_sphinx(tmp_path, sphinx_builder='text', sphinx_jobs=1)
+        assert builders == ['text'] and docs == [{'type': 'sphinx', 'filename': 'intro.txt', 'content': "Intro\n*****\n"}]
+        with pytest.raises(ValueError):
+            sphinx.parse_sphinx(tmp_path, sphinx_builder='markdown')
+
+    builders.clear()
+    with patch('docsforai.builder.sphinx_runner.run_subprocess_with_logging', side_effect=fake_build), \
+         patch.object(sphinx, '_markdown_builder_available', return_value=True):
+        docs = sphinx.parse_sphinx(tmp_path, sphinx_jobs=1)
+    assert builders == ['markdown', 'html']
+    assert docs[0]['filename'] == 'intro.html' and 'Introduction page' in docs[0]['content']
+
+def test_sphinx_inprocess_runner(tmp_path):
+    from docsforai.builder.sphinx_runner import configure_sphinx_runner, run_sphinx, resolve_jobs, shutdown_sphinx_runner
+
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "conf.py").write_text("project = 'test'")
+    (source / "index.rst").write_text("Title\n=====\n\nHello from the warm worker.\n")
+
+    assert resolve_jobs(10 ** 6) <= (os.cpu_count() or 1)
+    with patch('docsforai.builder.sphinx_runner.os.cpu_count', return_value=8):
+        configure_sphinx_runner(6, concurrent_builds=2)
+        # Concurrent builds share the budget: 2 workers x 3 jobs
+        assert (resolve_jobs(), resolve_jobs(10 ** 6)) == (3, 3)
+        configure_sphinx_runner(None, concurrent_builds=20)
+        assert resolve_jobs() == 1
+    configure_sphinx_runner()
+    try:
+        for run in range(2):
+            build_dir = tmp_path / f"build{run}"
+            run_sphinx('text', source, build_dir, ['-q'], runner='inprocess')
+            assert "Hello from the warm worker." in (build_dir / "index.txt").read_text()
+        with pytest.raises(subprocess.CalledProcessError):
+            run_sphinx('text', tmp_path / "missing", tmp_path / "build", ['-q'], runner='inprocess')
+    finally:
+        shutdown_sphinx_runner()
+
+def test_mtime_manifest_restores_unchanged_files(tmp_path):
+    from docsforai.utils.build_cache import MtimeManifest
+
+    (tmp_path / "src").mkdir()
+    unchanged = tmp_path / "src" / "unchanged.rst"
+    changed = tmp_path / "src" / "changed.rst"
+    unchanged.write_text("same")
+    changed.write_text("old")
+    os.utime(unchanged, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(changed, ns=(1_000_000_000, 1_000_000_000))
+
+    manifest = MtimeManifest(tmp_path / "manifest.json")
+    assert manifest.restore(tmp_path / "src", [unchanged, changed]) == 0
+    manifest.record()
+
+    # A fresh checkout: new modification times, one file edited
+    for path in (unchanged, changed):
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    changed.write_text("new")
+    new_mtime = changed.stat().st_mtime_ns
+
+    manifest = MtimeManifest(tmp_path / "manifest.json")
+    assert manifest.restore(tmp_path / "src", [unchanged, changed]) == 1
+    assert unchanged.stat().st_mtime_ns == 1_000_000_000
+    assert changed.stat().st_mtime_ns == new_mtime
+
+def test_sphinx_doctree_caches_are_pruned(tmp_path, monkeypatch):
+    from docsforai.builder.frameworks import sphinx
+
+    monkeypatch.setenv('DOCSFORAI_CACHE_DIR', str(tmp_path / "cache"))
+    monkeypatch.setattr(sphinx, 'MAX_CACHED_DOCTREES', 2)
+    used = []
+    for name in ("one", "two", "three"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "index.rst").write_text("Title\n=====\n")
+        with sphinx._doctree_cache(tmp_path / name, True) as args:
+            used.append(Path(args[1]).parent)
+        # Distinct modification times for the least-recently-used order
+        os.utime(used[-1], (len(used), len(used)))
+
+    remaining = sorted(path for path in (tmp_path / "cache" / "builds" / "sphinx").iterdir() if not path.name.startswith('.'))
+    assert remaining == sorted(used[1:])
+
+def test_node_modules_cache(tmp_path, monkeypatch):
+    from docsforai.builder.node_deps import install_node_dependencies
+
+    monkeypatch.setenv('DOCSFORAI_CACHE_DIR', str(tmp_path / "cache"))
+    installs = []
+
+    def fake_run(cmd, cwd=None, additional_args=None, check=True, **kwargs):
+        if cmd[:2] == ['npm', 'install']:
+            installs.append(cwd)
+            (Path(cwd) / "node_modules" / "pkg").mkdir(parents=True)
+            (Path(cwd) / "node_modules" / "pkg" / "index.js").write_text("module.exports = 1;")
+        return subprocess.CompletedProcess(cmd, 0, stdout='v20.0.0\n', stderr='')
+
+    projects = []
+    for name in ("first", "second"):
+        project = tmp_path / name
+        project.mkdir()
+        (project / "package.json").write_text('{"dependencies": {"pkg": "1.0.0"}}')
+        (project / "package-lock.json").write_text('{"lockfileVersion": 3}')
+        projects.append(project)
+
+    with patch('docsforai.builder.node_deps.run_subprocess_with_logging', side_effect=fake_run):
+        for project in projects:
+            install_node_dependencies(project)
+
+    assert installs == [projects[0]]
+    assert (projects[1] / "node_modules" / "pkg" / "index.js").read_text() == "module.exports = 1;"
+
+    # A restored tree rewritten in place (postinstall, patch-package) leaves the cache intact
+    with (projects[1] / "node_modules" / "pkg" / "index.js").open('r+') as f:
+        f.write("patched")
+    with patch('docsforai.builder.node_deps.run_subprocess_with_logging', side_effect=fake_run):
+        install_node_dependencies(projects[0])
+    assert installs == [projects[0]]
+    assert (projects[0] / "node_modules" / "pkg" / "index.js").read_text() == "module.exports = 1;"
+
+def test_unset_build_args_keep_parser_defaults(tmp_path):
+    from docsforai.builder.registry import FRAMEWORK_PARSERS
+
+    received = {}
+
+    def fake_jsdoc(docs_path, node_modules_cache=True):
+        received['node_modules_cache'] = node_modules_cache
+        return [{'type': 'jsdoc', 'filename': 'index.md', 'content': '# API'}]
+
+    original = FRAMEWORK_PARSERS['jsdoc']
+    FRAMEWORK_PARSERS.register('jsdoc', fake_jsdoc)
+    try:
+        parse_documentation(tmp_path, 'jsdoc', {})
+        assert received == {'node_modules_cache': True}
+        parse_documentation(tmp_path, 'jsdoc', {'node_modules_cache': False})
+        assert received == {'node_modules_cache': False}
+    finally:
+        FRAMEWORK_PARSERS.register('jsdoc', original)
+
+def test_jekyll_gem_cache_and_incremental_workspace(tmp_path, monkeypatch):
+    from docsforai.builder.frameworks.jekyll import parse_jekyll
+
+    monkeypatch.setenv('DOCSFORAI_CACHE_DIR', str(tmp_path / "cache"))
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "_config.yml").write_text("title: Test\n")
+    (site / "Gemfile.lock").write_text("GEM\n  specs:\n    jekyll (4.3.3)\n")
+    (site / "about.md").write_text("# About\n")
+    calls = []
+
+    def fake_run(cmd, cwd=None, additional_args=None, check=True, env=None, **kwargs):
+        calls.append((cmd, list(additional_args or []), env))
+        if cmd[:2] == ['bundle', 'check']:
+            return subprocess.CompletedProcess(cmd, 0 if Path(env['BUNDLE_PATH']).exists() else 1, stdout='', stderr='')
+        if cmd[:2] == ['bundle', 'install']:
+            Path(env['BUNDLE_PATH']).mkdir(parents=True)
+        if cmd[:3] == ['bundle', 'exec', 'jekyll']:
+            destination = Path(additional_args[additional_args.index('--destination') + 1])
+            destination.mkdir(parents=True, exist_ok=True)
+            (destination / "news.html").write_text("<html><body><p>News page</p></body></html>")
+            (Path(cwd) / ".jekyll-metadata").write_text("state")
+        return subprocess.CompletedProcess(cmd, 0, stdout='', stderr='')
+
+    with patch('docsforai.builder.frameworks.jekyll.run_subprocess_with_logging', side_effect=fake_run):
+        for _ in range(2):
+            (site / ".jekyll-metadata").unlink(missing_ok=True)
+            docs = parse_jekyll(site, jekyll_incremental=True)
+            assert [doc['filename'] for doc in docs] == ['about.md', 'news.html']
+
+    installs = [call for call in calls if call[0][:2] == ['bundle', 'install']]
+    builds = [call for call in calls if call[0][:3] == ['bundle', 'exec', 'jekyll']]
+    assert len(installs) == 1
+    assert all('--incremental' in args for _, args, _ in builds)
+    workspace = Path(builds[0][1][builds[0][1].index('--destination') + 1]).parent
+    assert (workspace / "_site" / "news.html").exists()
+    assert (workspace / ".jekyll-metadata").read_text() == "state"
+
+def test_hugo_content_mode(tmp_path):
+    from docsforai.builder.frameworks.hugo import parse_hugo
+
+    site = tmp_path / "site"
+    (site / "content" / "guide").mkdir(parents=True)
+    (site / "content" / "blog").mkdir()
+    (site / "layouts" / "partials").mkdir(parents=True)
+    (site / "config.toml").write_text('[params]\nversion = "1.2"\n')
+    (site / "layouts" / "partials" / "note.md").write_text("Shared {{< param version >}} note.")
+    (site / "content" / "guide" / "setup.md").write_text(
+        '+++\ntitle = "Setup"\n+++\n'
+        'Read [the intro]({{< relref "intro.md#start" >}}).\n\n'
+        '{{< highlight go >}}\nfmt.Println("{{</* ref x */>}}")\n{{< /highlight >}}\n\n'
+        '{{% notice tip %}}Use **v{{< param "version" >}}**{{% /notice %}}\n\n'
+        '{{< include "layouts/partials/note.md" >}}\n'
+    )
+    (site / "content" / "guide" / "intro.md").write_text("---\ntitle: Intro\nslug: start-here\n---\n# Intro\n")
+    (site / "content" / "guide" / "wip.md").write_text("---\ndraft: true\n---\nUnfinished\n")
+    (site / "content" / "blog" / "post.md").write_text("---\ntitle: Post\n---\nCustom layout\n")
+
+    def fake_hugo(cmd, cwd=None, additional_args=None, **kwargs):
+        (Path(cwd) / "public" / "blog" / "post").mkdir(parents=True)
+        (Path(cwd) / "public" / "blog" / "post" / "index.html").write_text("<html><body><p>Rendered post</p></body></html>")
+        (Path(cwd) / "public" / "guide" / "setup").mkdir(parents=True)
+        (Path(cwd) / "public" / "guide" / "setup" / "index.html").write_text("<html><body><p>Setup</p></body></html>")
+        return subprocess.CompletedProcess(cmd, 0, stdout='', stderr='')
+
+    with patch('docsforai.builder.frameworks.hugo.run_subprocess_with_logging', side_effect=fake_hugo) as mock_run:
+        docs = parse_hugo(site, hugo_mode='content')
+        mock_run.assert_not_called()
+        assert sorted(doc['filename'] for doc in docs) == ['blog/post.md', 'guide/intro.md', 'guide/setup.md']
+        setup = next(doc['content'] for doc in docs if doc['filename'] == 'guide/setup.md')
+        assert setup.startswith("# Setup\n\nRead [the intro](/guide/start-here/#start).")
+        assert '```go\nfmt.Println("{{< ref x >}}")\n```' in setup
+        assert "Use **v1.2**" in setup and "Shared 1.2 note." in setup and "{{" not in setup.replace("{{< ref x >}}", "")
+
+        docs = parse_hugo(site, hugo_mode='content', hugo_build_sections=['blog'])
+        assert sorted(doc['filename'] for doc in docs) == ['blog/post/index.html', 'guide/intro.md', 'guide/setup.md']
+
+def test_hugo_include_outside_site_is_ignored(tmp_path):
+    from docsforai.builder.shortcodes import ShortcodeExpander
+
+    site = tmp_path / "site"
+    (site / "content" / "guide").mkdir(parents=True)
+    (site / "data.md").write_text("Site data.")
+    (tmp_path / "secret.txt").write_text("Secret.")
+
+    expander = ShortcodeExpander(site, site / "content")
+    body = '{{< readfile "../secret.txt" >}} {{< readfile "../../../secret.txt" >}} {{< include "../../data.md" >}}'
+    assert expander.expand(body, 'guide/page.md').strip() == "Site data."
+
+def test_docusaurus_and_vuepress_source_mode(tmp_path):
+    from docsforai.builder.frameworks.docusaurus import parse_docusaurus
+    from docsforai.builder.frameworks.vuepress import parse_vuepress
+
+    site = tmp_path / "docusaurus"
+    (site / "docs" / "guide").mkdir(parents=True)
+    (site / "versioned_docs" / "version-1.0").mkdir(parents=True)
+    (site / "versioned_sidebars").mkdir()
+    (site / "docusaurus.config.js").write_text("module.exports = {};")
+    (site / "sidebars.js").write_text("module.exports = {docs: ['guide/setup', {type: 'doc', id: 'welcome'}]};")
+    (site / "docs" / "01-intro.md").write_text("---\nid: welcome\ntitle: Welcome\n---\nHello.\n")
+    (site / "docs" / "guide" / "setup.mdx").write_text(
+        "---\nsidebar_label: Setup\n---\n"
+        "import Tabs from '@theme/Tabs';\nimport TabItem from '@theme/TabItem';\n\n"
+        "export const meta = {\n  level: 'basic',\n};\n\n"
+        "Install it {/* soon */}:\n\n<Tabs>\n  <TabItem value=\"pip\" label=\"pip\">\n\n"
+        "```bash\npip install pkg  # <Tabs> stays\n```\n\n  </TabItem>\n</Tabs>\n\nUse `<Tabs>` for tabs.\n"
+    )
+    (site / "versioned_docs" / "version-1.0" / "intro.md").write_text("# Old intro\n")
+    (site / "versioned_sidebars" / "version-1.0-sidebars.json").write_text('{"docs": ["version-1.0/intro"]}')
+
+    with patch('docsforai.builder.frameworks.docusaurus.run_subprocess_with_logging') as mock_run:
+        docs = parse_docusaurus(site)
+        mock_run.assert_not_called()
+    assert [doc['filename'] for doc in docs] == ['guide/setup.mdx', '01-intro.md', 'versioned_docs/version-1.0/intro.md']
+    assert docs[0]['content'] == (
+        "# Setup\n\nInstall it :\n\n**pip**\n\n"
+        "```bash\npip install pkg  # <Tabs> stays\n```\n\nUse `<Tabs>` for tabs.\n"
+    )
+    assert docs[1]['content'].startswith("# Welcome\n\nHello.")
+
+    vuepress = tmp_path / "vuepress"
+    (vuepress / ".vuepress").mkdir(parents=True)
+    (vuepress / "guide").mkdir()
+    (vuepress / ".vuepress" / "config.js").write_text("module.exports = {themeConfig: {sidebar: ['/guide/', '/']}}")
+    (vuepress / "README.md").write_text("# Home\n")
+    (vuepress / "guide" / "README.md").write_text("---\ntitle: Guide\n---\n<Badge text=\"beta\"/> Start here.\n\n<script>\nexport default {}\n</script>\n")
+    with patch('docsforai.builder.frameworks.vuepress.run_subprocess_with_logging') as mock_run:
+        docs = parse_vuepress(vuepress)
+        mock_run.assert_not_called()
+    assert [doc['filename'] for doc in docs] == ['guide/README.md', 'README.md']
+    assert docs[0]['content'] == "# Guide\n\nStart here.\n"
+
+def test_lean_build_profiles(tmp_path):
+    import yaml
+    from docsforai.builder.frameworks.mkdocs import MkDocsLoader
+    from docsforai.builder.profiles import doxygen_profile, jekyll_profile, mkdocs_profile
+
+    mkdocs_yaml = tmp_path / "mkdocs.yml"
+    mkdocs_yaml.write_text(
+        "site_name: Test\nplugins:\n  - material/search\n  - mkdocstrings\n"
+        "  - git-revision-date-localized:\n      type: date\n"
+    )
+    original = mkdocs_yaml.read_text()
+    with mkdocs_profile(mkdocs_yaml, MkDocsLoader) as build_config:
+        assert build_config.parent == tmp_path and build_config != mkdocs_yaml
+        assert yaml.safe_load(build_config.read_text()) == {'INHERIT': 'mkdocs.yml', 'plugins': ['mkdocstrings']}
+    assert not build_config.exists() and mkdocs_yaml.read_text() == original
+
+    # Kept entries are copied verbatim, tags included
+    mkdocs_yaml.write_text(
+        "site_name: Test\nplugins:\n  search: {}\n  mkdocstrings:\n    handlers:\n"
+        "      python:\n        options:\n          format: !!python/name:black.format_str\n"
+    )
+    with mkdocs_profile(mkdocs_yaml, MkDocsLoader) as build_config:
+        assert build_config.read_text() == (
+            "INHERIT: mkdocs.yml\nplugins:\n  mkdocstrings:\n    handlers:\n"
+            "      python:\n        options:\n          format: !!python/name:black.format_str\n"
+        )
+    mkdocs_yaml.write_text("plugins:\n- search\n- macros:\n    a: &one 1\n    b: *one\n")
+    with mkdocs_profile(mkdocs_yaml, MkDocsLoader) as build_config:
+        assert yaml.safe_load(build_config.read_text())['plugins'] == [{'macros': {'a': 1, 'b': 1}}]
+    mkdocs_yaml.write_text("plugins:\n  - search:\n      opts: &opts {a: 1}\n  - other:\n      opts: *opts\n")
+    with mkdocs_profile(mkdocs_yaml, MkDocsLoader) as build_config:
+        assert build_config == mkdocs_yaml
+
+    output_dir = tmp_path / "doxygen_output"
+    output_dir.mkdir()
+    overlay = doxygen_profile(tmp_path / "Doxyfile", output_dir).read_text().splitlines()
+    assert overlay[0] == f"@INCLUDE = {(tmp_path / 'Doxyfile').resolve()}"
+    assert "GENERATE_HTML = NO" in overlay and "GENERATE_XML = YES" in overlay
+    assert f"OUTPUT_DIRECTORY = {output_dir.resolve()}" in overlay
+
+    config = {'plugins': ['jekyll-feed', 'jekyll-seo-tag']}
+    with jekyll_profile(tmp_path / "_config.yml", config) as args:
+        assert args[0] == '--config' and args[1].startswith('_config.yml,')
+        assert yaml.safe_load(Path(args[1].split(',')[1]).read_text()) == {'plugins': ['jekyll-seo-tag']}
+    with jekyll_profile(tmp_path / "_config.yml", {'plugins': ['jekyll-seo-tag']}) as args:
+        assert args == []
+
+def test_doxygen_streaming_parse(tmp_path):
+    from docsforai.builder.frameworks.doxygen import MIN_COMPOUNDS_FOR_POOL, parse_doxygen
+
+    (tmp_path / "Doxyfile").write_text("INPUT = src\n")
+    count = MIN_COMPOUNDS_FOR_POOL + 1
+    compound = """<?xml version='1.0'?>
+<doxygen><compounddef id="class_widget{i}" kind="class">
+  <compoundname>ns::Widget{i}</compoundname>
+  <sectiondef kind="public-func">
+    <memberdef kind="function" id="m{i}">
+      <type>std::vector&lt; <ref refid="x">Item</ref> &gt;</type><name>items</name>
+      <briefdescription><para>Returns the <computeroutput>Item</computeroutput> list.</para></briefdescription>
+      <detaileddescription><para>Call it <bold>after</bold> load.<parameterlist kind="param"><parameteritem>
+        <parameternamelist><parametername>limit</parametername></parameternamelist>
+        <parameterdescription><para>Maximum count.</para></parameterdescription>
+      </parameteritem></parameterlist><simplesect kind="return"><para>The items.</para></simplesect></para></detaileddescription>
+    </memberdef>
+  </sectiondef>
+  <briefdescription><para>A widget.</para></briefdescription>
+  <detaileddescription><para>Use <ref refid="y">Widget::items</ref> to list items.</para>
+    <para><programlisting><codeline><highlight>auto x = w.items();</highlight></codeline></programlisting></para></detaileddescription>
+</compounddef></doxygen>"""
+
+    def fake_doxygen(cmd, cwd=None, additional_args=None, **kwargs):
+        xml_dir = Path(cwd) / "doxygen_output" / "xml"
+        xml_dir.mkdir(parents=True)
+        entries = ''.join(
+            f'<compound refid="class_widget{i}" kind="class"><name>ns::Widget{i}</name>'
+            f'<member refid="m{i}" kind="function"><name>items</name></member></compound>'
+            for i in range(count)
+        )
+        (xml_dir / "index.xml").write_text(f"<?xml version='1.0'?><doxygenindex>{entries}</doxygenindex>")
+        for i in range(count):
+            (xml_dir / f"class_widget{i}.xml").write_text(compound.format(i=i))
+        return subprocess.CompletedProcess(cmd, 0, stdout='', stderr='')
+
+    with patch('docsforai.builder.frameworks.doxygen.run_subprocess_with_logging', side_effect=fake_doxygen):
+        serial = list(parse_doxygen(tmp_path, doxygen_workers=1))
+        pooled = list(parse_doxygen(tmp_path, doxygen_workers=2))
+
+    assert serial == pooled
+    assert [doc['filename'] for doc in serial[:2]] == ['class_ns::Widget0.md', 'class_ns::Widget1.md']
+    content = serial[0]['content']
+    assert content.index("A widget.") < content.index("## Public-func")
+    assert "Use Widget::items to list items." in content
+    assert "```\nauto x = w.items();\n```" in content
+    assert "### std::vector< Item > items" in content
+    assert "Returns the `Item` list." in content
+    assert "Call it **after** load." in content
+    assert "- `limit`: Maximum count." in content and "**Returns:** The items." in content
+
+def test_rustdoc_target_cache_and_json(tmp_path, monkeypatch):
+    import json
+    from docsforai.builder.frameworks.rustdoc import parse_rustdoc
+    from docsforai.builder.rustdoc_json import iter_json_members
+
+    monkeypatch.setenv('DOCSFORAI_CACHE_DIR', str(tmp_path / "cache"))
+    crate = tmp_path / "crate"
+    (crate / "src").mkdir(parents=True)
+    (crate / "Cargo.toml").write_text('[package]\nname = "my-crate"\n')
+    (crate / "src" / "lib.rs").write_text("//! My crate.\n")
+    vec_u8 = {"resolved_path": {"path": "Vec", "id": 90, "args": {"angle_bracketed": {"args": [{"type": {"primitive": "u8"}}], "constraints": []}}}}
+    rustdoc = {
+        "root": 0,
+        "crate_version": "0.1.0",
+        "index": {
+            "0": {"id": 0, "crate_id": 0, "name": "my_crate", "visibility": "public", "docs": "My crate.",
+                  "inner": {"module": {"is_crate": True, "items": [1, 2], "is_stripped": False}}},
+            "1": {"id": 1, "crate_id": 0, "name": "Buffer", "visibility": "public", "docs": "A byte buffer.",
+                  "inner": {"struct": {"kind": {"plain": {"fields": [3], "has_stripped_fields": False}},
+                                       "generics": {"params": [], "where_predicates": []}, "impls": [4, 6]}}},
+            "2": {"id": 2, "crate_id": 0, "name": "decode", "visibility": "public", "docs": "Decode bytes.",
+                  "inner": {"function": {"sig": {"inputs": [["input", {"borrowed_ref": {"lifetime": "'a", "is_mutable": False, "type": {"slice": {"primitive": "u8"}}}}]],
+                                                 "output": vec_u8, "is_c_variadic": False},
+                                         "generics": {"params": [{"name": "'a", "kind": {"lifetime": {"outlives": []}}}], "where_predicates": []},
+                                         "header": {"is_const": False, "is_unsafe": False, "is_async": True, "abi": "Rust"}, "has_body": True}}},
+            "3": {"id": 3, "crate_id": 0, "name": "data", "visibility": "default", "docs": "Raw bytes.\n\nMore.",
+                  "inner": {"struct_field": vec_u8}},
+            "4": {"id": 4, "crate_id": 0, "name": None, "visibility": "default", "docs": None,
+                  "inner": {"impl": {"is_unsafe": False, "generics": {"params": [], "where_predicates": []}, "trait": None,
+                                     "for": {"resolved_path": {"path": "Buffer", "id": 1, "args": None}},
+                                     "items": [5], "is_negative": False, "is_synthetic": False, "blanket_impl": None}}},
+            "5": {"id": 5, "crate_id": 0, "name": "len", "visibility": "public", "docs": "Length in bytes.",
+                  "inner": {"function": {"sig": {"inputs": [["self", {"borrowed_ref": {"lifetime": None, "is_mutable": False, "type": {"generic": "Self"}}}]],
+                                                 "output": {"primitive": "usize"}, "is_c_variadic": False},
+                                         "generics": {"params": [], "where_predicates": []},
+                                         "header": {"is_const": False, "is_unsafe": False, "is_async": False, "abi": "Rust"}, "has_body": True}}},
+            "6": {"id": 6, "crate_id": 0, "name": None, "visibility": "default", "docs": None,
+                  "inner": {"impl": {"trait": {"path": "Clone", "id": 91, "args": None}, "for": {"resolved_path": {"path": "Buffer", "id": 1, "args": None}},
+                                     "items": [7], "is_synthetic": False, "blanket_impl": None}}},
+            "7": {"id": 7, "crate_id": 0, "name": "clone", "visibility": "default", "docs": None,
+                  "inner": {"function": {"sig": {"inputs": [], "output": None}, "generics": {"params": []}, "header": {}}}},
+        },
+        "paths": {
+            "0": {"crate_id": 0, "path": ["my_crate"], "kind": "module"},
+            "1": {"crate_id": 0, "path": ["my_crate", "Buffer"], "kind": "struct"},
+            "2": {"crate_id": 0, "path": ["my_crate", "decode"], "kind": "function"},
+            "90": {"crate_id": 1, "path": ["alloc", "vec", "Vec"], "kind": "struct"},
+        },
+        "external_crates": {"1": {"name": "alloc", "html_root_url": None}},
+        "format_version": 39,
+    }
+    json_text = json.dumps(rustdoc, indent=1)
+    (tmp_path / "stream.json").write_text(json_text)
+    streamed = {}
+    # A tiny read size makes values span many reads
+    for key, member, value in iter_json_members(tmp_path / "stream.json", {'index', 'format_version'}, read_size=7):
+        streamed.setdefault(key, {})[member] = value
+    assert streamed == {'index': rustdoc['index'], 'format_version': {None: 39}}
+
+    calls = []
+
+    def fake_run(cmd, cwd=None, additional_args=None, check=True, env=None, **kwargs):
+        calls.append((cmd, env))
+        if cmd[:2] == ['rustc', '-vV']:
+            return subprocess.CompletedProcess(cmd, 0, stdout='rustc 1.85.0-nightly\nhost: x86_64-unknown-linux-gnu\n', stderr='')
+        if cmd[:2] == ['cargo', 'metadata']:
+            metadata = {'packages': [{'name': 'my-crate', 'targets': [{'name': 'my-crate', 'kind': ['lib']}]}]}
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(metadata), stderr='')
+        doc_dir = Path(env['CARGO_TARGET_DIR']) / "doc"
+        doc_dir.mkdir(parents=True, exist_ok=True)
+        (doc_dir / "my_crate.json").write_text(json_text)
+        (doc_dir / "stale_crate.json").write_text(json_text)
+        return subprocess.CompletedProcess(cmd, 0, stdout='', stderr='')
+
+    with patch('docsforai.builder.frameworks.rustdoc.run_subprocess_with_logging', side_effect=fake_run):
+        first = list(parse_rustdoc(crate, rustdoc_format='json'))
+        second = list(parse_rustdoc(crate, rustdoc_format='json'))
+
+    assert first == second
+    target_dirs = {env['CARGO_TARGET_DIR'] for cmd, env in calls if cmd[:2] == ['cargo', 'doc']}
+    assert len(target_dirs) == 1 and Path(target_dirs.pop()).is_relative_to(tmp_path / "cache")
+    assert all('--output-format json' in env['RUSTDOCFLAGS'] for cmd, env in calls if cmd[:2] == ['cargo', 'doc'])
+    assert [(doc['type'], doc['filename']) for doc in first] == [
+        ('rustdoc_module', 'my_crate.md'),
+        ('rustdoc_struct', 'my_crate_Buffer.md'),
+        ('rustdoc_function', 'my_crate_decode.md'),
+        ('rustdoc_method', 'my_crate_Buffer_len.md'),
+    ]
+    contents = {doc['filename']: doc['content'] for doc in first}
+    assert "```rust\npub async fn decode<'a>(input: &'a [u8]) -> Vec<u8>\n```" in contents['my_crate_decode.md']
+    assert "## Fields\n\n- `data: Vec<u8>`: Raw bytes." in contents['my_crate_Buffer.md']
+    assert "pub fn len(&self) -> usize" in contents['my_crate_Buffer_len.md']
+
+def test_godoc_per_package_pool(tmp_path):
+    from docsforai.builder.frameworks.godoc import parse_godoc
+
+    (tmp_path / "go.mod").write_text("module example.com/kv\n")
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "go.mod").write_text("module example.com/kv/api\n")
+    (tmp_path / "testdata" / "fixture").mkdir(parents=True)
+    (tmp_path / "testdata" / "fixture" / "go.mod").write_text("module fixture\n")
+    listed = {
+        tmp_path: ["example.com/kv", "example.com/kv/server", "example.com/kv/broken"],
+        tmp_path / "api": ["example.com/kv/api"],
+    }
+
+    def fake_go(cmd, cwd=None, check=True, **kwargs):
+        if cmd[:2] == ['go', 'list']:
+            return subprocess.CompletedProcess(cmd, 0, stdout='\n'.join(listed[Path(cwd)]) + '\n', stderr='')
+        import_path = cmd[-1]
+        if import_path.endswith('broken'):
+            return subprocess.CompletedProcess(cmd, 1, stdout='', stderr='no buildable Go source files')
+        name = import_path.rsplit('/', 1)[-1]
+        output = f'package {name} // import "{import_path}"\n\nPackage {name} does things.\n\nfunc Run() error\n'
+        return subprocess.CompletedProcess(cmd, 0, stdout=output, stderr='')
+
+    with patch('docsforai.builder.frameworks.godoc.run_subprocess_with_logging', side_effect=fake_go) as mock_run:
+        docs = list(parse_godoc(tmp_path, godoc_workers=2))
+
+    assert [doc['filename'] for doc in docs] == ['example.com/kv.md', 'example.com/kv/server.md', 'example.com/kv/api.md']
+    assert docs[1]['content'] == "# Package: example.com/kv/server\n\nPackage server does things.\n\nfunc Run() error\n"
+    assert sum(call.args[0][:2] == ['go', 'doc'] for call in mock_run.call_args_list) == 4
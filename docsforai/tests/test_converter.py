@@ -1,8 +1,10 @@
 import pytest
 from docsforai.converter.rst_to_md import rst_to_md
 from docsforai.converter.adoc_to_md import adoc_to_md
-from docsforai.converter.html_to_md import html_to_md
+from docsforai.converter.html_to_md import html_to_md, convert_html_files, configure_conversion
 from docsforai.converter.ipynb_to_md import ipynb_to_md
+from docsforai.converter.conversion_cache import ConversionCache
+from docsforai.converter.content_extractor import extract_main_content
 from unittest.mock import patch, MagicMock
 
 def test_rst_to_md():
@@ -112,4 +114,70 @@ def test_html_to_md_error_handling():
 
 def test_ipynb_to_md_error_handling():
     with pytest.raises(ValueError, match="Invalid Jupyter Notebook format"):
-        ipynb_to_md("Invalid JSON")
\ No newline at end of file
+        ipynb_to_md("Invalid JSON")
+
+def test_convert_html_files_keeps_order(tmp_path, monkeypatch):
+    monkeypatch.setenv('DOCSFORAI_CACHE_DIR', str(tmp_path / "cache"))
+    html_files = []
+    for i in range(40):
+        html_file = tmp_path / f"page{i}.html"
+        html_file.write_text(f"<h1>Page {i}</h1><p>{'text ' * (40 - i)}</p>", encoding='utf-8')
+        html_files.append(html_file)
+
+    serial = list(convert_html_files(html_files, workers=1))
+    cached = list(convert_html_files(html_files, workers=1))
+    configure_conversion(cache=False)
+    try:
+        parallel = list(convert_html_files(html_files, workers=3, chunksize=4))
+    finally:
+        configure_conversion()
+
+    assert parallel == serial == cached
+    assert ConversionCache(tmp_path / "cache" / "conversion" / "conversion.sqlite").stats()['hits'] == 40
+    assert [md.splitlines()[0].split() for md in parallel] == [['#', 'Page', str(i)] for i in range(40)]
+
+def test_conversion_cache_lru_and_stats(tmp_path):
+    cache = ConversionCache(tmp_path / "conversion.sqlite", max_bytes=10)
+    cache.put('a', 'aaaa')
+    cache.put('b', 'bbbb')
+    assert cache.lookup(['a', 'b', 'c']) == {'a', 'b'}
+    cache.put('c', 'cccc')
+    assert cache.evict() == 1
+    assert cache.get('a') is None and cache.get('c') == 'cccc'
+    assert cache.summary() == "2 hits, 1 misses (66.7% hit rate)"
+    cache.close()
+
+    reopened = ConversionCache(tmp_path / "conversion.sqlite")
+    assert reopened.stats() == {'hits': 2, 'misses': 1, 'entries': 2, 'bytes': 8}
+    reopened.close()
+
+def test_html_to_md_engines():
+    html_content = "<html><body><h1>Title</h1><p>See <a href='api.html'>the API</a>.</p></body></html>"
+
+    assert html_to_md(html_content, 'html2text') == "# Title\n\nSee [the API](api.html)."
+    legacy = html_to_md(html_content, 'bs4')
+    assert 'Title' in legacy and '(api.html)' in legacy
+    with pytest.raises(ValueError):
+        html_to_md(html_content, 'unknown')
+
+
+def test_extract_main_content():
+    body = "<p>The actual documentation of the page, long enough to count.</p>"
+    sphinx_page = (
+        '<div class="document"><div class="body" role="main"><div class="section">' + body + '</div></div>'
+        '<div class="sphinxsidebar"><ul><li>Navigation</li></ul></div></div>'
+    )
+    extracted = extract_main_content(sphinx_page, 'sphinx')
+    assert extracted.startswith('<div class="body"') and body in extracted
+    assert 'Navigation' not in extracted
+
+    plain_page = "<nav>Menu</nav><header>Site</header><div>" + body + "</div><footer>Copyright</footer>"
+    assert extract_main_content(plain_page) == "<div>" + body + "</div>"
+    assert extract_main_content(plain_page, selectors=['div']) == "<div>" + body + "</div>"
+    with pytest.raises(ValueError):
+        extract_main_content(plain_page, selectors=['div > p'])
+
+    from docsforai.utils.config_parser import _validate_conversion
+    assert _validate_conversion({'content_selectors': ['div.body']})['content_selectors'] == ['div.body']
+    with pytest.raises(ValueError, match="Unsupported content selector"):
+        _validate_conversion({'content_selectors': ['div.body', 'div > p']})
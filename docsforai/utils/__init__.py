@@ -9,6 +9,8 @@ from .git_handler import clone_repository
 from .file_utils import create_directory, cleanup_directory, read_file, write_file
 from .dependency_manager import check_dependencies, get_installation_instructions
 from .subprocess_utils import run_subprocess_with_logging
+from .discovery import walk_files, find_files, configure_discovery
+from .cache import configure_cache, get_cache_dir
 
 __all__ = [
     'parse_config',
@@ -19,5 +21,10 @@ __all__ = [
     'write_file',
     'check_dependencies',
     'get_installation_instructions',
-    'run_subprocess_with_logging'
+    'run_subprocess_with_logging',
+    'walk_files',
+    'find_files',
+    'configure_discovery',
+    'configure_cache',
+    'get_cache_dir'
 ]
\ No newline at end of file
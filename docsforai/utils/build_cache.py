@@ -0,0 +1,197 @@
+"""
+Build artifact caches for DocsForAI.
+
+Documentation builds run in a fresh clone that is deleted afterwards, so the
+incremental-build state of the underlying tools (Sphinx doctrees, installed
+packages, compiler output) is normally lost. This module provides per-project
+directories below the 'builds' cache, a lock so that concurrent builds of the
+same project do not share a directory, and a manifest that restores the
+modification times of unchanged files in a new clone so that mtime-based
+incremental builds recognize them as up to date.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .cache import get_cache_dir, load_json, save_json
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+def build_cache_dir(kind: str, key: Dict[str, Any]) -> Optional[Path]:
+    """
+    Return (and create) the cache directory of one project for one build tool.
+
+    Args:
+        kind (str): Build tool, e.g. 'sphinx'.
+        key (Dict[str, Any]): Values identifying the project and tool version.
+
+    Returns:
+        Optional[Path]: The directory, or None if caching is disabled.
+    """
+    root = get_cache_dir('builds')
+    if root is None:
+        return None
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    cache_dir = root / kind / digest[:16]
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Build cache directory {cache_dir} is not usable: {str(e)}")
+        return None
+    return cache_dir
+
+def touch_build_cache(cache_dir: Path) -> None:
+    """Mark a build cache directory as used now, for prune_build_caches()."""
+    try:
+        os.utime(cache_dir)
+    except OSError as e:
+        logger.debug(f"Cannot touch build cache {cache_dir}: {str(e)}")
+
+def prune_build_caches(kind: str, keep: int, exclude: Optional[Path] = None) -> int:
+    """
+    Delete the least recently used cache directories of a build tool.
+
+    Directories locked by a running build are skipped.
+
+    Args:
+        kind (str): Build tool, e.g. 'node_modules'.
+        keep (int): Number of most recently used directories to keep.
+        exclude (Optional[Path]): Directory never deleted (the one in use).
+
+    Returns:
+        int: Number of deleted directories.
+    """
+    root = get_cache_dir('builds')
+    if root is None or not (root / kind).is_dir():
+        return 0
+    entries = sorted(
+        (path for path in (root / kind).iterdir() if path.is_dir() and path != exclude),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True
+    )
+    keep = max(0, keep - (1 if exclude is not None else 0))
+    pruned = 0
+    for path in entries[keep:]:
+        with cache_lock(path) as locked:
+            if not locked:
+                continue
+            # Move the directory away first so a partially deleted tree is never used
+            doomed = path.with_name(f".{path.name}.deleted-{os.getpid()}-{time.time_ns()}")
+            try:
+                os.replace(path, doomed)
+            except OSError as e:
+                logger.debug(f"Cannot prune build cache {path}: {str(e)}")
+                continue
+        shutil.rmtree(doomed, ignore_errors=True)
+        pruned += 1
+    if pruned:
+        logger.info(f"Pruned {pruned} unused {kind} build caches")
+    return pruned
+
+@contextlib.contextmanager
+def cache_lock(cache_dir: Path) -> Iterator[bool]:
+    """
+    Lock a build cache directory for the duration of a build.
+
+    The lock is not blocking: if another build holds it, False is yielded and
+    the caller should build without the cache.
+
+    Args:
+        cache_dir (Path): Build cache directory.
+
+    Yields:
+        bool: Whether the lock was acquired.
+    """
+    if fcntl is None:
+        yield True
+        return
+    with open(cache_dir / '.lock', 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.info(f"Build cache {cache_dir} is in use by another build")
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class MtimeManifest:
+    """
+    Content hashes and modification times of the files of a source tree.
+
+    restore() gives every file whose content is unchanged since the last
+    record() the modification time it had then, so a fresh checkout looks
+    untouched to tools that compare mtimes against their previous build.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): Location of the manifest file.
+        """
+        self.path = path
+        data = load_json(path, {})
+        if data.get('version') != MANIFEST_VERSION:
+            data = {}
+        self._entries: Dict[str, list] = data.get('files', {})
+        self._current: Dict[str, list] = {}
+
+    def restore(self, root: Path, files: Iterable[Path]) -> int:
+        """
+        Restore the recorded modification times of unchanged files.
+
+        Args:
+            root (Path): Root of the source tree.
+            files (Iterable[Path]): Files of the source tree.
+
+        Returns:
+            int: Number of files whose modification time was restored.
+        """
+        restored = 0
+        for file_path in files:
+            relative = file_path.relative_to(root).as_posix()
+            try:
+                stat = file_path.stat()
+                entry = self._entries.get(relative)
+                if entry and entry[0] == stat.st_size:
+                    digest = _file_digest(file_path)
+                    if digest == entry[1]:
+                        if stat.st_mtime_ns != entry[2]:
+                            os.utime(file_path, ns=(stat.st_atime_ns, entry[2]))
+                            restored += 1
+                        self._current[relative] = entry
+                        continue
+                else:
+                    digest = _file_digest(file_path)
+                self._current[relative] = [stat.st_size, digest, stat.st_mtime_ns]
+            except OSError as e:
+                logger.debug(f"Cannot restore modification time of {file_path}: {str(e)}")
+        logger.info(f"Restored modification times of {restored} unchanged files ({len(self._current)} files tracked)")
+        return restored
+
+    def record(self) -> None:
+        """Save the state of the files seen by restore()."""
+        save_json(self.path, {'version': MANIFEST_VERSION, 'files': self._current})
@@ -0,0 +1,107 @@
+"""
+Persistent cache locations for DocsForAI.
+
+All on-disk caches (framework detection results, conversion output, build
+artifacts) live below a single cache root so that they can be relocated or
+wiped together. The root defaults to $DOCSFORAI_CACHE_DIR, then
+$XDG_CACHE_HOME/docsforai, then ~/.cache/docsforai.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = 'DOCSFORAI_CACHE_DIR'
+
+_cache_root: Optional[Path] = None
+_cache_enabled: bool = True
+
+def default_cache_root() -> Path:
+    """Return the cache root used when none is configured."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV]).expanduser()
+    xdg_cache = os.environ.get('XDG_CACHE_HOME')
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / '.cache'
+    return base / 'docsforai'
+
+def configure_cache(cache_dir: Optional[str] = None, enabled: bool = True) -> None:
+    """
+    Configure the cache root for the current build.
+
+    Args:
+        cache_dir (Optional[str]): Cache root directory. Uses the default location if None.
+        enabled (bool): Whether persistent caches are used at all.
+    """
+    global _cache_root, _cache_enabled
+    _cache_root = Path(cache_dir).expanduser() if cache_dir else None
+    _cache_enabled = enabled
+    logger.debug(f"Cache configured at {get_cache_root()}, enabled={enabled}")
+
+def get_cache_root() -> Path:
+    """Return the configured cache root."""
+    return _cache_root if _cache_root is not None else default_cache_root()
+
+def get_cache_dir(name: str) -> Optional[Path]:
+    """
+    Return (and create) the cache subdirectory `name`.
+
+    Args:
+        name (str): Name of the cache, e.g. 'detection'.
+
+    Returns:
+        Optional[Path]: The cache directory, or None if caching is disabled or
+        the directory cannot be created.
+    """
+    if not _cache_enabled:
+        return None
+    cache_dir = get_cache_root() / name
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Cache directory {cache_dir} is not usable: {str(e)}")
+        return None
+    return cache_dir
+
+def load_json(path: Path, default: Any = None) -> Any:
+    """
+    Load a JSON cache file, returning `default` if it is missing or corrupt.
+
+    Args:
+        path (Path): Path to the JSON file.
+        default (Any): Value returned when the file cannot be read.
+
+    Returns:
+        Any: The decoded content or `default`.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {str(e)}")
+        return default
+
+def save_json(path: Path, data: Any) -> None:
+    """
+    Atomically write a JSON cache file.
+
+    The data is written to a temporary file in the same directory and moved
+    into place, so concurrent builds never observe a partial file.
+
+    Args:
+        path (Path): Path to the JSON file.
+        data (Any): JSON-serializable data.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write cache file {path}: {str(e)}")
@@ -17,6 +17,32 @@ SUPPORTED_FRAMEWORKS = [
     'openapi', 'readthedocs', 'restructuredtext', 'rustdoc'
 ]
 SUPPORTED_OUTPUT_FORMATS = ['markdown', 'html']
+SUPPORTED_DOCS_MODES = ['single', 'monorepo']
+SUPPORTED_CONVERSION_ENGINES = ['html2text', 'bs4']
+SUPPORTED_PREFER_OPTIONS = ['source', 'built', 'both']
+SUPPORTED_SPHINX_BUILDERS = ['auto', 'markdown', 'text', 'html']
+SUPPORTED_SPHINX_RUNNERS = ['subprocess', 'inprocess']
+SUPPORTED_HUGO_MODES = ['build', 'content']
+SUPPORTED_RUSTDOC_FORMATS = ['html', 'json']
+
+# Framework build arguments by expected type
+LIST_BUILD_ARGS = [
+    'npm_install_args', 'npm_build_args', 'doxygen_args', 'hugo_args',
+    'bundle_install_args', 'bundle_build_args', 'sphinx_args', 'hugo_build_sections'
+]
+STRING_BUILD_ARGS = ['gitbook_config_file']
+BOOL_BUILD_ARGS = [
+    'sphinx_cache', 'node_modules_cache', 'node_build', 'bundle_cache', 'jekyll_incremental', 'lean_build',
+    'cargo_target_cache'
+]
+POSITIVE_INT_BUILD_ARGS = ['sphinx_jobs', 'doxygen_workers', 'godoc_workers']
+CHOICE_BUILD_ARGS = {
+    'prefer': SUPPORTED_PREFER_OPTIONS,
+    'sphinx_builder': SUPPORTED_SPHINX_BUILDERS,
+    'sphinx_runner': SUPPORTED_SPHINX_RUNNERS,
+    'hugo_mode': SUPPORTED_HUGO_MODES,
+    'rustdoc_format': SUPPORTED_RUSTDOC_FORMATS
+}
 
 def parse_config(config_path: Path) -> Dict[str, Any]:
     """
@@ -56,6 +82,7 @@ def parse_config(config_path: Path) -> Dict[str, Any]:
         'build_args': _validate_build_args(config.get('build_args', {})),
         'output': _validate_output(config.get('output', {})),
         'consolidation': _validate_consolidation(config.get('consolidation', {})),
+        'conversion': _validate_conversion(config.get('conversion', {})),
         'metadata': _validate_metadata(config.get('metadata', {})),
         'advanced': _validate_advanced(config.get('advanced', {}))
     }
@@ -98,12 +125,37 @@ def _validate_docs(docs: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("Missing required field in docs: path")
     
     if 'framework' in docs and docs['framework'] != 'auto' and docs['framework'] not in SUPPORTED_FRAMEWORKS:
-        raise ValueError(f"Unsupported framework. Must be 'auto' or one of: {', '.join(SUPPORTED_FRAMEWORKS)}")
+        # Frameworks contributed by plugins through the parser entry points are accepted too
+        from ..builder.registry import FRAMEWORK_PARSERS
+        if docs['framework'] not in FRAMEWORK_PARSERS:
+            raise ValueError(f"Unsupported framework. Must be 'auto' or one of: {', '.join(SUPPORTED_FRAMEWORKS)}")
+    
+    exclude_dirs = docs.get('exclude_dirs', [])
+    if not isinstance(exclude_dirs, list):
+        raise ValueError("exclude_dirs must be a list of strings")
+    
+    byte_budgets = docs.get('detection_byte_budgets', {})
+    if not isinstance(byte_budgets, dict) or not all(isinstance(v, int) for v in byte_budgets.values()):
+        raise ValueError("detection_byte_budgets must map framework names to byte counts")
+    
+    mode = docs.get('mode', 'single')
+    if mode not in SUPPORTED_DOCS_MODES:
+        raise ValueError(f"Unsupported docs mode. Must be one of: {', '.join(SUPPORTED_DOCS_MODES)}")
+    
+    roots = docs.get('roots', [])
+    if not isinstance(roots, list) or not all(isinstance(root, str) for root in roots):
+        raise ValueError("roots must be a list of strings")
     
     return {
         'path': docs['path'],
         'framework': docs.get('framework', 'auto'),
-        'index_file': docs.get('index_file')
+        'mode': mode,
+        'roots': roots,
+        'max_root_depth': docs.get('max_root_depth', 3),
+        'index_file': docs.get('index_file'),
+        'exclude_dirs': exclude_dirs,
+        'respect_gitignore': docs.get('respect_gitignore', True),
+        'detection_byte_budgets': byte_budgets
     }
 
 def _validate_build(build: Dict[str, Any]) -> Dict[str, Any]:
@@ -129,51 +181,25 @@ def _validate_build_args(build_args: Dict[str, Any]) -> Dict[str, Any]:
     """Validate build arguments configuration."""
     validated = {}
     
-    # Validate npm arguments
-    if 'npm_install_args' in build_args:
-        if not isinstance(build_args['npm_install_args'], list):
-            raise ValueError("npm_install_args must be a list of strings")
-        validated['npm_install_args'] = build_args['npm_install_args']
-    
-    if 'npm_build_args' in build_args:
-        if not isinstance(build_args['npm_build_args'], list):
-            raise ValueError("npm_build_args must be a list of strings")
-        validated['npm_build_args'] = build_args['npm_build_args']
-    
-    # Validate doxygen arguments
-    if 'doxygen_args' in build_args:
-        if not isinstance(build_args['doxygen_args'], list):
-            raise ValueError("doxygen_args must be a list of strings")
-        validated['doxygen_args'] = build_args['doxygen_args']
-    
-    # Validate hugo arguments
-    if 'hugo_args' in build_args:
-        if not isinstance(build_args['hugo_args'], list):
-            raise ValueError("hugo_args must be a list of strings")
-        validated['hugo_args'] = build_args['hugo_args']
-    
-    # Validate jekyll arguments
-    if 'bundle_install_args' in build_args:
-        if not isinstance(build_args['bundle_install_args'], list):
-            raise ValueError("bundle_install_args must be a list of strings")
-        validated['bundle_install_args'] = build_args['bundle_install_args']
-    
-    if 'bundle_build_args' in build_args:
-        if not isinstance(build_args['bundle_build_args'], list):
-            raise ValueError("bundle_build_args must be a list of strings")
-        validated['bundle_build_args'] = build_args['bundle_build_args']
-    
-    # Validate sphinx arguments
-    if 'sphinx_args' in build_args:
-        if not isinstance(build_args['sphinx_args'], list):
-            raise ValueError("sphinx_args must be a list of strings")
-        validated['sphinx_args'] = build_args['sphinx_args']
-    
-    # Validate GitBook arguments
-    if 'gitbook_config_file' in build_args:
-        if not isinstance(build_args['gitbook_config_file'], str):
-            raise ValueError("gitbook_config_file must be a string")
-        validated['gitbook_config_file'] = build_args['gitbook_config_file']
+    for key, value in build_args.items():
+        if key in LIST_BUILD_ARGS:
+            if not isinstance(value, list):
+                raise ValueError(f"{key} must be a list of strings")
+        elif key in STRING_BUILD_ARGS:
+            if not isinstance(value, str):
+                raise ValueError(f"{key} must be a string")
+        elif key in BOOL_BUILD_ARGS:
+            if not isinstance(value, bool):
+                raise ValueError(f"{key} must be true or false")
+        elif key in POSITIVE_INT_BUILD_ARGS:
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ValueError(f"{key} must be a positive integer")
+        elif key in CHOICE_BUILD_ARGS:
+            if value not in CHOICE_BUILD_ARGS[key]:
+                raise ValueError(f"Unsupported {key} value. Must be one of: {', '.join(CHOICE_BUILD_ARGS[key])}")
+        else:
+            continue
+        validated[key] = value
     
     return validated
 
@@ -201,7 +227,9 @@ def _validate_consolidation(consolidation: Dict[str, Any]) -> Dict[str, Any]:
         'include_changelog': consolidation.get('include_changelog', False),
         'changelog_path': consolidation.get('changelog_path'),
         'exclude_patterns': consolidation.get('exclude_patterns', []),
-        'custom_order': consolidation.get('custom_order', [])
+        'custom_order': consolidation.get('custom_order', []),
+        'boilerplate_threshold': consolidation.get('boilerplate_threshold', 0),  # Disabled unless opted in
+        'boilerplate_min_pages': consolidation.get('boilerplate_min_pages', 20)
     }
     
     # Validate exclude_patterns is a list of strings
@@ -212,6 +240,44 @@ def _validate_consolidation(consolidation: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(validated['custom_order'], list):
         raise ValueError("custom_order must be a list")
     
+    threshold = validated['boilerplate_threshold']
+    if threshold is not None and (not isinstance(threshold, (int, float)) or not 0 <= threshold <= 1):
+        raise ValueError("boilerplate_threshold must be a number between 0 and 1")
+    
+    min_pages = validated['boilerplate_min_pages']
+    if not isinstance(min_pages, int) or min_pages < 1:
+        raise ValueError("boilerplate_min_pages must be a positive integer")
+    
+    return validated
+
+def _validate_conversion(conversion: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate HTML conversion configuration."""
+    validated = {
+        'engine': conversion.get('engine', 'html2text'),
+        'workers': conversion.get('workers'),  # Default: advanced.max_workers, then the CPU count
+        'chunksize': conversion.get('chunksize'),  # Default: derived from the page count
+        'cache': conversion.get('cache', True),
+        'cache_max_mb': conversion.get('cache_max_mb', 512),
+        'extract_main_content': conversion.get('extract_main_content', True),
+        'content_selectors': conversion.get('content_selectors', [])
+    }
+    
+    if validated['engine'] not in SUPPORTED_CONVERSION_ENGINES:
+        raise ValueError(f"Unsupported conversion engine. Must be one of: {', '.join(SUPPORTED_CONVERSION_ENGINES)}")
+    
+    for key in ('workers', 'chunksize', 'cache_max_mb'):
+        value = validated[key]
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(f"{key} must be a positive integer")
+    
+    selectors = validated['content_selectors']
+    if not isinstance(selectors, list) or not all(isinstance(s, str) for s in selectors):
+        raise ValueError("content_selectors must be a list of strings")
+    # Checked here: conversion workers would only reject them after the site build
+    from ..converter.content_extractor import _parse_selector
+    for selector in selectors:
+        _parse_selector(selector)
+    
     return validated
 
 def _validate_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -229,5 +295,8 @@ def _validate_advanced(advanced: Dict[str, Any]) -> Dict[str, Any]:
     return {
         'timeout': advanced.get('timeout', 300),  # Default 5 minutes
         'max_file_size': advanced.get('max_file_size', 10000000),  # Default 10MB
-        'ignore_errors': advanced.get('ignore_errors', False)
+        'ignore_errors': advanced.get('ignore_errors', False),
+        'max_workers': advanced.get('max_workers'),  # Default: derived from the CPU count
+        'cache': advanced.get('cache', True),
+        'cache_dir': advanced.get('cache_dir')  # Default: $DOCSFORAI_CACHE_DIR or ~/.cache/docsforai
     }
\ No newline at end of file
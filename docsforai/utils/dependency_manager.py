@@ -2,7 +2,6 @@ import shutil
 import subprocess
 import sys
 import logging
-import pkg_resources
 from typing import List, Dict
 
 logger = logging.getLogger(__name__)
@@ -95,6 +94,9 @@ def _check_external_dep(dep: str) -> List[str]:
 
 def _check_python_deps(framework: str) -> List[str]:
     """Check if Python package dependencies are installed."""
+    # pkg_resources is slow to import, so only load it when checking packages
+    import pkg_resources
+
     missing = []
     for req in PYTHON_DEPENDENCIES[framework]:
         try:
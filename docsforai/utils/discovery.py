@@ -0,0 +1,279 @@
+"""
+File discovery for DocsForAI.
+
+This module provides a single, fast directory walker shared by the framework
+detector and every framework parser. It prunes dependency and build
+directories (node_modules, vendor/bundle, .git, target, _build, ...), honors
+.gitignore files found in the tree and in its parent directories up to the
+enclosing repository, and accepts additional user-configured exclude patterns.
+As in git, .gitignore rules take precedence over the exclude patterns, so a
+`!target/` line re-includes a default-excluded directory.
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUDE_DIRS = [
+    '.git',
+    '.hg',
+    '.svn',
+    'node_modules',
+    'bower_components',
+    'vendor/bundle',
+    'target',
+    '_build',
+    '__pycache__',
+    '.venv',
+    'venv',
+    '.tox',
+    '.nox',
+    '.mypy_cache',
+    '.pytest_cache',
+    '.docusaurus',
+    '.cache',
+]
+
+# (base directory relative to the walk root, compiled pattern, negated, directory-only)
+_Rule = Tuple[str, 're.Pattern[str]', bool, bool]
+
+_extra_excludes: List[str] = []
+_respect_gitignore: bool = True
+
+def configure_discovery(exclude_dirs: Optional[List[str]] = None, respect_gitignore: bool = True) -> None:
+    """
+    Configure discovery defaults for the current build.
+
+    Args:
+        exclude_dirs (Optional[List[str]]): Additional gitignore-style patterns to prune.
+        respect_gitignore (bool): Whether .gitignore files in the tree are honored.
+    """
+    global _extra_excludes, _respect_gitignore
+    _extra_excludes = list(exclude_dirs or [])
+    _respect_gitignore = respect_gitignore
+    logger.debug(f"Discovery configured with extra excludes {_extra_excludes}, gitignore={respect_gitignore}")
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (without leading/trailing slashes) to a regex."""
+    regex = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            regex.append('(?:/.*)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+        elif char == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif char == '?':
+            regex.append('[^/]')
+            i += 1
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                regex.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                regex.append(f'[{body}]')
+                i = end + 1
+        elif char == '\\' and i + 1 < len(pattern):
+            regex.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            regex.append(re.escape(char))
+            i += 1
+    return ''.join(regex)
+
+def _compile_rule(line: str, base: str) -> Optional[_Rule]:
+    """Compile one gitignore line into a rule, or None for blanks and comments."""
+    line = line.rstrip('\n').rstrip()
+    if not line or line.startswith('#'):
+        return None
+
+    negate = line.startswith('!')
+    if negate:
+        line = line[1:]
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+
+    anchored = '/' in line
+    line = line.lstrip('/')
+    regex = _glob_to_regex(line)
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return (base, re.compile(regex + '$'), negate, dir_only)
+
+def _compile_excludes(patterns: List[str]) -> List[_Rule]:
+    """
+    Compile exclude patterns into rules.
+
+    Exclude patterns match at any depth unless they start with '/'. Runs of
+    consecutive positive patterns are merged into one alternation so pruning
+    costs one regex match per entry; negated patterns ('!pattern') stay
+    separate rules, in order, so they can re-include what precedes them.
+    """
+    rules: List[_Rule] = []
+    for pattern in patterns:
+        negate = pattern.startswith('!')
+        body = pattern[1:] if negate else pattern
+        if not body.startswith('/') and not body.startswith('**/'):
+            body = '**/' + body
+        rule = _compile_rule(('!' if negate else '') + body, '')
+        if rule is None:
+            continue
+        previous = rules[-1] if rules else None
+        if not negate and previous is not None and not previous[2] and previous[3] == rule[3]:
+            merged = f'(?:{previous[1].pattern})|(?:{rule[1].pattern})'
+            rules[-1] = ('', re.compile(merged), False, rule[3])
+        else:
+            rules.append(rule)
+    return rules
+
+def _load_gitignore(directory: Path, base: str) -> List[_Rule]:
+    """Load the rules of a .gitignore file located in `directory`, if any."""
+    gitignore = directory / '.gitignore'
+    try:
+        lines = gitignore.read_text(encoding='utf-8', errors='ignore').splitlines()
+    except OSError:
+        return []
+    rules = [_compile_rule(line, base) for line in lines]
+    return [rule for rule in rules if rule is not None]
+
+def _parent_gitignores(root: Path) -> Tuple[str, List[_Rule]]:
+    """
+    Load the .gitignore files of the parent directories of `root`, up to its repository.
+
+    Returns:
+        Tuple[str, List[_Rule]]: The path of `root` relative to the repository
+        (with a trailing slash), and the rules relative to the repository.
+        Both are empty if `root` is not inside a repository.
+    """
+    root = root.resolve()
+    if (root / '.git').exists():
+        return '', []
+    parents = []
+    for parent in root.parents:
+        parents.append(parent)
+        if (parent / '.git').exists():
+            break
+    else:
+        return '', []
+
+    top = parents[-1]
+    rules: List[_Rule] = []
+    for parent in reversed(parents):
+        rel = parent.relative_to(top).as_posix()
+        rules.extend(_load_gitignore(parent, '' if rel == '.' else rel))
+    return root.relative_to(top).as_posix() + '/', rules
+
+def _is_ignored(rel_path: str, is_dir: bool, rules: List[_Rule], ignored: bool = False) -> bool:
+    """
+    Evaluate rules against a path relative to the walk root; the last match wins.
+
+    `ignored` is the state left by rules evaluated before these ones.
+    """
+    for base, regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + '/'):
+                continue
+            candidate = rel_path[len(base) + 1:]
+        else:
+            candidate = rel_path
+        if regex.match(candidate):
+            ignored = not negate
+    return ignored
+
+def walk_files(
+    root: Path,
+    extensions: Optional[Iterable[str]] = None,
+    exclude: Optional[List[str]] = None,
+    respect_gitignore: Optional[bool] = None
+) -> Iterator[Path]:
+    """
+    Walk a directory tree with os.scandir, pruning excluded directories.
+
+    Files are yielded in a deterministic order: the files of a directory sorted
+    by name, followed by its subdirectories sorted by name.
+
+    Args:
+        root (Path): Directory to walk. The root itself is never pruned.
+        extensions (Optional[Iterable[str]]): Only yield files with these extensions (e.g. '.md').
+        exclude (Optional[List[str]]): Additional gitignore-style patterns for this walk.
+        respect_gitignore (Optional[bool]): Override the configured .gitignore handling.
+
+    Yields:
+        Path: Paths of the discovered files.
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return
+
+    wanted = {ext.lower() for ext in extensions} if extensions is not None else None
+    use_gitignore = _respect_gitignore if respect_gitignore is None else respect_gitignore
+
+    base_rules = _compile_excludes(DEFAULT_EXCLUDE_DIRS + _extra_excludes + list(exclude or []))
+    root_prefix, parent_rules = _parent_gitignores(root) if use_gitignore else ('', [])
+
+    stack: List[Tuple[Path, str, List[_Rule]]] = [(root, '', [])]
+    while stack:
+        directory, rel_dir, rules = stack.pop()
+        if use_gitignore:
+            rules = rules + _load_gitignore(directory, rel_dir)
+
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {directory}: {str(e)}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            ignored = _is_ignored(rel_path, is_dir, base_rules)
+            if parent_rules:
+                ignored = _is_ignored(root_prefix + rel_path, is_dir, parent_rules, ignored)
+            if _is_ignored(rel_path, is_dir, rules, ignored):
+                continue
+
+            if is_dir:
+                subdirs.append((Path(entry.path), rel_path, rules))
+            elif wanted is None or os.path.splitext(entry.name)[1].lower() in wanted:
+                yield Path(entry.path)
+
+        stack.extend(reversed(subdirs))
+
+def find_files(root: Path, *extensions: str) -> List[Path]:
+    """
+    Return all discoverable files under `root` with the given extensions.
+
+    Args:
+        root (Path): Directory to search.
+        *extensions (str): Extensions to match (e.g. '.md', '.html'). Matches all files if omitted.
+
+    Returns:
+        List[Path]: Matching file paths in deterministic order.
+    """
+    return list(walk_files(root, extensions or None))
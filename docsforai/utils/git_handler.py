@@ -71,4 +71,54 @@ def update_repository(repo_dir: Path, additional_args: Optional[List[str]] = Non
         logger.info("Repository updated successfully")
     except subprocess.CalledProcessError as e:
         logger.error(f"Git pull failed")
-        raise
\ No newline at end of file
+        raise
+
+def get_commit_sha(repo_dir: Path) -> Optional[str]:
+    """
+    Return the commit SHA checked out in a Git repository.
+
+    Args:
+        repo_dir (Path): Path to the Git repository.
+
+    Returns:
+        Optional[str]: The full SHA of HEAD, or None if it cannot be determined.
+    """
+    return _git_output(['rev-parse', 'HEAD'], repo_dir)
+
+def get_repo_root(path: Path) -> Optional[Path]:
+    """
+    Return the top-level directory of the Git repository containing `path`.
+
+    Args:
+        path (Path): A directory inside the repository.
+
+    Returns:
+        Optional[Path]: The repository root, or None if `path` is not in a Git repository.
+    """
+    root = _git_output(['rev-parse', '--show-toplevel'], path)
+    return Path(root) if root else None
+
+def get_remote_url(repo_dir: Path, remote: str = 'origin') -> Optional[str]:
+    """
+    Return the URL of a remote of a Git repository.
+
+    Args:
+        repo_dir (Path): Path to the Git repository.
+        remote (str): Name of the remote.
+
+    Returns:
+        Optional[str]: The remote URL, or None if it is not configured.
+    """
+    return _git_output(['config', '--get', f'remote.{remote}.url'], repo_dir)
+
+def _git_output(args: List[str], cwd: Path) -> Optional[str]:
+    """Run a read-only git command and return its stripped output, or None on failure."""
+    try:
+        result = run_subprocess_with_logging(['git'] + args, cwd=cwd, check=False)
+        if result.returncode != 0:
+            logger.debug(f"git {' '.join(args)} failed in {cwd}: {result.stderr.strip()}")
+            return None
+        return result.stdout.strip() or None
+    except OSError as e:
+        logger.debug(f"git {' '.join(args)} failed in {cwd}: {str(e)}")
+        return None
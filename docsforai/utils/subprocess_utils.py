@@ -3,8 +3,11 @@ Subprocess utilities for DocsForAI.
 """
 
 import logging
+import multiprocessing
+import multiprocessing.context
+import os
 import subprocess
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -15,7 +18,8 @@ def run_subprocess_with_logging(
     additional_args: Optional[List[str]] = None,
     check: bool = True,
     capture_output: bool = True,
-    text: bool = True
+    text: bool = True,
+    env: Optional[Dict[str, str]] = None
 ) -> subprocess.CompletedProcess:
     """
     Run a subprocess command with detailed error logging.
@@ -27,6 +31,8 @@ def run_subprocess_with_logging(
         check (bool): If True, raise a CalledProcessError if the command returns a non-zero exit status
         capture_output (bool): If True, capture stdout and stderr in the result
         text (bool): If True, decode stdout and stderr using the default encoding
+        env (Optional[Dict[str, str]]): Environment variables to set for the command, in addition
+            to the current environment
 
     Returns:
         subprocess.CompletedProcess: Result of the subprocess command
@@ -52,7 +58,8 @@ def run_subprocess_with_logging(
             cwd=cwd,
             check=check,
             capture_output=capture_output,
-            text=text
+            text=text,
+            env={**os.environ, **env} if env else None
         )
         logger.debug(f"Command '{' '.join(full_cmd)}' completed successfully")
         return result
@@ -63,4 +70,19 @@ def run_subprocess_with_logging(
             logger.error(f"Command stdout:\n{e.stdout}")
         if e.stderr:
             logger.error(f"Command stderr:\n{e.stderr}")
-        raise 
\ No newline at end of file
+        raise 
+
+def process_pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Return the multiprocessing context for worker process pools.
+
+    Parsers run in threads (monorepo roots are parsed in a thread pool), and
+    forking a multithreaded process can deadlock on locks other threads hold,
+    such as those of logging or the sqlite caches. Workers are started from a
+    fork server instead, or spawned where there is none.
+
+    Returns:
+        multiprocessing.context.BaseContext: Context to pass as `mp_context`.
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)